@@ -0,0 +1,95 @@
+"""Compare "raiseOnError" validation with "lazy" and "trusted" hydration.
+
+Run with: uv run python benchmarks/hydration.py
+"""
+
+from __future__ import annotations
+
+import datetime
+import time
+from typing import Any
+
+from pydantic import Field
+
+from industrial_model import ValidationMode, ViewInstance
+from industrial_model.models import validate_instances
+
+PAGE_SIZE = 5_000
+REPEAT = 5
+
+
+class CogniteDescribable(ViewInstance):
+    name: str | None = None
+    description: str | None = None
+    tags: list[str] = Field(default_factory=list)
+    aliases: list[str] = Field(default_factory=list)
+
+
+class CogniteAssetType(CogniteDescribable):
+    code: str
+
+
+class CogniteEquipment(CogniteDescribable):
+    serial_number: str | None = None
+
+
+class CogniteAsset(CogniteDescribable):
+    source_created_time: datetime.datetime | None = None
+    source_updated_time: datetime.datetime | None = None
+    parent: CogniteAsset | None = None
+    root: CogniteAsset | None = None
+    path: list[CogniteAsset] = Field(default_factory=list)
+    type: CogniteAssetType | None = None
+    equipment: list[CogniteEquipment] = Field(default_factory=list)
+
+
+def _node(external_id: str, **properties: Any) -> dict[str, Any]:
+    return {
+        "space": "space",
+        "externalId": external_id,
+        "instanceType": "node",
+        "version": 1,
+        "createdTime": 0,
+        "lastUpdatedTime": 0,
+        "name": external_id,
+        "description": "description",
+        "tags": ["a", "b", "c"],
+        "aliases": ["alias"],
+        "_edges": {},
+        **properties,
+    }
+
+
+def _asset(index: int) -> dict[str, Any]:
+    timestamp = "2024-05-01T10:00:00.000+00:00"
+    return _node(
+        f"asset-{index}",
+        sourceCreatedTime=timestamp,
+        sourceUpdatedTime=timestamp,
+        parent=_node("parent", sourceCreatedTime=timestamp),
+        root=_node("root"),
+        path=[_node(f"path-{level}") for level in range(4)],
+        type=_node("type", code="PUMP"),
+        equipment=[_node(f"eq-{item}", serialNumber=str(item)) for item in range(3)],
+    )
+
+
+def _bench(mode: ValidationMode, data: list[dict[str, Any]]) -> float:
+    validate_instances(CogniteAsset, data[:1], mode)
+    timings: list[float] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        validate_instances(CogniteAsset, data, mode)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    data = [_asset(index) for index in range(PAGE_SIZE)]
+    for mode in ("raiseOnError", "lazy", "trusted"):
+        seconds = _bench(mode, data)
+        print(f"{mode:>12}: {PAGE_SIZE / seconds:>10,.0f} assets/s ({seconds:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Compare QueryMapper.map with and without the query-plan cache.
+
+Run with: uv run python benchmarks/query_plan.py
+"""
+
+import time
+from typing import cast
+
+from cognite.client import AsyncCogniteClient
+from cognite.client.data_classes.data_modeling import (
+    ContainerId,
+    MappedProperty,
+    View,
+    ViewId,
+)
+from cognite.client.data_classes.data_modeling.data_types import DirectRelation, Text
+
+from industrial_model import DataModelId, InstanceId, ViewInstance, col, select
+from industrial_model.cognite_adapters.query_mapper import QueryMapper
+from industrial_model.cognite_adapters.view_mapper import ViewMapper
+
+CALLS = 5_000
+REPEAT = 5
+
+
+class AssetType(ViewInstance):
+    code: str
+    name: str | None = None
+
+
+class Parent(ViewInstance):
+    name: str
+    description: str | None = None
+    asset_type: InstanceId | AssetType | None = None
+
+
+class Asset(ViewInstance):
+    name: str
+    description: str | None = None
+    tags: list[str] = []
+    parent: InstanceId | Parent | None = None
+    root: InstanceId | Parent | None = None
+    asset_type: InstanceId | AssetType | None = None
+
+
+def _property(identifier: str, source: ViewId | None = None) -> MappedProperty:
+    return MappedProperty(
+        container=ContainerId("space", "container"),
+        container_property_identifier=identifier,
+        type=DirectRelation() if source else Text(),
+        nullable=True,
+        immutable=False,
+        auto_increment=False,
+        source=source,
+    )
+
+
+def _view(external_id: str, properties: dict[str, MappedProperty]) -> View:
+    return View(
+        space="space",
+        external_id=external_id,
+        version="v1",
+        properties=dict(properties),
+        last_updated_time=0,
+        created_time=0,
+        description=None,
+        name=None,
+        filter=None,
+        implements=None,
+        writable=True,
+        used_for="node",
+        is_global=False,
+    )
+
+
+def _view_mapper() -> ViewMapper:
+    parent_id = ViewId("space", "Parent", "v1")
+    asset_type_id = ViewId("space", "AssetType", "v1")
+    view_mapper = ViewMapper(
+        cast(AsyncCogniteClient, None),
+        DataModelId(external_id="Model", space="space", version="v1"),
+    )
+    view_mapper._set_views(
+        [
+            _view(
+                "Asset",
+                {
+                    "name": _property("name"),
+                    "description": _property("description"),
+                    "tags": _property("tags"),
+                    "parent": _property("parent", parent_id),
+                    "root": _property("root", parent_id),
+                    "assetType": _property("assetType", asset_type_id),
+                },
+            ),
+            _view(
+                "Parent",
+                {
+                    "name": _property("name"),
+                    "description": _property("description"),
+                    "assetType": _property("assetType", asset_type_id),
+                },
+            ),
+            _view(
+                "AssetType",
+                {"code": _property("code"), "name": _property("name")},
+            ),
+        ]
+    )
+    return view_mapper
+
+
+def _bench(plan_cache_size: int) -> float:
+    mapper = QueryMapper(_view_mapper(), plan_cache_size)
+
+    timings: list[float] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for index in range(CALLS):
+            mapper.map(
+                select(Asset)
+                .where(col(Asset.name) == f"asset-{index}")
+                .limit(100)
+                .cursor(None)
+            )
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    for label, plan_cache_size in (("no cache", 0), ("cached", 256)):
+        seconds = _bench(plan_cache_size)
+        print(f"{label:>8}: {CALLS / seconds:>10,.0f} queries/s ({seconds:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare the per-call overhead of sync Engine dispatch strategies.
+
+`asyncio.run` creates a new event loop per call, so the SDK also builds a new
+HTTP client (and connection pool) per call. The engine loop thread keeps both.
+
+Run with: uv run python benchmarks/sync_engine.py
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from cognite.client._http_client import get_global_async_httpx_client
+
+from industrial_model.engines.event_loop import EventLoopThread
+
+CALLS = 200
+REPEAT = 5
+
+
+async def _noop() -> None:
+    return None
+
+
+async def _http_client() -> None:
+    # what every SDK request does first: fetch the HTTP client of the running loop
+    get_global_async_httpx_client()
+
+
+def _bench(
+    run: Callable[[Coroutine[Any, Any, None]], None],
+    factory: Callable[[], Coroutine[Any, Any, None]],
+) -> float:
+    timings: list[float] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            run(factory())
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    event_loop = EventLoopThread()
+    try:
+        for scenario, factory in (("noop", _noop), ("http client", _http_client)):
+            for label, run in (
+                ("asyncio.run", asyncio.run),
+                ("loop thread", event_loop.run),
+            ):
+                seconds = _bench(run, factory)
+                print(
+                    f"{scenario:>11} / {label:<11}: "
+                    f"{seconds / CALLS * 1e6:>8,.1f} us/call ({seconds:.3f}s)"
+                )
+    finally:
+        event_loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,21 @@
+from .cognite_adapters import BulkWriter, BulkWriteReport, ViewCache
 from .config import DataModelId
-from .constants import RelationMode
-from .engines import AsyncEngine, Engine
+from .constants import RelationMode, ResultMappingMode
+from .engines import (
+    AsyncEngine,
+    Engine,
+    JsonSyncStateStore,
+    ResultCache,
+    SqliteSyncStateStore,
+    SyncStateStore,
+)
 from .models import (
     AggregatedViewInstance,
     InstanceId,
     PaginatedResult,
     RootModel,
+    SyncResult,
+    SyncState,
     TAggregatedViewInstance,
     TViewInstance,
     TWritableViewInstance,
@@ -23,6 +33,7 @@ from .statements import (
     or_,
     search,
     select,
+    select_ids,
 )
 
 __all__ = [
@@ -33,6 +44,7 @@ __all__ = [
     "col",
     "not_",
     "select",
+    "select_ids",
     "search",
     "ViewInstance",
     "InstanceId",
@@ -43,10 +55,20 @@ __all__ = [
     "ValidationMode",
     "Engine",
     "AsyncEngine",
+    "BulkWriter",
+    "BulkWriteReport",
     "PaginatedResult",
     "RootModel",
     "RelationMode",
+    "ResultCache",
+    "JsonSyncStateStore",
+    "SqliteSyncStateStore",
+    "SyncResult",
+    "SyncState",
+    "SyncStateStore",
+    "ResultMappingMode",
     "SearchOperationTypes",
+    "ViewCache",
     "ViewInstanceConfig",
     "WritableViewInstance",
 ]
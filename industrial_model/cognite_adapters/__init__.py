@@ -1,8 +1,22 @@
-import logging
-from typing import Any
+import asyncio
+import json
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Sequence,
+)
+from contextlib import aclosing, suppress
+from typing import Any, TypeVar
 
 from cognite.client import AsyncCogniteClient
-from cognite.client.data_classes.data_modeling import Edge, Node
+from cognite.client.data_classes.data_modeling import (
+    Edge,
+    EdgeApply,
+    Node,
+    NodeApply,
+)
 from cognite.client.data_classes.data_modeling.query import (
     Query as CogniteQuery,
 )
@@ -11,7 +25,10 @@ from cognite.client.data_classes.data_modeling.query import (
 )
 
 from industrial_model.config import DataModelId
+from industrial_model.constants import DEPENDENCIES_CONCURRENCY, ResultMappingMode
 from industrial_model.models import (
+    EdgeContainer,
+    InstanceId,
     TAggregatedViewInstance,
     TViewInstance,
     TWritableViewInstance,
@@ -23,36 +40,95 @@ from industrial_model.statements import (
 )
 
 from .aggregation_mapper import AggregationMapper
+from .bulk_writer import BulkWriter, BulkWriteReport, ChunkReport
 from .optimizer import QueryOptimizer
 from .query_mapper import QueryMapper
 from .query_result_mapper import (
     QueryResultMapper,
 )
 from .search_mapper import SearchMapper
+from .single_flight import SingleFlight
 from .upsert_mapper import UpsertMapper
 from .utils import (
     append_nodes_and_edges,
-    get_query_for_dependencies_pagination,
+    get_queries_for_dependencies_pagination,
     map_nodes_and_edges,
+    with_root_cursor,
 )
+from .view_cache import ViewCache
 from .view_mapper import ViewMapper
 
+__all__ = [
+    "BulkWriteReport",
+    "BulkWriter",
+    "ChunkReport",
+    "CogniteAdapter",
+    "ViewCache",
+]
+
+_T = TypeVar("_T")
+
 
 class CogniteAdapter:
-    def __init__(self, cognite_client: AsyncCogniteClient, data_model_id: DataModelId):
+    def __init__(
+        self,
+        cognite_client: AsyncCogniteClient,
+        data_model_id: DataModelId,
+        result_mapping: ResultMappingMode = "sdk",
+        view_cache: ViewCache | None = None,
+        coalesce_requests: bool = False,
+        bulk_writer: BulkWriter | None = None,
+    ):
         self._cognite_client = cognite_client
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._bulk_writer = bulk_writer or BulkWriter()
 
-        view_mapper = ViewMapper(cognite_client, data_model_id)
+        view_mapper = ViewMapper(cognite_client, data_model_id, view_cache)
         self._view_mapper = view_mapper
         self._optmizer = QueryOptimizer(cognite_client)
         self._query_mapper = QueryMapper(view_mapper)
-        self._result_mapper = QueryResultMapper(view_mapper)
+        self._result_mapper = QueryResultMapper(view_mapper, result_mapping)
         self._upsert_mapper = UpsertMapper(view_mapper)
         self._aggregation_mapper = AggregationMapper(view_mapper)
         self._search_mapper = SearchMapper(view_mapper)
 
     async def search(
         self, statement: SearchStatement[TViewInstance]
+    ) -> list[dict[str, Any]]:
+        return await self._coalesce(
+            ("search", statement.entity, repr(statement.get_values())),
+            lambda: self._search(statement),
+        )
+
+    async def query(
+        self,
+        statement: Statement[TViewInstance],
+        all_pages: bool,
+        prefetch_depth: int = 0,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        return await self._coalesce(
+            ("query", statement.entity, repr(statement.get_values()), all_pages),
+            lambda: self._query(statement, all_pages, prefetch_depth),
+        )
+
+    async def query_ids(
+        self, statement: Statement[TViewInstance], all_pages: bool
+    ) -> tuple[list[InstanceId], str | None]:
+        return await self._coalesce(
+            ("query_ids", statement.entity, repr(statement.get_values()), all_pages),
+            lambda: self._query_ids(statement, all_pages),
+        )
+
+    async def aggregate(
+        self, statement: AggregationStatement[TAggregatedViewInstance]
+    ) -> list[dict[str, Any]]:
+        return await self._coalesce(
+            ("aggregate", statement.entity, repr(statement.get_values())),
+            lambda: self._aggregate(statement),
+        )
+
+    async def _search(
+        self, statement: SearchStatement[TViewInstance]
     ) -> list[dict[str, Any]]:
         await self._view_mapper.load_views()
         search_query = self._search_mapper.map(statement)
@@ -68,46 +144,178 @@ class CogniteAdapter:
 
         return self._result_mapper.nodes_to_dict(data)
 
-    async def query(
-        self, statement: Statement[TViewInstance], all_pages: bool
+    async def _query(
+        self,
+        statement: Statement[TViewInstance],
+        all_pages: bool,
+        prefetch_depth: int = 0,
     ) -> tuple[list[dict[str, Any]], str | None]:
+        data: list[dict[str, Any]] = []
+        next_cursor: str | None = None
+        pages = self.query_pages(statement, prefetch_depth if all_pages else 0)
+        async with aclosing(pages) as pages_:
+            async for page_result, page_cursor in pages_:
+                data.extend(page_result)
+                next_cursor = page_cursor
+                if not all_pages:
+                    break
+        return data, next_cursor
+
+    async def _query_ids(
+        self, statement: Statement[TViewInstance], all_pages: bool
+    ) -> tuple[list[InstanceId], str | None]:
+        data: list[InstanceId] = []
+        next_cursor: str | None = None
+        pages = self.query_id_pages(statement)
+        async with aclosing(pages) as pages_:
+            async for page_result, page_cursor in pages_:
+                data.extend(page_result)
+                next_cursor = page_cursor
+                if not all_pages:
+                    break
+        return data, next_cursor
+
+    async def prepare(self, statements: Sequence[Statement[Any]]) -> None:
+        await self._view_mapper.load_views()
+        await self._optmizer.preload(statements)
+
+    async def query_partitions(
+        self, statement: Statement[TViewInstance], max_concurrency: int
+    ) -> list[dict[str, Any]]:
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency should be greater than 0")
+
         await self._view_mapper.load_views()
-        await self._optmizer.optimize(statement)
+        statement = await self._optmizer.optimize(statement)
+        partitions = self._optmizer.split_by_space(statement)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def query_partition(
+            partition: Statement[TViewInstance],
+        ) -> list[dict[str, Any]]:
+            async with semaphore:
+                data, _ = await self.query(partition, True)
+                return data
+
+        results = await asyncio.gather(
+            *(query_partition(partition) for partition in partitions)
+        )
+        return [item for result in results for item in result]
+
+    async def query_pages(
+        self, statement: Statement[TViewInstance], prefetch_depth: int = 0
+    ) -> AsyncGenerator[tuple[list[dict[str, Any]], str | None]]:
+        if prefetch_depth < 0:
+            raise ValueError("Prefetch depth should be greater than or equal to 0")
+
+        await self._view_mapper.load_views()
+        statement = await self._optmizer.optimize(statement)
         cognite_query = self._query_mapper.map(statement)
         view_external_id = statement.entity.get_view_external_id()
+        limit = statement.get_values().limit
 
-        data: list[dict[str, Any]] = []
-        while True:
-            query_result = await self._cognite_client.data_modeling.instances.query(
-                cognite_query
+        query_results = (
+            self._prefetch_query_results(
+                cognite_query, view_external_id, limit, prefetch_depth
             )
+            if prefetch_depth
+            else self._query_results(cognite_query, view_external_id)
+        )
 
-            dependencies_data = await self._query_dependencies_pages(
-                cognite_query, query_result, view_external_id
-            )
+        dependencies_semaphore = asyncio.Semaphore(DEPENDENCIES_CONCURRENCY)
+        async with aclosing(query_results) as query_results_:
+            async for page_query, query_result in query_results_:
+                dependencies_data = await self._query_dependencies_pages(
+                    page_query,
+                    query_result,
+                    {view_external_id},
+                    dependencies_semaphore,
+                )
 
-            query_result_data = append_nodes_and_edges(
-                map_nodes_and_edges(query_result, cognite_query),
-                dependencies_data,
-            )
+                query_result_data = append_nodes_and_edges(
+                    map_nodes_and_edges(query_result, page_query),
+                    dependencies_data,
+                )
+
+                page_result = self._result_mapper.map_nodes(
+                    view_external_id,
+                    query_result_data,
+                )
+                next_cursor = query_result.cursors.get(view_external_id)
 
+                last_page = len(page_result) < limit or not next_cursor
+                yield page_result, None if last_page else next_cursor
+                if last_page:
+                    return
+
+    async def query_id_pages(
+        self, statement: Statement[TViewInstance]
+    ) -> AsyncGenerator[tuple[list[InstanceId], str | None]]:
+        await self._view_mapper.load_views()
+        statement = await self._optmizer.optimize(statement)
+        cognite_query = self._query_mapper.map_ids(statement)
+        view_external_id = statement.entity.get_view_external_id()
+        limit = statement.get_values().limit
+
+        query_results = self._query_results(cognite_query, view_external_id)
+        async with aclosing(query_results) as query_results_:
+            async for _, query_result in query_results_:
+                nodes = query_result[view_external_id]
+                page_result = [
+                    InstanceId.model_construct(
+                        external_id=node.external_id, space=node.space
+                    )
+                    for node in nodes
+                ]
+                next_cursor = query_result.cursors.get(view_external_id)
+
+                last_page = len(page_result) < limit or not next_cursor
+                yield page_result, None if last_page else next_cursor
+                if last_page:
+                    return
+
+    async def query_combined(
+        self, statements: Sequence[Statement[Any]]
+    ) -> list[tuple[list[dict[str, Any]], bool]]:
+        if not statements:
+            return []
+
+        await self.prepare(statements)
+        statements = [
+            await self._optmizer.optimize(statement) for statement in statements
+        ]
+        cognite_query, root_keys = self._query_mapper.map_combined(statements)
+
+        query_result = await self._cognite_client.data_modeling.instances.query(
+            cognite_query
+        )
+        dependencies_data = await self._query_dependencies_pages(
+            cognite_query,
+            query_result,
+            set(root_keys),
+            asyncio.Semaphore(DEPENDENCIES_CONCURRENCY),
+        )
+        query_result_data = append_nodes_and_edges(
+            map_nodes_and_edges(query_result, cognite_query),
+            dependencies_data,
+        )
+
+        # root cursors belong to the combined result sets, so only whether more
+        # pages exist is returned
+        results: list[tuple[list[dict[str, Any]], bool]] = []
+        for statement, root_key in zip(statements, root_keys, strict=True):
             page_result = self._result_mapper.map_nodes(
-                view_external_id,
-                query_result_data,
+                statement.entity.get_view_external_id(), query_result_data, root_key
             )
-            next_cursor = query_result.cursors.get(view_external_id)
-            data.extend(page_result)
-
-            last_page = (
-                len(page_result) < statement.get_values().limit or not next_cursor
+            has_next_page = (
+                bool(query_result.cursors.get(root_key))
+                and len(page_result) >= statement.get_values().limit
             )
-            next_cursor_ = None if last_page else next_cursor
-            cognite_query.cursors = {view_external_id: next_cursor_}
-
-            if not all_pages or last_page:
-                return data, next_cursor_
+            results.append((page_result, has_next_page))
+        return results
 
-    async def aggregate(
+    async def _aggregate(
         self, statement: AggregationStatement[TAggregatedViewInstance]
     ) -> list[dict[str, Any]]:
         await self._view_mapper.load_views()
@@ -135,61 +343,160 @@ class CogniteAdapter:
         entries: list[TWritableViewInstance],
         replace: bool = False,
         remove_unset: bool = False,
-    ) -> None:
+        only_changed: bool = False,
+    ) -> BulkWriteReport:
         await self._view_mapper.load_views()
-        logger = logging.getLogger(__name__)
-        operation = self._upsert_mapper.map(entries, remove_unset)
+        operation = self._upsert_mapper.map(entries, remove_unset, only_changed)
+        instances = self._cognite_client.data_modeling.instances
 
-        for node_chunk in operation.chunk_nodes():
-            logger.debug(
-                f"Upserting {len(node_chunk)} nodes (replace={replace}, "
-                "remove_unset={remove_unset})"
-            )
-            await self._cognite_client.data_modeling.instances.apply(
-                nodes=node_chunk,
-                replace=replace,
-            )
+        async def apply_nodes(chunk: list[NodeApply]) -> None:
+            await instances.apply(nodes=chunk, replace=replace)
 
-        for edge_chunk in operation.chunk_edges():
-            logger.debug(
-                f"Upserting {len(edge_chunk)} edges (replace={replace},"
-                "remove_unset={remove_unset})"
-            )
-            await self._cognite_client.data_modeling.instances.apply(
-                edges=edge_chunk,
-                replace=replace,
-            )
+        async def apply_edges(chunk: list[EdgeApply]) -> None:
+            await instances.apply(edges=chunk, replace=replace)
+
+        async def delete_edges(chunk: list[EdgeContainer]) -> None:
+            await instances.delete(edges=[item.as_tuple() for item in chunk])
 
-        for edges_to_remove_chunk in operation.chunk_edges_to_delete():
-            logger.debug(f"Deleting {len(edges_to_remove_chunk)} edges")
-            await self._cognite_client.data_modeling.instances.delete(
-                edges=[item.as_tuple() for item in edges_to_remove_chunk],
+        # phases stay sequential: edges reference the nodes written before them
+        report = await self._bulk_writer.write(
+            "nodes", operation.nodes, apply_nodes, _get_payload_bytes
+        )
+        report.merge(
+            await self._bulk_writer.write(
+                "edges", operation.edges, apply_edges, _get_payload_bytes
             )
+        )
+        report.merge(
+            await self._bulk_writer.write(
+                "edges_to_delete", operation.edges_to_delete, delete_edges
+            )
+        )
+        return report
 
     async def delete(self, nodes: list[TViewInstance]) -> None:
         await self._cognite_client.data_modeling.instances.delete(
             nodes=[item.as_tuple() for item in nodes],
         )
 
+    async def delete_where(
+        self, statement: Statement[TViewInstance]
+    ) -> BulkWriteReport:
+        instances = self._cognite_client.data_modeling.instances
+
+        async def delete_nodes(chunk: list[InstanceId]) -> None:
+            await instances.delete(nodes=[item.as_tuple() for item in chunk])
+
+        async def id_pages() -> AsyncGenerator[list[InstanceId]]:
+            pages = self.query_id_pages(statement)
+            async with aclosing(pages) as pages_:
+                async for page_result, _ in pages_:
+                    yield page_result
+
+        # ids are deleted while the following pages are still being read
+        return await self._bulk_writer.write_stream(
+            "nodes_to_delete", id_pages(), delete_nodes
+        )
+
+    async def _coalesce(self, key: Hashable, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        if self._single_flight is None:
+            return await fetch()
+        return await self._single_flight.run(key, fetch)
+
+    async def _query_results(
+        self, cognite_query: CogniteQuery, view_external_id: str
+    ) -> AsyncGenerator[tuple[CogniteQuery, CogniteQueryResult]]:
+        while True:
+            query_result = await self._cognite_client.data_modeling.instances.query(
+                cognite_query
+            )
+            yield cognite_query, query_result
+            cognite_query = with_root_cursor(
+                cognite_query,
+                view_external_id,
+                query_result.cursors.get(view_external_id),
+            )
+
+    async def _prefetch_query_results(
+        self,
+        cognite_query: CogniteQuery,
+        view_external_id: str,
+        limit: int,
+        prefetch_depth: int,
+    ) -> AsyncGenerator[tuple[CogniteQuery, CogniteQueryResult]]:
+        results: asyncio.Queue[
+            tuple[CogniteQuery, CogniteQueryResult] | Exception | None
+        ] = asyncio.Queue()
+        slots = asyncio.Semaphore(prefetch_depth)
+
+        async def produce() -> None:
+            query = cognite_query
+            try:
+                while True:
+                    await slots.acquire()
+                    query_result = (
+                        await self._cognite_client.data_modeling.instances.query(query)
+                    )
+                    results.put_nowait((query, query_result))
+
+                    next_cursor = query_result.cursors.get(view_external_id)
+                    if not next_cursor or len(query_result[view_external_id]) < limit:
+                        break
+                    query = with_root_cursor(query, view_external_id, next_cursor)
+            except Exception as exc:
+                results.put_nowait(exc)
+                return
+            results.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (entry := await results.get()) is not None:
+                if isinstance(entry, Exception):
+                    raise entry
+                slots.release()
+                yield entry
+        finally:
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
+
     async def _query_dependencies_pages(
         self,
         cognite_query: CogniteQuery,
         query_result: CogniteQueryResult,
-        view_external_id: str,
+        root_keys: set[str],
+        semaphore: asyncio.Semaphore,
     ) -> dict[str, list[Node | Edge]] | None:
-        new_query = get_query_for_dependencies_pagination(
-            cognite_query, query_result, view_external_id
+        new_queries = get_queries_for_dependencies_pagination(
+            cognite_query, query_result, root_keys
         )
-        if not new_query:
+        if not new_queries:
             return None
 
-        new_query_result = await self._cognite_client.data_modeling.instances.query(
-            new_query
-        )
+        async def query_dependency_pages(
+            new_query: CogniteQuery,
+        ) -> dict[str, list[Node | Edge]]:
+            async with semaphore:
+                new_query_result = (
+                    await self._cognite_client.data_modeling.instances.query(new_query)
+                )
 
-        result = map_nodes_and_edges(new_query_result, new_query)
+            result = map_nodes_and_edges(new_query_result, new_query)
 
-        nested_results = await self._query_dependencies_pages(
-            new_query, new_query_result, view_external_id
+            nested_results = await self._query_dependencies_pages(
+                new_query, new_query_result, root_keys, semaphore
+            )
+            return append_nodes_and_edges(result, nested_results)
+
+        results = await asyncio.gather(
+            *(query_dependency_pages(new_query) for new_query in new_queries)
         )
-        return append_nodes_and_edges(result, nested_results)
+
+        data: dict[str, list[Node | Edge]] = {}
+        for result in results:
+            append_nodes_and_edges(data, result)
+        return data
+
+
+def _get_payload_bytes(item: NodeApply | EdgeApply) -> int:
+    return len(json.dumps(item.dump(), default=str))
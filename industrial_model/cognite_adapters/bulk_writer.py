@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable, Sequence
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Literal, TypeVar
+
+from cognite.client.exceptions import CogniteAPIError
+
+from industrial_model.constants import (
+    DEFAULT_WRITE_CONCURRENCY,
+    WRITE_CHUNK_MAX_BYTES,
+    WRITE_CHUNK_SIZE,
+    WRITE_MAX_RETRIES,
+    WRITE_TARGET_LATENCY,
+)
+
+_T = TypeVar("_T")
+
+BulkWritePhase = Literal["nodes", "edges", "edges_to_delete", "nodes_to_delete"]
+
+
+@dataclass(frozen=True)
+class ChunkReport:
+    phase: BulkWritePhase
+    items: int
+    payload_bytes: int
+    seconds: float
+    attempts: int
+
+
+@dataclass
+class BulkWriteReport:
+    chunks: list[ChunkReport] = field(default_factory=list)
+    seconds: float = 0
+
+    @property
+    def items(self) -> int:
+        return sum(chunk.items for chunk in self.chunks)
+
+    def merge(self, other: "BulkWriteReport") -> None:
+        self.chunks.extend(other.chunks)
+        self.seconds += other.seconds
+
+
+class _ChunkSizer:
+    def __init__(self, maximum: int, target_latency: float):
+        self.size = maximum
+        self._maximum = maximum
+        self._target_latency = target_latency
+
+    def completed(self, seconds: float) -> None:
+        if seconds > self._target_latency:
+            self.size = max(1, self.size * 3 // 4)
+        else:
+            self.size = min(self._maximum, self.size + max(1, self.size // 10))
+
+    def throttled(self) -> None:
+        self.size = max(1, self.size // 2)
+
+
+class BulkWriter:
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_WRITE_CONCURRENCY,
+        max_chunk_size: int = WRITE_CHUNK_SIZE,
+        max_chunk_bytes: int = WRITE_CHUNK_MAX_BYTES,
+        target_latency: float = WRITE_TARGET_LATENCY,
+        max_retries: int = WRITE_MAX_RETRIES,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency should be greater than 0")
+        if max_chunk_size < 1 or max_chunk_bytes < 1:
+            raise ValueError("Chunk limits should be greater than 0")
+
+        self._max_concurrency = max_concurrency
+        self._max_chunk_bytes = max_chunk_bytes
+        self._max_retries = max_retries
+        # learned sizes are kept across writes, so later backfill batches start
+        # from what the API accepted last
+        self._sizer = _ChunkSizer(max_chunk_size, target_latency)
+
+    @property
+    def chunk_size(self) -> int:
+        return self._sizer.size
+
+    async def write(
+        self,
+        phase: BulkWritePhase,
+        items: Sequence[_T],
+        send: Callable[[list[_T]], Awaitable[None]],
+        size_of: Callable[[_T], int] | None = None,
+    ) -> BulkWriteReport:
+        return await self.write_stream(phase, _single_batch(items), send, size_of)
+
+    async def write_stream(
+        self,
+        phase: BulkWritePhase,
+        batches: AsyncIterable[Sequence[_T]],
+        send: Callable[[list[_T]], Awaitable[None]],
+        size_of: Callable[[_T], int] | None = None,
+    ) -> BulkWriteReport:
+        report = BulkWriteReport()
+        start = time.perf_counter()
+        pending: deque[_T] = deque()
+        workers: set[asyncio.Task[None]] = set()
+
+        async def worker() -> None:
+            while pending:
+                await self._write_chunk(phase, pending, send, size_of, report)
+
+        def start_workers() -> None:
+            while pending and len(workers) < self._max_concurrency:
+                workers.add(asyncio.create_task(worker()))
+
+        async def wait_for_worker() -> None:
+            done, _ = await asyncio.wait(workers, return_when=asyncio.FIRST_COMPLETED)
+            workers.difference_update(done)
+            for task in done:
+                task.result()
+            start_workers()
+
+        try:
+            async for batch in batches:
+                pending.extend(batch)
+                start_workers()
+                # batches are only pulled while less than one round of chunks
+                # is queued, so streamed sources are consumed at write speed
+                while len(pending) > self._max_concurrency * self._sizer.size:
+                    await wait_for_worker()
+            while workers:
+                await wait_for_worker()
+        finally:
+            for task in workers:
+                task.cancel()
+            for task in workers:
+                with suppress(asyncio.CancelledError, Exception):
+                    await task
+
+        if report.chunks:
+            report.seconds = time.perf_counter() - start
+        return report
+
+    async def _write_chunk(
+        self,
+        phase: BulkWritePhase,
+        pending: deque[_T],
+        send: Callable[[list[_T]], Awaitable[None]],
+        size_of: Callable[[_T], int] | None,
+        report: BulkWriteReport,
+    ) -> None:
+        chunk, payload_bytes = self._take_chunk(pending, size_of)
+        attempts = 0
+        while True:
+            attempts += 1
+            logging.getLogger(__name__).debug(
+                f"Writing {len(chunk)} {phase} ({payload_bytes} bytes, "
+                f"attempt {attempts})"
+            )
+            start = time.perf_counter()
+            try:
+                await send(chunk)
+            except CogniteAPIError as error:
+                if error.code != 429 or attempts > self._max_retries:
+                    raise
+                self._sizer.throttled()
+                if len(chunk) > self._sizer.size:
+                    pending.extendleft(reversed(chunk[self._sizer.size :]))
+                    chunk = chunk[: self._sizer.size]
+                    payload_bytes = self._payload_bytes(chunk, size_of)
+                await asyncio.sleep(min(2**attempts * 0.1, 10.0))
+                continue
+
+            seconds = time.perf_counter() - start
+            self._sizer.completed(seconds)
+            report.chunks.append(
+                ChunkReport(
+                    phase=phase,
+                    items=len(chunk),
+                    payload_bytes=payload_bytes,
+                    seconds=seconds,
+                    attempts=attempts,
+                )
+            )
+            return
+
+    def _take_chunk(
+        self, pending: deque[_T], size_of: Callable[[_T], int] | None
+    ) -> tuple[list[_T], int]:
+        chunk: list[_T] = []
+        payload_bytes = 0
+        while pending and len(chunk) < self._sizer.size:
+            item_bytes = size_of(pending[0]) if size_of else 0
+            if chunk and payload_bytes + item_bytes > self._max_chunk_bytes:
+                break
+            chunk.append(pending.popleft())
+            payload_bytes += item_bytes
+        return chunk, payload_bytes
+
+    def _payload_bytes(
+        self, chunk: list[_T], size_of: Callable[[_T], int] | None
+    ) -> int:
+        return sum(size_of(item) for item in chunk) if size_of else 0
+
+
+async def _single_batch(items: Sequence[_T]) -> AsyncGenerator[Sequence[_T]]:
+    yield items
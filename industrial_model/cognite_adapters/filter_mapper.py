@@ -44,8 +44,10 @@ class FilterMapper:
         edges_expressions: list[tuple[Column, list[Expression]]],
         root_view: View,
         nested_separator: str,
+        root_key: str | None = None,
     ) -> dict[str, list[cdf_filters.Filter]]:
         result_dict: dict[str, list[cdf_filters.Filter]] = {}
+        root_key = root_key or root_view.external_id
 
         for column, expressions in edges_expressions:
             view_property = root_view.properties.get(column.property)
@@ -56,7 +58,7 @@ class FilterMapper:
                 expressions,
                 self._view_mapper.get_view(view_property.source.external_id),
             )
-            result_key = root_view.external_id + nested_separator + column.property
+            result_key = root_key + nested_separator + column.property
             result_dict.setdefault(result_key, []).extend(filters)
 
         return result_dict
@@ -1,14 +1,85 @@
 from dataclasses import dataclass
-from typing import Any
+from enum import StrEnum
 
 from cognite.client.data_classes.data_modeling import (
+    DirectRelationReference,
     EdgeApply,
+    EdgeConnection,
+    MappedProperty,
     NodeApply,
+    ViewId,
+)
+from cognite.client.data_classes.data_modeling.data_types import (
+    ListablePropertyType,
+)
+from cognite.client.data_classes.data_modeling.views import (
+    MultiReverseDirectRelation,
+    SingleReverseDirectRelation,
+    ViewProperty,
 )
 
+from industrial_model.constants import EDGE_DIRECTION
 from industrial_model.models.entities import EdgeContainer
 
-_PAGE_SIZE = 1000
+
+class ViewPropertyKind(StrEnum):
+    PROPERTY = "Property"
+    DIRECT_RELATION = "DirectRelation"
+    REVERSE_DIRECT_RELATION = "ReverseDirectRelation"
+    EDGE = "Edge"
+
+
+@dataclass(frozen=True, slots=True)
+class ViewPropertyInfo:
+    name: str
+    kind: ViewPropertyKind
+    source: ViewId | None = None
+    is_list: bool = False
+    through_property: str | None = None
+    edge_type: DirectRelationReference | None = None
+    edge_direction: EDGE_DIRECTION | None = None
+
+    @property
+    def is_mapped(self) -> bool:
+        return self.kind in (
+            ViewPropertyKind.PROPERTY,
+            ViewPropertyKind.DIRECT_RELATION,
+        )
+
+    @classmethod
+    def from_view_property(
+        cls, name: str, property: ViewProperty
+    ) -> "ViewPropertyInfo | None":
+        if isinstance(property, MappedProperty):
+            return cls(
+                name=name,
+                kind=ViewPropertyKind.DIRECT_RELATION
+                if property.source
+                else ViewPropertyKind.PROPERTY,
+                source=property.source,
+                is_list=isinstance(property.type, ListablePropertyType)
+                and property.type.is_list,
+            )
+        if isinstance(
+            property, SingleReverseDirectRelation | MultiReverseDirectRelation
+        ):
+            return cls(
+                name=name,
+                kind=ViewPropertyKind.REVERSE_DIRECT_RELATION,
+                source=property.source,
+                is_list=isinstance(property, MultiReverseDirectRelation),
+                through_property=property.through.property,
+            )
+        if isinstance(property, EdgeConnection):
+            return cls(
+                name=name,
+                kind=ViewPropertyKind.EDGE,
+                source=property.source,
+                is_list=True,
+                edge_type=property.type,
+                edge_direction=property.direction,
+            )
+        return None
 
 
 @dataclass
@@ -16,20 +87,3 @@ class UpsertOperation:
     nodes: list[NodeApply]
     edges: list[EdgeApply]
     edges_to_delete: list[EdgeContainer]
-
-    def chunk_nodes(self) -> list[list[NodeApply]]:
-        return self._chunk_list(self.nodes)
-
-    def chunk_edges(self) -> list[list[EdgeApply]]:
-        return self._chunk_list(self.edges)
-
-    def chunk_edges_to_delete(self) -> list[list[EdgeContainer]]:
-        return self._chunk_list(self.edges_to_delete)
-
-    def _chunk_list(self, entries: list[Any]) -> list[list[Any]]:
-        data: list[list[Any]] = []
-        for i in range(0, len(entries), _PAGE_SIZE):
-            start = i
-            end = i + _PAGE_SIZE
-            data.append(entries[start:end])
-        return data
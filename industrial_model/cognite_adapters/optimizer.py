@@ -1,4 +1,6 @@
 import asyncio
+from collections.abc import Iterable
+from typing import Any
 
 from cognite.client import AsyncCogniteClient
 
@@ -20,17 +22,20 @@ class QueryOptimizer:
         self._cognite_client = cognite_client
         self._lock = asyncio.Lock()
 
-    async def optimize(self, statement: Statement[TViewInstance]) -> None:
+    async def optimize(
+        self, statement: Statement[TViewInstance]
+    ) -> Statement[TViewInstance]:
+        # the caller's statement is left untouched so it keeps the same cache key
         instance_spaces = statement.entity.view_config.get("instance_spaces")
         instance_spaces_prefix = statement.entity.view_config.get(
             "instance_spaces_prefix"
         )
 
         if not instance_spaces and not instance_spaces_prefix:
-            return
+            return statement
 
         if self._has_space_filter(statement.get_values().where_clauses):
-            return
+            return statement
 
         filter_spaces = (
             await self._find_spaces(instance_spaces_prefix)
@@ -40,8 +45,40 @@ class QueryOptimizer:
         if instance_spaces:
             filter_spaces.extend(instance_spaces)
 
-        if filter_spaces:
-            statement.where(col(SPACE_PROPERTY).in_(filter_spaces))
+        if not filter_spaces:
+            return statement
+        return statement.clone().where(col(SPACE_PROPERTY).in_(filter_spaces))
+
+    async def preload(self, statements: Iterable[Statement[Any]]) -> None:
+        if any(
+            statement.entity.view_config.get("instance_spaces_prefix")
+            for statement in statements
+        ):
+            await self._load_spaces()
+
+    def split_by_space(
+        self, statement: Statement[TViewInstance]
+    ) -> list[Statement[TViewInstance]]:
+        where_clauses = statement.get_values().where_clauses
+        for index, where_clause in enumerate(where_clauses):
+            if (
+                not isinstance(where_clause, LeafExpression)
+                or where_clause.property != SPACE_PROPERTY
+                or where_clause.operator != "in"
+                or not isinstance(where_clause.value, list)
+            ):
+                continue
+
+            partitions: list[Statement[TViewInstance]] = []
+            for space in dict.fromkeys(where_clause.value):
+                partition = statement.clone()
+                partition.get_values().where_clauses[index] = LeafExpression(
+                    property=SPACE_PROPERTY, operator="==", value=space
+                )
+                partitions.append(partition)
+            return partitions
+
+        return [statement]
 
     def _has_space_filter(self, where_clauses: list[Expression]) -> bool:
         for where_clause in where_clauses:
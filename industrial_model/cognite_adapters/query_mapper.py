@@ -1,7 +1,10 @@
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
 import cognite.client.data_classes.filters as filters
 from cognite.client.data_classes.data_modeling import (
-    EdgeConnection,
-    MappedProperty,
     View,
     ViewId,
 )
@@ -15,48 +18,163 @@ from cognite.client.data_classes.data_modeling.query import (
 from cognite.client.data_classes.data_modeling.query import (
     Query as CogniteQuery,
 )
-from cognite.client.data_classes.data_modeling.views import (
-    MultiReverseDirectRelation,
-    SingleReverseDirectRelation,
-)
 
-from industrial_model.constants import EDGE_MARKER, MAX_LIMIT, NESTED_SEP
-from industrial_model.models import TViewInstance, get_schema_properties
+from industrial_model.constants import (
+    EDGE_MARKER,
+    MAX_LIMIT,
+    NESTED_SEP,
+    QUERY_PLAN_CACHE_SIZE,
+    RelationMode,
+)
+from industrial_model.models import TViewInstance, ViewInstance, get_schema_properties
 from industrial_model.statements import Statement
 
 from .filter_mapper import (
     FilterMapper,
 )
+from .models import ViewPropertyKind
 from .sort_mapper import SortMapper
 from .view_mapper import ViewMapper
 
+PlanKey = tuple[
+    type[ViewInstance],
+    str,
+    tuple[tuple[str, RelationMode], ...],
+    str,
+    tuple[str, ...] | None,
+]
+
+
+@dataclass(frozen=True)
+class _QueryPlan:
+    root_view: View
+    with_: dict[str, ResultSetExpression]
+    select: dict[str, Select]
+
+
+def get_combined_root_key(index: int, view_external_id: str) -> str:
+    return f"s{index}_{view_external_id}"
+
 
 class QueryMapper:
-    def __init__(self, view_mapper: ViewMapper):
+    def __init__(
+        self, view_mapper: ViewMapper, plan_cache_size: int = QUERY_PLAN_CACHE_SIZE
+    ):
         self._view_mapper = view_mapper
         self._filter_mapper = FilterMapper(view_mapper)
-        self._sort_mapper = SortMapper()
+        self._sort_mapper = SortMapper(view_mapper)
+        self._plan_cache_size = plan_cache_size
+        self._plans: OrderedDict[PlanKey, _QueryPlan] = OrderedDict()
+
+    def map(
+        self, statement: Statement[TViewInstance], root_key: str | None = None
+    ) -> CogniteQuery:
+        if statement.get_values().ids_only:
+            raise ValueError(
+                "Id-only statements should be run with query_ids or query_all_ids"
+            )
+
+        view_external_id = statement.entity.get_view_external_id()
+        root_node = root_key or view_external_id
+
+        root_view = self._view_mapper.get_view(view_external_id)
+        plan = self._get_plan(statement, root_node, root_view)
+
+        with_: dict[str, ResultSetExpression] = {
+            root_node: self._get_root_expression(statement, root_view),
+            **plan.with_,
+        }
+
+        return CogniteQuery(
+            with_=with_,
+            select=dict(plan.select),
+            cursors={root_node: statement.get_values().cursor},
+        )
+
+    def map_ids(self, statement: Statement[TViewInstance]) -> CogniteQuery:
+        view_external_id = statement.entity.get_view_external_id()
+        root_view = self._view_mapper.get_view(view_external_id)
+
+        # only space and externalId are returned: no properties, no relations
+        return CogniteQuery(
+            with_={view_external_id: self._get_root_expression(statement, root_view)},
+            select={view_external_id: Select()},
+            cursors={view_external_id: statement.get_values().cursor},
+        )
 
-    def map(self, statement: Statement[TViewInstance]) -> CogniteQuery:
-        root_node = statement.entity.get_view_external_id()
+    def map_combined(
+        self, statements: Sequence[Statement[Any]]
+    ) -> tuple[CogniteQuery, list[str]]:
+        root_keys = [
+            get_combined_root_key(index, statement.entity.get_view_external_id())
+            for index, statement in enumerate(statements)
+        ]
 
-        root_view = self._view_mapper.get_view(root_node)
-        root_view_id = root_view.as_id()
+        with_: dict[str, ResultSetExpression] = {}
+        select_: dict[str, Select] = {}
+        cursors: dict[str, str | None] = {}
+        for statement, root_key in zip(statements, root_keys, strict=True):
+            statement_query = self.map(statement, root_key)
+            with_.update(statement_query.with_)
+            select_.update(statement_query.select)
+            cursors.update(statement_query.cursors)
+
+        return CogniteQuery(with_=with_, select=select_, cursors=cursors), root_keys
 
-        filters_: list[filters.Filter] = [filters.HasData(views=[root_view_id])]
+    def _get_root_expression(
+        self, statement: Statement[TViewInstance], root_view: View
+    ) -> NodeResultSetExpression:
+        filters_: list[filters.Filter] = [filters.HasData(views=[root_view.as_id()])]
 
         statement_values = statement.get_values()
         filters_.extend(
             self._filter_mapper.map(statement_values.where_clauses, root_view)
         )
 
-        with_: dict[str, ResultSetExpression] = {
-            root_node: NodeResultSetExpression(
-                filter=filters.And(*filters_),
-                sort=self._sort_mapper.map(statement_values.sort_clauses, root_view),
-                limit=statement_values.limit,
-            )
-        }
+        return NodeResultSetExpression(
+            filter=filters.And(*filters_),
+            sort=self._sort_mapper.map(statement_values.sort_clauses, root_view),
+            limit=statement_values.limit,
+        )
+
+    def _get_plan(
+        self,
+        statement: Statement[TViewInstance],
+        root_node: str,
+        root_view: View,
+    ) -> _QueryPlan:
+        statement_values = statement.get_values()
+        key: PlanKey = (
+            statement.entity,
+            root_node,
+            tuple(sorted(statement_values.relation_modes.items())),
+            repr(statement_values.where_edge_clauses),
+            tuple(statement_values.projection)
+            if statement_values.projection is not None
+            else None,
+        )
+
+        plan = self._plans.get(key)
+        # views can be reloaded, plans built from previous views are discarded
+        if plan is not None and plan.root_view is root_view:
+            self._plans.move_to_end(key)
+            return plan
+
+        plan = self._build_plan(statement, root_node, root_view)
+        if self._plan_cache_size > 0:
+            self._plans[key] = plan
+            if len(self._plans) > self._plan_cache_size:
+                self._plans.popitem(last=False)
+        return plan
+
+    def _build_plan(
+        self,
+        statement: Statement[TViewInstance],
+        root_node: str,
+        root_view: View,
+    ) -> _QueryPlan:
+        statement_values = statement.get_values()
+        with_: dict[str, ResultSetExpression] = {}
         select_: dict[str, Select] = {}
 
         relations = get_schema_properties(
@@ -64,23 +182,20 @@ class QueryMapper:
             NESTED_SEP,
             root_node,
             statement_values.relation_modes,
+            statement_values.projection,
         )
 
         edge_filters = self._filter_mapper.map_edges(
-            statement_values.where_edge_clauses, root_view, NESTED_SEP
+            statement_values.where_edge_clauses, root_view, NESTED_SEP, root_node
         )
 
         properties = self._include_statements(
             root_node, root_view, relations, edge_filters, with_, select_
         )
 
-        select_[root_node] = self._get_select(root_view_id, properties)
+        select_[root_node] = self._get_select(root_view.as_id(), properties)
 
-        return CogniteQuery(
-            with_=with_,
-            select=select_,
-            cursors={root_node: statement_values.cursor},
-        )
+        return _QueryPlan(root_view=root_view, with_=with_, select=select_)
 
     def _get_select(self, view_id: ViewId, properties: list[str]) -> Select:
         return (
@@ -102,14 +217,16 @@ class QueryMapper:
             return []
 
         select_properties: list[str] = []
-        for property_name, property in view.properties.items():
+        for property_name, property in self._view_mapper.get_view_properties(
+            view
+        ).items():
             property_key = f"{key}{NESTED_SEP}{property_name}"
             if property_key not in relations_to_include:
                 continue
 
-            if isinstance(property, MappedProperty) and not property.source:
+            if property.kind == ViewPropertyKind.PROPERTY:
                 select_properties.append(property_name)
-            elif isinstance(property, MappedProperty) and property.source:
+            elif property.kind == ViewPropertyKind.DIRECT_RELATION and property.source:
                 select_properties.append(property_name)
 
                 props = self._include_statements(
@@ -129,9 +246,9 @@ class QueryMapper:
                     select_[property_key] = self._get_select(property.source, props)
 
             elif (
-                isinstance(property, MultiReverseDirectRelation)
-                or isinstance(property, SingleReverseDirectRelation)
+                property.kind == ViewPropertyKind.REVERSE_DIRECT_RELATION
                 and property.source
+                and property.through_property
             ):
                 props = self._include_statements(
                     property_key,
@@ -145,15 +262,20 @@ class QueryMapper:
                 with_[property_key] = NodeResultSetExpression(
                     from_=key,
                     direction="inwards",
-                    through=property.source.as_property_ref(property.through.property),
+                    through=property.source.as_property_ref(property.through_property),
                     limit=MAX_LIMIT,
                 )
 
-                if property.through.property not in props:
-                    props.append(property.through.property)
+                if property.through_property not in props:
+                    props.append(property.through_property)
 
                 select_[property_key] = self._get_select(property.source, props)
-            elif isinstance(property, EdgeConnection) and property.source:
+            elif (
+                property.kind == ViewPropertyKind.EDGE
+                and property.source
+                and property.edge_type
+                and property.edge_direction
+            ):
                 edge_property_key = f"{property_key}{NESTED_SEP}{EDGE_MARKER}"
 
                 edge_filter = edge_filters.get(property_key)
@@ -163,10 +285,10 @@ class QueryMapper:
                     max_distance=1,
                     filter=filters.Equals(
                         ["edge", "type"],
-                        property.type.dump(),
+                        property.edge_type.dump(),
                     ),
                     node_filter=filters.And(*edge_filter) if edge_filter else None,
-                    direction=property.direction,
+                    direction=property.edge_direction,
                     limit=MAX_LIMIT,
                 )
                 with_[property_key] = NodeResultSetExpression(
@@ -1,56 +1,57 @@
 from collections import defaultdict
-from enum import StrEnum
 from typing import Any, TypedDict
 
 from cognite.client.data_classes.data_modeling import (
     Edge,
-    EdgeConnection,
-    MappedProperty,
     Node,
     NodeList,
     View,
 )
-from cognite.client.data_classes.data_modeling.data_types import (
-    ListablePropertyType,
-)
 from cognite.client.data_classes.data_modeling.instances import PropertyValue
-from cognite.client.data_classes.data_modeling.views import (
-    MultiReverseDirectRelation,
-    SingleReverseDirectRelation,
-)
 
-from industrial_model.constants import EDGE_DIRECTION, EDGE_MARKER, NESTED_SEP
+from industrial_model.constants import (
+    EDGE_DIRECTION,
+    EDGE_MARKER,
+    NESTED_SEP,
+    ResultMappingMode,
+)
 from industrial_model.models import EdgeContainer
 
+from .models import ViewPropertyKind
 from .view_mapper import ViewMapper
 
 
-class ConnectionTypeEnum(StrEnum):
-    DIRECT_RELATION = "DirectRelation"
-    REVERSE_DIRECT_RELATION = "ReverseDirectRelation"
-    EDGE = "Edge"
-
-
 class _PropertyMapping(TypedDict):
     is_list: bool
-    connection_type: ConnectionTypeEnum
+    connection_type: ViewPropertyKind
     nodes: dict[tuple[str, str], list[Node]]
     edges: dict[tuple[str, str], list[Edge]]
 
 
 class QueryResultMapper:
-    def __init__(self, view_mapper: ViewMapper):
+    def __init__(
+        self, view_mapper: ViewMapper, result_mapping: ResultMappingMode = "sdk"
+    ):
         self._view_mapper = view_mapper
+        self._node_to_dict = (
+            self._node_to_flat_dict
+            if result_mapping == "direct"
+            else self._node_dump_to_dict
+        )
 
     def map_nodes(
-        self, root_node: str, query_result: dict[str, list[Node | Edge]]
+        self,
+        view_external_id: str,
+        query_result: dict[str, list[Node | Edge]],
+        root_key: str | None = None,
     ) -> list[dict[str, Any]]:
-        if root_node not in query_result:
-            raise ValueError(f"{root_node} is not available in the query result")
+        root_key = root_key or view_external_id
+        if root_key not in query_result:
+            raise ValueError(f"{root_key} is not available in the query result")
 
-        root_view = self._view_mapper.get_view(root_node)
+        root_view = self._view_mapper.get_view(view_external_id)
 
-        values = self._map_node_property(root_node, root_view, query_result)
+        values = self._map_node_property(root_key, root_view, query_result)
         if not values:
             return []
 
@@ -107,12 +108,12 @@ class QueryResultMapper:
                 is_list = mapping_value.get("is_list", False)
                 connection_type = mapping_value.get(
                     "connection_type",
-                    ConnectionTypeEnum.DIRECT_RELATION,
+                    ViewPropertyKind.DIRECT_RELATION,
                 )
 
                 if (
                     element is None
-                    and connection_type == ConnectionTypeEnum.DIRECT_RELATION
+                    and connection_type == ViewPropertyKind.DIRECT_RELATION
                 ):
                     continue
 
@@ -168,58 +169,38 @@ class QueryResultMapper:
     ) -> dict[str, _PropertyMapping]:
         mappings: dict[str, _PropertyMapping] = {}
 
-        for property_name, property in view.properties.items():
+        for property_name, property in self._view_mapper.get_view_properties(
+            view
+        ).items():
+            if property.source is None:
+                continue
             property_key = f"{key}{NESTED_SEP}{property_name}"
+            source_view = self._view_mapper.get_view(property.source.external_id)
 
             nodes: dict[tuple[str, str], list[Node]] | None = None
             edges: dict[tuple[str, str], list[Edge]] | None = None
-            is_list = False
-            connection_type: ConnectionTypeEnum = ConnectionTypeEnum.DIRECT_RELATION
 
-            if isinstance(property, MappedProperty) and property.source:
+            if property.kind == ViewPropertyKind.DIRECT_RELATION:
+                nodes = self._map_node_property(property_key, source_view, query_result)
+            elif property.kind == ViewPropertyKind.REVERSE_DIRECT_RELATION:
                 nodes = self._map_node_property(
                     property_key,
-                    self._view_mapper.get_view(property.source.external_id),
+                    source_view,
                     query_result,
+                    property.through_property,
                 )
-                is_list = (
-                    isinstance(property.type, ListablePropertyType)
-                    and property.type.is_list
-                )
-                connection_type = ConnectionTypeEnum.DIRECT_RELATION
-            elif isinstance(property, SingleReverseDirectRelation) and property.source:
-                nodes = self._map_node_property(
-                    property_key,
-                    self._view_mapper.get_view(property.source.external_id),
-                    query_result,
-                    property.through.property,
-                )
-                is_list = False
-                connection_type = ConnectionTypeEnum.REVERSE_DIRECT_RELATION
-            elif isinstance(property, MultiReverseDirectRelation) and property.source:
-                nodes = self._map_node_property(
-                    property_key,
-                    self._view_mapper.get_view(property.source.external_id),
-                    query_result,
-                    property.through.property,
-                )
-                is_list = True
-                connection_type = ConnectionTypeEnum.REVERSE_DIRECT_RELATION
-
-            elif isinstance(property, EdgeConnection) and property.source:
+            elif property.kind == ViewPropertyKind.EDGE and property.edge_direction:
                 nodes, edges = self._map_edge_property(
                     property_key,
-                    self._view_mapper.get_view(property.source.external_id),
+                    source_view,
                     query_result,
-                    property.direction,
+                    property.edge_direction,
                 )
-                is_list = True
-                connection_type = ConnectionTypeEnum.EDGE
 
             if nodes is not None:
                 mappings[property_name] = _PropertyMapping(
-                    is_list=is_list,
-                    connection_type=connection_type,
+                    is_list=property.is_list,
+                    connection_type=property.kind,
                     nodes=nodes,
                     edges=edges or {},
                 )
@@ -270,7 +251,28 @@ class QueryResultMapper:
     def _edges_to_model(self, edges: list[Edge]) -> list[EdgeContainer]:
         return [EdgeContainer.model_validate(edge) for edge in edges]
 
-    def _node_to_dict(self, node: Node) -> dict[str, Any]:
+    def _node_to_flat_dict(self, node: Node) -> dict[str, Any]:
+        entry: dict[str, Any] = {
+            "space": node.space,
+            "externalId": node.external_id,
+            "version": node.version,
+            "lastUpdatedTime": node.last_updated_time,
+            "createdTime": node.created_time,
+            "instanceType": node.instance_type,
+        }
+        if node.deleted_time is not None:
+            entry["deletedTime"] = node.deleted_time
+        if node.type:
+            entry["type"] = {
+                "space": node.type.space,
+                "externalId": node.type.external_id,
+            }
+        for view_mapping in node.properties.values():
+            entry.update(view_mapping)
+
+        return entry
+
+    def _node_dump_to_dict(self, node: Node) -> dict[str, Any]:
         entry = node.dump()
         properties: dict[str, dict[str, dict[str, Any]]] = entry.pop("properties") or {}
         for space_mapping in properties.values():
@@ -28,7 +28,7 @@ class SearchMapper:
     def __init__(self, view_mapper: ViewMapper):
         self._view_mapper = view_mapper
         self._filter_mapper = FilterMapper(view_mapper)
-        self._sort_mapper = SortMapper()
+        self._sort_mapper = SortMapper(view_mapper)
 
     def map(self, statement: SearchStatement[TViewInstance]) -> SearchQuery:
         root_node = statement.entity.get_view_external_id()
@@ -0,0 +1,44 @@
+import asyncio
+import copy
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+_CallKey = tuple[asyncio.AbstractEventLoop, Hashable]
+
+
+@dataclass
+class _Call:
+    task: asyncio.Future[Any]
+    waiters: int = 0
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: dict[_CallKey, _Call] = {}
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        call_key: _CallKey = (asyncio.get_running_loop(), key)
+        call = self._calls.get(call_key)
+        is_owner = call is None
+        if call is None:
+            call = _Call(asyncio.ensure_future(fetch()))
+            self._calls[call_key] = call
+            call.task.add_done_callback(lambda _: self._forget(call_key, call))
+
+        call.waiters += 1
+        try:
+            result: _T = await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+        # waiters must not share mutable results with the caller that started the call
+        return result if is_owner else copy.deepcopy(result)
+
+    def _forget(self, call_key: _CallKey, call: _Call) -> None:
+        if self._calls.get(call_key) is call:
+            del self._calls[call_key]
@@ -1,11 +1,17 @@
-from cognite.client.data_classes.data_modeling import InstanceSort, MappedProperty, View
+from cognite.client.data_classes.data_modeling import InstanceSort, View
 
 from industrial_model.cognite_adapters.utils import get_property_ref
 from industrial_model.constants import SORT_DIRECTION
 from industrial_model.statements.expressions import Column
 
+from .models import ViewPropertyKind
+from .view_mapper import ViewMapper
+
 
 class SortMapper:
+    def __init__(self, view_mapper: ViewMapper):
+        self._view_mapper = view_mapper
+
     def map(
         self,
         sort_clauses: list[tuple[Column, SORT_DIRECTION]],
@@ -23,9 +29,14 @@ class SortMapper:
     def _is_nulls_first(
         self, column: Column, root_view: View, direction: SORT_DIRECTION
     ) -> bool:
-        view_property = root_view.properties.get(column.property)
+        view_property = self._view_mapper.get_view_properties(root_view).get(
+            column.property
+        )
 
-        if isinstance(view_property, MappedProperty) and view_property.source:
+        if (
+            view_property is not None
+            and view_property.kind == ViewPropertyKind.DIRECT_RELATION
+        ):
             return direction == "ascending"
 
         return direction == "descending"
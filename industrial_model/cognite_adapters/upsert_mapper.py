@@ -4,13 +4,12 @@ from typing import Any
 from cognite.client.data_classes.data_modeling import (
     DirectRelationReference,
     EdgeApply,
-    EdgeConnection,
-    MappedProperty,
     NodeApply,
     NodeOrEdgeData,
 )
 
-from industrial_model.cognite_adapters.models import UpsertOperation
+from industrial_model.cognite_adapters.models import UpsertOperation, ViewPropertyKind
+from industrial_model.constants import EDGE_DIRECTION
 from industrial_model.models import (
     EdgeContainer,
     InstanceId,
@@ -26,15 +25,22 @@ class UpsertMapper:
         self._view_mapper = view_mapper
 
     def map(
-        self, instances: list[TWritableViewInstance], remove_unset: bool
+        self,
+        instances: list[TWritableViewInstance],
+        remove_unset: bool,
+        only_changed: bool = False,
     ) -> UpsertOperation:
         nodes: dict[tuple[str, str], NodeApply] = {}
         edges: dict[tuple[str, str], EdgeApply] = {}
         edges_to_delete: dict[tuple[str, str], EdgeContainer] = {}
 
         for instance in instances:
+            changed_fields = instance.get_changed_fields() if only_changed else None
+            if changed_fields is not None and not changed_fields:
+                continue
+
             entry_nodes, entry_edges, entry_edges_to_delete = self._map_instance(
-                instance, remove_unset
+                instance, remove_unset, changed_fields
             )
 
             nodes[instance.as_tuple()] = entry_nodes
@@ -50,14 +56,19 @@ class UpsertMapper:
         )
 
     def _map_instance(
-        self, instance: TWritableViewInstance, remove_unset: bool
+        self,
+        instance: TWritableViewInstance,
+        remove_unset: bool,
+        changed_fields: set[str] | None = None,
     ) -> tuple[NodeApply, list[EdgeApply], list[EdgeContainer]]:
         view = self._view_mapper.get_view(instance.get_view_external_id())
 
         edges: list[EdgeApply] = []
         edges_to_delete: list[EdgeContainer] = []
         properties: dict[str, Any] = {}
-        for property_name, property in view.properties.items():
+        for property_name, property in self._view_mapper.get_view_properties(
+            view
+        ).items():
             property_key = instance.get_field_name(property_name)
             if not property_key:
                 continue
@@ -65,12 +76,26 @@ class UpsertMapper:
             if remove_unset and property_key not in instance.model_fields_set:
                 continue
 
-            entry = instance.__getattribute__(property_key)
+            if changed_fields is not None and property_key not in changed_fields:
+                continue
+
+            entry = getattr(instance, property_key)
 
-            if isinstance(property, MappedProperty):
+            if property.is_mapped:
                 properties[property_name] = self._get_mapped_property_value(entry)
-            elif isinstance(property, EdgeConnection) and isinstance(entry, list):
-                possible_entries = self._map_edges(instance, property, entry)
+            elif (
+                property.kind == ViewPropertyKind.EDGE
+                and property.edge_type
+                and property.edge_direction
+                and isinstance(entry, list)
+            ):
+                possible_entries = self._map_edges(
+                    instance,
+                    property_name,
+                    property.edge_type,
+                    property.edge_direction,
+                    entry,
+                )
 
                 previous_edges = {
                     item.as_tuple(): item
@@ -117,23 +142,23 @@ class UpsertMapper:
     def _map_edges(
         self,
         instance: TWritableViewInstance,
-        property: EdgeConnection,
+        property_name: str,
+        property_type: DirectRelationReference,
+        direction: EDGE_DIRECTION,
         values: list[Any],
     ) -> dict[tuple[str, str], EdgeApply]:
-        edge_type = InstanceId.model_validate(property.type)
+        edge_type = InstanceId.model_validate(property_type)
 
         result: dict[tuple[str, str], EdgeApply] = {}
         for value in values:
             if not isinstance(value, InstanceId):
                 raise ValueError(
-                    f"""Invalid value for edge property {property.name}:
+                    f"""Invalid value for edge property {property_name}:
                         Received {type(value)} | Expected: InstanceId"""
                 )
 
             start_node, end_node = (
-                (instance, value)
-                if property.direction == "outwards"
-                else (value, instance)
+                (instance, value) if direction == "outwards" else (value, instance)
             )
 
             edge_id = instance.edge_id_factory(value, edge_type)
@@ -141,7 +166,7 @@ class UpsertMapper:
             result[edge_id.as_tuple()] = EdgeApply(
                 external_id=edge_id.external_id,
                 space=edge_id.space,
-                type=property.type,
+                type=property_type,
                 start_node=start_node.as_tuple(),
                 end_node=end_node.as_tuple(),
             )
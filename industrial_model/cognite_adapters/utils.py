@@ -1,3 +1,5 @@
+from collections.abc import Collection
+from dataclasses import replace
 from typing import Literal
 
 from cognite.client.data_classes.data_modeling import (
@@ -56,23 +58,29 @@ def get_cognite_instance_id(instance_id: TViewInstance) -> dict[str, str]:
     return {"space": instance_id.space, "externalId": instance_id.external_id}
 
 
-def get_query_for_dependencies_pagination(
+def get_queries_for_dependencies_pagination(
     query: CogniteQuery,
     query_result: CogniteQueryResult,
-    view_external_id: str,
-) -> CogniteQuery | None:
+    root_keys: Collection[str],
+) -> list[CogniteQuery]:
     nodes_parent, nodes_children = get_parent_and_children_nodes(
         set(query_result.cursors.keys())
     )
 
     leaf_cursors = _get_leaf_cursors(
-        query_result, view_external_id, nodes_parent, nodes_children
+        query_result, root_keys, nodes_parent, nodes_children
     )
 
-    if not leaf_cursors:
-        return None
+    return [
+        _create_query(query, nodes_parent, nodes_children, {cursor_key: cursor_value})
+        for cursor_key, cursor_value in leaf_cursors.items()
+    ]
 
-    return _create_query(query, nodes_parent, nodes_children, leaf_cursors)
+
+def with_root_cursor(
+    query: CogniteQuery, view_external_id: str, cursor: str | None
+) -> CogniteQuery:
+    return replace(query, cursors={view_external_id: cursor})
 
 
 def map_nodes_and_edges(
@@ -134,14 +142,14 @@ def _create_query(
 
 def _get_leaf_cursors(
     query_result: CogniteQueryResult,
-    view_external_id: str,
+    root_keys: Collection[str],
     nodes_parent: dict[str, set[str]],
     nodes_children: dict[str, set[str]],
 ) -> dict[str, str]:
     target_cursors: dict[str, str] = {}
     for cursor_key, cursor_value in query_result.cursors.items():
         if (
-            cursor_key == view_external_id
+            cursor_key in root_keys
             or not cursor_value
             or len(query_result[cursor_key]) != MAX_LIMIT
         ):
@@ -0,0 +1,65 @@
+import contextlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from cognite.client.data_classes.data_modeling import View
+
+from industrial_model.config import DataModelId
+from industrial_model.constants import DEFAULT_VIEW_CACHE_TTL
+
+
+class ViewCache:
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl: float = DEFAULT_VIEW_CACHE_TTL,
+    ):
+        if ttl < 0:
+            raise ValueError("View cache TTL should be greater than or equal to 0")
+        self._directory = Path(directory)
+        self._ttl = ttl
+
+    def read(self, data_model_id: DataModelId) -> tuple[list[View], bool] | None:
+        """Return the cached views and whether they are still within the TTL."""
+        path = self._get_path(data_model_id)
+        try:
+            content: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+            if tuple(content["key"]) != data_model_id.as_tuple():
+                return None
+            views = [View.load(item) for item in content["views"]]
+            is_fresh = time.time() - float(content["cachedAt"]) < self._ttl
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logging.getLogger(__name__).warning(
+                f"Ignoring invalid view cache {path}: {error}"
+            )
+            return None
+        return views, is_fresh
+
+    def write(self, data_model_id: DataModelId, views: list[View]) -> None:
+        path = self._get_path(data_model_id)
+        content = {
+            "key": list(data_model_id.as_tuple()),
+            "cachedAt": time.time(),
+            "views": [view.dump() for view in views],
+        }
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(content), encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError as error:
+            # the views are already loaded, so queries carry on uncached
+            logging.getLogger(__name__).warning(
+                f"Failed to write view cache {path}: {error}"
+            )
+            with contextlib.suppress(OSError):
+                temp_path.unlink(missing_ok=True)
+
+    def _get_path(self, data_model_id: DataModelId) -> Path:
+        return self._directory / ("__".join(data_model_id.as_tuple()) + ".json")
@@ -1,4 +1,6 @@
 import asyncio
+import logging
+import time
 
 from cognite.client import AsyncCogniteClient
 from cognite.client.data_classes.data_modeling import (
@@ -9,14 +11,28 @@ from cognite.client.data_classes.data_modeling import (
 from cognite.client.data_classes.data_modeling.views import ViewProperty
 
 from industrial_model.config import DataModelId
+from industrial_model.constants import VIEW_REVALIDATION_RETRY_DELAY
+
+from .models import ViewPropertyInfo
+from .view_cache import ViewCache
 
 
 class ViewMapper:
-    def __init__(self, cognite_client: AsyncCogniteClient, data_model_id: DataModelId):
+    def __init__(
+        self,
+        cognite_client: AsyncCogniteClient,
+        data_model_id: DataModelId,
+        view_cache: ViewCache | None = None,
+    ):
         self._cognite_client = cognite_client
         self._data_model_id = data_model_id
+        self._view_cache = view_cache
         self._views_as_dict: dict[str, View] | None = None
+        self._view_properties: dict[str, dict[str, ViewPropertyInfo]] = {}
         self._lock = asyncio.Lock()
+        self._is_stale = False
+        self._revalidation: asyncio.Task[None] | None = None
+        self._revalidation_retry_at = 0.0
 
     def get_view(self, view_external_id: str) -> View:
         if self._views_as_dict is None:
@@ -27,32 +43,91 @@ class ViewMapper:
             raise ValueError(f"View {view_external_id} is not available in data model")
         return self._views_as_dict[view_external_id]
 
+    def get_view_properties(self, view: View) -> dict[str, ViewPropertyInfo]:
+        view_properties = self._view_properties.get(view.external_id)
+        if view_properties is None:
+            view_properties = {
+                name: info
+                for name, property in view.properties.items()
+                if (info := ViewPropertyInfo.from_view_property(name, property))
+            }
+            self._view_properties[view.external_id] = view_properties
+        return view_properties
+
     async def load_views(self) -> None:
         if self._views_as_dict is not None:
+            if self._is_stale:
+                self._schedule_revalidation()
             return
 
         async with self._lock:
             if self._views_as_dict is not None:
                 return
 
-            dm = await self._cognite_client.data_modeling.data_models.retrieve(
-                ids=self._data_model_id.as_tuple(),
-                inline_views=True,
+            cached = (
+                self._view_cache.read(self._data_model_id) if self._view_cache else None
             )
+            if cached is not None:
+                views, is_fresh = cached
+                self._set_views(views)
+                self._is_stale = not is_fresh
+                if self._is_stale:
+                    self._schedule_revalidation()
+                return
 
-            views = dm.latest_version().views
+            views = await self._retrieve_views()
+            self._set_views(views)
+            if self._view_cache:
+                self._view_cache.write(self._data_model_id, views)
 
-            while True:
-                new_dependency_view_ids = self._get_new_dependency_view_ids(views)
-                if not new_dependency_view_ids:
-                    break
+    def _set_views(self, views: list[View]) -> None:
+        self._views_as_dict = {view.external_id: view for view in views}
+        self._view_properties = {}
 
-                new_views = await self._cognite_client.data_modeling.views.retrieve(
-                    ids=new_dependency_view_ids,
-                )
-                views.extend(new_views)
+    def _schedule_revalidation(self) -> None:
+        # a revalidation cancelled with its event loop (e.g. an asyncio.run per
+        # async call) is scheduled again on the next call; failures back off
+        if time.monotonic() < self._revalidation_retry_at:
+            return
+        if self._revalidation is None or self._revalidation.done():
+            self._revalidation = asyncio.create_task(self._revalidate())
+
+    async def _revalidate(self) -> None:
+        try:
+            views = await self._retrieve_views()
+        except Exception as error:
+            logging.getLogger(__name__).warning(
+                f"Failed to revalidate cached views: {error}"
+            )
+            self._revalidation_retry_at = (
+                time.monotonic() + VIEW_REVALIDATION_RETRY_DELAY
+            )
+            return
+
+        self._set_views(views)
+        self._is_stale = False
+        if self._view_cache:
+            self._view_cache.write(self._data_model_id, views)
+
+    async def _retrieve_views(self) -> list[View]:
+        dm = await self._cognite_client.data_modeling.data_models.retrieve(
+            ids=self._data_model_id.as_tuple(),
+            inline_views=True,
+        )
+
+        views = dm.latest_version().views
+
+        while True:
+            new_dependency_view_ids = self._get_new_dependency_view_ids(views)
+            if not new_dependency_view_ids:
+                break
+
+            new_views = await self._cognite_client.data_modeling.views.retrieve(
+                ids=new_dependency_view_ids,
+            )
+            views.extend(new_views)
 
-            self._views_as_dict = {view.external_id: view for view in views}
+        return views
 
     def _get_new_dependency_view_ids(self, views: list[View]) -> list[ViewId]:
         view_ids = {view.external_id for view in views}
@@ -1,6 +1,7 @@
 from typing import Literal
 
 RelationMode = Literal["instanceId", "model"]
+ResultMappingMode = Literal["sdk", "direct"]
 SORT_DIRECTION = Literal["ascending", "descending"]
 LEAF_EXPRESSION_OPERATORS = Literal[
     "==",
@@ -23,3 +24,19 @@ EDGE_MARKER = "<EdgeMarker>"
 EDGE_DIRECTION = Literal["outwards", "inwards"]
 MAX_LIMIT = 10_000
 DEFAULT_LIMIT = 1_000
+DEFAULT_PARTITION_CONCURRENCY = 8
+DEFAULT_QUERY_MANY_CONCURRENCY = 8
+DEFAULT_WRITE_CONCURRENCY = 4
+WRITE_CHUNK_SIZE = 1_000
+WRITE_CHUNK_MAX_BYTES = 4 * 1024 * 1024
+WRITE_TARGET_LATENCY = 10.0
+WRITE_MAX_RETRIES = 5
+WRITE_STREAM_BATCH_SIZE = 10_000
+DEPENDENCIES_CONCURRENCY = 4
+DEFAULT_VIEW_CACHE_TTL = 24 * 60 * 60
+VIEW_REVALIDATION_RETRY_DELAY = 60
+QUERY_PLAN_CACHE_SIZE = 256
+DEFAULT_RESULT_CACHE_TTL = 60
+DEFAULT_RESULT_CACHE_MAX_ENTRIES = 1_024
+DEFAULT_RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SYNC_WATERMARK_PROPERTY = "lastUpdatedTime"
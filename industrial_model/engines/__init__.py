@@ -1,4 +1,13 @@
 from .async_engine import AsyncEngine
 from .engine import Engine
+from .result_cache import ResultCache
+from .sync_state import JsonSyncStateStore, SqliteSyncStateStore, SyncStateStore
 
-__all__ = ["Engine", "AsyncEngine"]
+__all__ = [
+    "Engine",
+    "AsyncEngine",
+    "ResultCache",
+    "SyncStateStore",
+    "JsonSyncStateStore",
+    "SqliteSyncStateStore",
+]
@@ -1,10 +1,21 @@
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from cognite.client import CogniteClient
 
+from industrial_model.cognite_adapters import BulkWriter, BulkWriteReport, ViewCache
 from industrial_model.config import DataModelId
+from industrial_model.constants import (
+    DEFAULT_PARTITION_CONCURRENCY,
+    DEFAULT_QUERY_MANY_CONCURRENCY,
+    WRITE_STREAM_BATCH_SIZE,
+    ResultMappingMode,
+)
 from industrial_model.models import (
+    InstanceId,
     PaginatedResult,
+    SyncResult,
     TAggregatedViewInstance,
     TViewInstance,
     TWritableViewInstance,
@@ -22,6 +33,12 @@ from ._internal import (
     generate_engine_params_from_user_token,
 )
 from .engine import Engine
+from .result_cache import ResultCache
+from .sync_state import SyncStateStore
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 
 class AsyncEngine:
@@ -29,8 +46,26 @@ class AsyncEngine:
         self,
         cognite_client: CogniteClient,
         data_model_id: DataModelId,
+        *,
+        result_mapping: ResultMappingMode = "sdk",
+        view_cache: ViewCache | None = None,
+        result_cache: ResultCache | None = None,
+        coalesce_requests: bool = False,
+        bulk_writer: BulkWriter | None = None,
+        track_changes: bool = False,
+        sync_state_store: SyncStateStore | None = None,
     ):
-        self._engine = Engine(cognite_client, data_model_id)
+        self._engine = Engine(
+            cognite_client,
+            data_model_id,
+            result_mapping=result_mapping,
+            view_cache=view_cache,
+            result_cache=result_cache,
+            coalesce_requests=coalesce_requests,
+            bulk_writer=bulk_writer,
+            track_changes=track_changes,
+            sync_state_store=sync_state_store,
+        )
 
     async def search_async(
         self,
@@ -46,12 +81,81 @@ class AsyncEngine:
     ) -> PaginatedResult[TViewInstance]:
         return await self._engine.query_async(statement, validation_mode)
 
+    async def query_many_async(
+        self,
+        statements: Sequence[Statement[Any]],
+        validation_mode: ValidationMode = "raiseOnError",
+        max_concurrency: int = DEFAULT_QUERY_MANY_CONCURRENCY,
+    ) -> list[PaginatedResult[Any]]:
+        return await self._engine.query_many_async(
+            statements, validation_mode, max_concurrency
+        )
+
+    async def query_combined_async(
+        self,
+        statements: Sequence[Statement[Any]],
+        validation_mode: ValidationMode = "raiseOnError",
+    ) -> list[PaginatedResult[Any]]:
+        return await self._engine.query_combined_async(statements, validation_mode)
+
     async def query_all_pages_async(
         self,
         statement: Statement[TViewInstance],
         validation_mode: ValidationMode = "raiseOnError",
+        prefetch_depth: int = 0,
+    ) -> list[TViewInstance]:
+        return await self._engine.query_all_pages_async(
+            statement, validation_mode, prefetch_depth
+        )
+
+    async def query_ids_async(
+        self, statement: Statement[TViewInstance]
+    ) -> PaginatedResult[InstanceId]:
+        return await self._engine.query_ids_async(statement)
+
+    async def query_all_ids_async(
+        self, statement: Statement[TViewInstance]
+    ) -> list[InstanceId]:
+        return await self._engine.query_all_ids_async(statement)
+
+    async def query_all_pages_partitioned_async(
+        self,
+        statement: Statement[TViewInstance],
+        validation_mode: ValidationMode = "raiseOnError",
+        max_concurrency: int = DEFAULT_PARTITION_CONCURRENCY,
     ) -> list[TViewInstance]:
-        return await self._engine.query_all_pages_async(statement, validation_mode)
+        return await self._engine.query_all_pages_partitioned_async(
+            statement, validation_mode, max_concurrency
+        )
+
+    def stream_async(
+        self,
+        statement: Statement[TViewInstance],
+        validation_mode: ValidationMode = "raiseOnError",
+        prefetch_depth: int = 0,
+    ) -> AsyncGenerator[list[TViewInstance]]:
+        return self._engine.stream_async(statement, validation_mode, prefetch_depth)
+
+    async def query_changes_async(
+        self,
+        statement: Statement[TViewInstance],
+        validation_mode: ValidationMode = "raiseOnError",
+        key: str | None = None,
+        commit: bool = True,
+    ) -> SyncResult[TViewInstance]:
+        return await self._engine.query_changes_async(
+            statement, validation_mode, key, commit
+        )
+
+    async def query_to_arrow_async(
+        self, statement: Statement[TViewInstance], prefetch_depth: int = 0
+    ) -> "pa.Table":
+        return await self._engine.query_to_arrow_async(statement, prefetch_depth)
+
+    async def query_to_pandas_async(
+        self, statement: Statement[TViewInstance], prefetch_depth: int = 0
+    ) -> "pd.DataFrame":
+        return await self._engine.query_to_pandas_async(statement, prefetch_depth)
 
     async def aggregate_async(
         self, statement: AggregationStatement[TAggregatedViewInstance]
@@ -63,12 +167,31 @@ class AsyncEngine:
         entries: list[TWritableViewInstance],
         replace: bool = False,
         remove_unset: bool = False,
-    ) -> None:
-        return await self._engine.upsert_async(entries, replace, remove_unset)
+        only_changed: bool = False,
+    ) -> BulkWriteReport:
+        return await self._engine.upsert_async(
+            entries, replace, remove_unset, only_changed
+        )
+
+    async def upsert_stream_async(
+        self,
+        entries: Iterable[TWritableViewInstance] | AsyncIterable[TWritableViewInstance],
+        replace: bool = False,
+        remove_unset: bool = False,
+        batch_size: int = WRITE_STREAM_BATCH_SIZE,
+    ) -> BulkWriteReport:
+        return await self._engine.upsert_stream_async(
+            entries, replace, remove_unset, batch_size
+        )
 
     async def delete_async(self, nodes: list[TViewInstance]) -> None:
         return await self._engine.delete_async(nodes)
 
+    async def delete_where_async(
+        self, statement: Statement[TViewInstance]
+    ) -> BulkWriteReport:
+        return await self._engine.delete_where_async(statement)
+
     @classmethod
     def from_config_file(cls, config_file: str | Path) -> "AsyncEngine":
         client, dm_id = generate_engine_params(config_file)
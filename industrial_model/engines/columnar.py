@@ -0,0 +1,50 @@
+import importlib
+from collections.abc import Sequence
+from typing import Any
+
+from industrial_model.constants import NESTED_SEP
+from industrial_model.models import TViewInstance, get_schema_properties
+from industrial_model.statements import Statement
+
+
+def import_optional(module: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"{module} is required for this export. "
+            f"Install it with: pip install 'industrial-model[{extra}]'"
+        ) from exc
+
+
+class ColumnBuilder:
+    def __init__(self, statement: Statement[TViewInstance]):
+        statement_values = statement.get_values()
+        paths = get_schema_properties(
+            statement.entity,
+            NESTED_SEP,
+            relation_modes=statement_values.relation_modes,
+            projection=statement_values.projection,
+        )
+        # relations are flattened into their leaf paths, e.g. "parent|name"
+        leaf_paths = [
+            path
+            for path in paths
+            if not any(other.startswith(path + NESTED_SEP) for other in paths)
+        ]
+        self._paths = {path: path.split(NESTED_SEP) for path in leaf_paths}
+        self.columns: dict[str, list[Any]] = {path: [] for path in leaf_paths}
+
+    def append(self, rows: list[dict[str, Any]]) -> None:
+        for path, parts in self._paths.items():
+            self.columns[path].extend(_get_value(row, parts) for row in rows)
+
+
+def _get_value(value: Any, parts: Sequence[str]) -> Any:
+    for index, part in enumerate(parts):
+        if isinstance(value, list):
+            return [_get_value(item, parts[index:]) for item in value]
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
@@ -1,24 +1,54 @@
 import asyncio
-from collections.abc import Coroutine
+import hashlib
+import weakref
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from contextlib import aclosing
+from itertools import islice
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, Self, TypeVar, cast
 
 from cognite.client import CogniteClient
 
-from industrial_model.cognite_adapters import CogniteAdapter
+from industrial_model.cognite_adapters import (
+    BulkWriter,
+    BulkWriteReport,
+    CogniteAdapter,
+    ViewCache,
+)
 from industrial_model.config import DataModelId
+from industrial_model.constants import (
+    DEFAULT_PARTITION_CONCURRENCY,
+    DEFAULT_QUERY_MANY_CONCURRENCY,
+    SYNC_WATERMARK_PROPERTY,
+    WRITE_STREAM_BATCH_SIZE,
+    ResultMappingMode,
+)
 from industrial_model.models import (
+    InstanceId,
     PaginatedResult,
+    SyncResult,
+    SyncState,
     TAggregatedViewInstance,
     TViewInstance,
     TWritableViewInstance,
     ValidationMode,
-    include_edges,
+    ViewInstance,
+    validate_instances,
 )
 from industrial_model.statements import (
     AggregationStatement,
     SearchStatement,
     Statement,
+    col,
 )
 
 from ._internal import (
@@ -26,6 +56,14 @@ from ._internal import (
     generate_engine_params,
     generate_engine_params_from_user_token,
 )
+from .columnar import ColumnBuilder, import_optional
+from .event_loop import EventLoopThread
+from .result_cache import ResultCache
+from .sync_state import SyncStateStore
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 _T = TypeVar("_T")
 
@@ -35,40 +73,202 @@ class Engine:
         self,
         cognite_client: CogniteClient,
         data_model_id: DataModelId,
+        *,
+        result_mapping: ResultMappingMode = "sdk",
+        view_cache: ViewCache | None = None,
+        result_cache: ResultCache | None = None,
+        coalesce_requests: bool = False,
+        bulk_writer: BulkWriter | None = None,
+        track_changes: bool = False,
+        sync_state_store: SyncStateStore | None = None,
     ):
         self._cognite_adapter = CogniteAdapter(
-            cognite_client.get_async_client(), data_model_id
+            cognite_client.get_async_client(),
+            data_model_id,
+            result_mapping,
+            view_cache,
+            coalesce_requests,
+            bulk_writer,
         )
+        self._result_cache = result_cache
+        self._track_changes = track_changes
+        self._sync_state_store = sync_state_store
+        self._event_loop = EventLoopThread()
+        # engines that are never closed must not keep their loop thread alive;
+        # the finalizer may run on the loop thread itself, so it does not join
+        weakref.finalize(self, self._event_loop.close, False)
 
     async def search_async(
         self,
         statement: SearchStatement[TViewInstance],
         validation_mode: ValidationMode = "raiseOnError",
     ) -> list[TViewInstance]:
-        data = await self._cognite_adapter.search(statement)
-        return self._validate_data(statement.entity, data, validation_mode)
+        data = await self._cached(
+            "search", statement, lambda: self._cognite_adapter.search(statement)
+        )
+        return self._validate_data(statement, data, validation_mode)
 
     async def query_async(
         self,
         statement: Statement[TViewInstance],
         validation_mode: ValidationMode = "raiseOnError",
     ) -> PaginatedResult[TViewInstance]:
-        data, next_cursor = await self._cognite_adapter.query(statement, False)
+        data, next_cursor = await self._cached(
+            "query", statement, lambda: self._cognite_adapter.query(statement, False)
+        )
         return PaginatedResult(
-            data=self._validate_data(statement.entity, data, validation_mode),
+            data=self._validate_data(statement, data, validation_mode),
             next_cursor=next_cursor,
             has_next_page=next_cursor is not None,
         )
 
+    async def query_many_async(
+        self,
+        statements: Sequence[Statement[Any]],
+        validation_mode: ValidationMode = "raiseOnError",
+        max_concurrency: int = DEFAULT_QUERY_MANY_CONCURRENCY,
+    ) -> list[PaginatedResult[Any]]:
+        if max_concurrency < 1:
+            raise ValueError("Max concurrency should be greater than 0")
+
+        await self._cognite_adapter.prepare(statements)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def query(statement: Statement[Any]) -> PaginatedResult[Any]:
+            async with semaphore:
+                return await self.query_async(statement, validation_mode)
+
+        return list(await asyncio.gather(*(query(item) for item in statements)))
+
+    async def query_combined_async(
+        self,
+        statements: Sequence[Statement[Any]],
+        validation_mode: ValidationMode = "raiseOnError",
+    ) -> list[PaginatedResult[Any]]:
+        results = await self._cognite_adapter.query_combined(statements)
+        return [
+            PaginatedResult(
+                data=self._validate_data(statement, data, validation_mode),
+                next_cursor=None,
+                has_next_page=has_next_page,
+            )
+            for statement, (data, has_next_page) in zip(
+                statements, results, strict=True
+            )
+        ]
+
     async def query_all_pages_async(
         self,
         statement: Statement[TViewInstance],
         validation_mode: ValidationMode = "raiseOnError",
+        prefetch_depth: int = 0,
+    ) -> list[TViewInstance]:
+        if statement.get_values().cursor:
+            raise ValueError("Cursor should be none when querying all pages")
+        data, _ = await self._cached(
+            "query_all_pages",
+            statement,
+            lambda: self._cognite_adapter.query(statement, True, prefetch_depth),
+        )
+        return self._validate_data(statement, data, validation_mode)
+
+    async def query_ids_async(
+        self, statement: Statement[TViewInstance]
+    ) -> PaginatedResult[InstanceId]:
+        data, next_cursor = await self._cached(
+            "query_ids",
+            statement,
+            lambda: self._cognite_adapter.query_ids(statement, False),
+        )
+        return PaginatedResult(
+            data=data, next_cursor=next_cursor, has_next_page=next_cursor is not None
+        )
+
+    async def query_all_ids_async(
+        self, statement: Statement[TViewInstance]
+    ) -> list[InstanceId]:
+        if statement.get_values().cursor:
+            raise ValueError("Cursor should be none when querying all pages")
+        data, _ = await self._cached(
+            "query_all_ids",
+            statement,
+            lambda: self._cognite_adapter.query_ids(statement, True),
+        )
+        return data
+
+    async def query_all_pages_partitioned_async(
+        self,
+        statement: Statement[TViewInstance],
+        validation_mode: ValidationMode = "raiseOnError",
+        max_concurrency: int = DEFAULT_PARTITION_CONCURRENCY,
     ) -> list[TViewInstance]:
         if statement.get_values().cursor:
             raise ValueError("Cursor should be none when querying all pages")
-        data, _ = await self._cognite_adapter.query(statement, True)
-        return self._validate_data(statement.entity, data, validation_mode)
+        data = await self._cognite_adapter.query_partitions(statement, max_concurrency)
+        return self._validate_data(statement, data, validation_mode)
+
+    async def stream_async(
+        self,
+        statement: Statement[TViewInstance],
+        validation_mode: ValidationMode = "raiseOnError",
+        prefetch_depth: int = 0,
+    ) -> AsyncGenerator[list[TViewInstance]]:
+        pages = self._cognite_adapter.query_pages(statement, prefetch_depth)
+        async with aclosing(pages) as pages_:
+            async for data, _ in pages_:
+                yield self._validate_data(statement, data, validation_mode)
+
+    async def query_changes_async(
+        self,
+        statement: Statement[TViewInstance],
+        validation_mode: ValidationMode = "raiseOnError",
+        key: str | None = None,
+        commit: bool = True,
+    ) -> SyncResult[TViewInstance]:
+        if self._sync_state_store is None:
+            raise ValueError("query_changes requires an engine sync_state_store")
+        if statement.get_values().cursor:
+            raise ValueError("Cursor should be none when querying all pages")
+
+        key = key or _get_sync_key(statement)
+        previous_state = self._sync_state_store.read(key)
+
+        # ascending order makes instances updated mid-scan land on later pages;
+        # >= keeps instances that share the watermark millisecond, and the ones
+        # already returned at that millisecond are skipped below
+        changes = statement.clone()
+        changes.get_values().sort_clauses.clear()
+        changes.asc(SYNC_WATERMARK_PROPERTY)
+        if previous_state is not None:
+            changes.where(col(SYNC_WATERMARK_PROPERTY) >= previous_state.watermark)
+
+        data, _ = await self._cognite_adapter.query(changes, True)
+        if previous_state is not None:
+            data = _exclude_synced(data, previous_state)
+
+        state = _next_sync_state(data, previous_state)
+        result = SyncResult(
+            data=self._validate_data(changes, data, validation_mode),
+            key=key,
+            watermark=state.watermark if state else None,
+            state=state,
+        )
+
+        if commit and state is not None and state != previous_state:
+            self._sync_state_store.write(key, state)
+        return result
+
+    async def query_to_arrow_async(
+        self, statement: Statement[TViewInstance], prefetch_depth: int = 0
+    ) -> "pa.Table":
+        pyarrow = import_optional("pyarrow", "arrow")
+        return pyarrow.table(await self._query_columns(statement, prefetch_depth))
+
+    async def query_to_pandas_async(
+        self, statement: Statement[TViewInstance], prefetch_depth: int = 0
+    ) -> "pd.DataFrame":
+        pandas = import_optional("pandas", "pandas")
+        return pandas.DataFrame(await self._query_columns(statement, prefetch_depth))
 
     async def aggregate_async(
         self, statement: AggregationStatement[TAggregatedViewInstance]
@@ -81,26 +281,111 @@ class Engine:
         entries: list[TWritableViewInstance],
         replace: bool = False,
         remove_unset: bool = False,
-    ) -> None:
+        only_changed: bool = False,
+    ) -> BulkWriteReport:
+        if only_changed and replace:
+            raise ValueError("only_changed cannot be combined with replace")
         if not entries:
-            return
-        await self._cognite_adapter.upsert(entries, replace, remove_unset)
+            return BulkWriteReport()
+        try:
+            report = await self._cognite_adapter.upsert(
+                entries, replace, remove_unset, only_changed
+            )
+        finally:
+            self._invalidate_results(entries)
+
+        if self._track_changes:
+            for entry in entries:
+                entry.take_snapshot()
+        return report
+
+    async def upsert_stream_async(
+        self,
+        entries: Iterable[TWritableViewInstance] | AsyncIterable[TWritableViewInstance],
+        replace: bool = False,
+        remove_unset: bool = False,
+        batch_size: int = WRITE_STREAM_BATCH_SIZE,
+    ) -> BulkWriteReport:
+        _validate_batch_size(batch_size)
+        # batches are written one after another: edges may only point to nodes
+        # written in the same or an earlier batch
+        report = BulkWriteReport()
+        async with aclosing(_batched_async(entries, batch_size)) as batches:
+            async for batch in batches:
+                report.merge(await self.upsert_async(batch, replace, remove_unset))
+        return report
 
     async def delete_async(self, nodes: list[TViewInstance]) -> None:
-        await self._cognite_adapter.delete(nodes)
+        try:
+            await self._cognite_adapter.delete(nodes)
+        finally:
+            self._invalidate_results(nodes)
 
-    @staticmethod
-    def _run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    async def delete_where_async(
+        self, statement: Statement[TViewInstance]
+    ) -> BulkWriteReport:
         try:
-            asyncio.get_running_loop()
+            return await self._cognite_adapter.delete_where(statement)
+        finally:
+            if self._result_cache is not None:
+                self._result_cache.invalidate({statement.entity.get_view_external_id()})
+
+    async def _query_columns(
+        self, statement: Statement[TViewInstance], prefetch_depth: int
+    ) -> dict[str, list[Any]]:
+        if statement.get_values().cursor:
+            raise ValueError("Cursor should be none when querying all pages")
+
+        # pages are appended to column buffers as they arrive, without models
+        builder = ColumnBuilder(statement)
+        pages = self._cognite_adapter.query_pages(statement, prefetch_depth)
+        async with aclosing(pages) as pages_:
+            async for data, _ in pages_:
+                builder.append(data)
+        return builder.columns
+
+    async def _cached(
+        self,
+        method: str,
+        statement: Statement[TViewInstance] | SearchStatement[TViewInstance],
+        fetch: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        if self._result_cache is None:
+            return await fetch()
+
+        key = self._result_cache.get_key(method, statement)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            return cast(_T, cached)
+
+        view_external_id = statement.entity.get_view_external_id()
+        generation = self._result_cache.get_generation(view_external_id)
+        result = await fetch()
+        self._result_cache.put(key, view_external_id, result, generation)
+        return result
+
+    def _invalidate_results(self, instances: Sequence[ViewInstance]) -> None:
+        if self._result_cache is not None:
+            self._result_cache.invalidate(
+                {instance.get_view_external_id() for instance in instances}
+            )
+
+    def _ensure_sync_context(self) -> None:
+        # calls from other running loops (e.g. Jupyter) are dispatched to the
+        # engine loop; only its own thread would deadlock waiting on itself
+        if self._event_loop.is_current_thread():
             raise RuntimeError(
-                "Engine sync methods cannot be called from an async context. "
+                "Engine sync methods cannot be called from the engine event loop. "
                 "Use the async variants instead (e.g. query_async, search_async)."
             )
-        except RuntimeError as exc:
-            if "async context" in str(exc):
-                raise
-        return asyncio.run(coro)
+
+    def _run_sync(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        try:
+            self._ensure_sync_context()
+        except RuntimeError:
+            coro.close()
+            raise
+        return self._event_loop.run(coro)
 
     def search(
         self,
@@ -116,12 +401,91 @@ class Engine:
     ) -> PaginatedResult[TViewInstance]:
         return self._run_sync(self.query_async(statement, validation_mode))
 
+    def query_many(
+        self,
+        statements: Sequence[Statement[Any]],
+        validation_mode: ValidationMode = "raiseOnError",
+        max_concurrency: int = DEFAULT_QUERY_MANY_CONCURRENCY,
+    ) -> list[PaginatedResult[Any]]:
+        return self._run_sync(
+            self.query_many_async(statements, validation_mode, max_concurrency)
+        )
+
+    def query_combined(
+        self,
+        statements: Sequence[Statement[Any]],
+        validation_mode: ValidationMode = "raiseOnError",
+    ) -> list[PaginatedResult[Any]]:
+        return self._run_sync(self.query_combined_async(statements, validation_mode))
+
     def query_all_pages(
         self,
         statement: Statement[TViewInstance],
         validation_mode: ValidationMode = "raiseOnError",
+        prefetch_depth: int = 0,
+    ) -> list[TViewInstance]:
+        return self._run_sync(
+            self.query_all_pages_async(statement, validation_mode, prefetch_depth)
+        )
+
+    def query_ids(
+        self, statement: Statement[TViewInstance]
+    ) -> PaginatedResult[InstanceId]:
+        return self._run_sync(self.query_ids_async(statement))
+
+    def query_all_ids(self, statement: Statement[TViewInstance]) -> list[InstanceId]:
+        return self._run_sync(self.query_all_ids_async(statement))
+
+    def query_all_pages_partitioned(
+        self,
+        statement: Statement[TViewInstance],
+        validation_mode: ValidationMode = "raiseOnError",
+        max_concurrency: int = DEFAULT_PARTITION_CONCURRENCY,
     ) -> list[TViewInstance]:
-        return self._run_sync(self.query_all_pages_async(statement, validation_mode))
+        return self._run_sync(
+            self.query_all_pages_partitioned_async(
+                statement, validation_mode, max_concurrency
+            )
+        )
+
+    def iter_pages(
+        self,
+        statement: Statement[TViewInstance],
+        validation_mode: ValidationMode = "raiseOnError",
+        prefetch_depth: int = 0,
+    ) -> Iterator[list[TViewInstance]]:
+        self._ensure_sync_context()
+        pages = self.stream_async(statement, validation_mode, prefetch_depth)
+        try:
+            while True:
+                try:
+                    page = self._run_sync(_next_page(pages))
+                except StopAsyncIteration:
+                    return
+                yield page
+        finally:
+            self._run_sync(_close_pages(pages))
+
+    def query_changes(
+        self,
+        statement: Statement[TViewInstance],
+        validation_mode: ValidationMode = "raiseOnError",
+        key: str | None = None,
+        commit: bool = True,
+    ) -> SyncResult[TViewInstance]:
+        return self._run_sync(
+            self.query_changes_async(statement, validation_mode, key, commit)
+        )
+
+    def query_to_arrow(
+        self, statement: Statement[TViewInstance], prefetch_depth: int = 0
+    ) -> "pa.Table":
+        return self._run_sync(self.query_to_arrow_async(statement, prefetch_depth))
+
+    def query_to_pandas(
+        self, statement: Statement[TViewInstance], prefetch_depth: int = 0
+    ) -> "pd.DataFrame":
+        return self._run_sync(self.query_to_pandas_async(statement, prefetch_depth))
 
     def aggregate(
         self, statement: AggregationStatement[TAggregatedViewInstance]
@@ -133,12 +497,45 @@ class Engine:
         entries: list[TWritableViewInstance],
         replace: bool = False,
         remove_unset: bool = False,
-    ) -> None:
-        self._run_sync(self.upsert_async(entries, replace, remove_unset))
+        only_changed: bool = False,
+    ) -> BulkWriteReport:
+        return self._run_sync(
+            self.upsert_async(entries, replace, remove_unset, only_changed)
+        )
+
+    def upsert_stream(
+        self,
+        entries: Iterable[TWritableViewInstance],
+        replace: bool = False,
+        remove_unset: bool = False,
+        batch_size: int = WRITE_STREAM_BATCH_SIZE,
+    ) -> BulkWriteReport:
+        self._ensure_sync_context()
+        _validate_batch_size(batch_size)
+        # entries are consumed on the caller thread; only the writes run on the
+        # engine loop, so slow readers never block in-flight requests
+        report = BulkWriteReport()
+        for batch in _batched(entries, batch_size):
+            report.merge(
+                self._run_sync(self.upsert_async(batch, replace, remove_unset))
+            )
+        return report
 
     def delete(self, nodes: list[TViewInstance]) -> None:
         self._run_sync(self.delete_async(nodes))
 
+    def delete_where(self, statement: Statement[TViewInstance]) -> BulkWriteReport:
+        return self._run_sync(self.delete_where_async(statement))
+
+    def close(self) -> None:
+        self._event_loop.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
     @classmethod
     def from_config_file(cls, config_file: str | Path) -> "Engine":
         client, dm_id = generate_engine_params(config_file)
@@ -167,18 +564,96 @@ class Engine:
 
     def _validate_data(
         self,
-        entity: type[TViewInstance],
+        statement: Statement[TViewInstance] | SearchStatement[TViewInstance],
         data: list[dict[str, Any]],
         validation_mode: ValidationMode,
     ) -> list[TViewInstance]:
-        result: list[TViewInstance] = []
-        for item in data:
-            try:
-                validated_item = entity.model_validate(item)
-                include_edges(item, validated_item)
-                result.append(validated_item)
-            except Exception:
-                if validation_mode == "ignoreOnError":
-                    continue
-                raise
-        return result
+        instances = validate_instances(
+            statement.entity,
+            data,
+            validation_mode,
+            statement.get_values().projection is not None,
+        )
+        if self._track_changes:
+            for instance in instances:
+                instance.take_snapshot()
+        return instances
+
+
+def _get_sync_key(statement: Statement[TViewInstance]) -> str:
+    entity = statement.entity
+    content = "|".join(
+        (
+            f"{entity.__module__}.{entity.__qualname__}",
+            repr(statement.get_values().where_clauses),
+        )
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def _exclude_synced(
+    data: list[dict[str, Any]], state: SyncState
+) -> list[dict[str, Any]]:
+    synced = {instance_id.as_tuple() for instance_id in state.instance_ids}
+    return [
+        item
+        for item in data
+        if int(item[SYNC_WATERMARK_PROPERTY]) != state.watermark
+        or (item["space"], item["externalId"]) not in synced
+    ]
+
+
+def _next_sync_state(
+    data: list[dict[str, Any]], previous_state: SyncState | None
+) -> SyncState | None:
+    watermark = max((int(item[SYNC_WATERMARK_PROPERTY]) for item in data), default=None)
+    if watermark is None or (
+        previous_state is not None and previous_state.watermark > watermark
+    ):
+        return previous_state
+
+    instance_ids = [
+        InstanceId(external_id=item["externalId"], space=item["space"])
+        for item in data
+        if int(item[SYNC_WATERMARK_PROPERTY]) == watermark
+    ]
+    if previous_state is not None and previous_state.watermark == watermark:
+        instance_ids = [*previous_state.instance_ids, *instance_ids]
+    return SyncState(watermark=watermark, instance_ids=instance_ids)
+
+
+def _validate_batch_size(batch_size: int) -> None:
+    if batch_size < 1:
+        raise ValueError("Batch size should be greater than 0")
+
+
+def _batched(entries: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    iterator = iter(entries)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+async def _batched_async(
+    entries: Iterable[_T] | AsyncIterable[_T], size: int
+) -> AsyncGenerator[list[_T]]:
+    if not isinstance(entries, AsyncIterable):
+        for items in _batched(entries, size):
+            yield items
+        return
+
+    batch: list[_T] = []
+    async for entry in entries:
+        batch.append(entry)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _next_page(pages: AsyncGenerator[_T]) -> _T:
+    return await anext(pages)
+
+
+async def _close_pages(pages: AsyncGenerator[Any]) -> None:
+    await pages.aclose()
@@ -0,0 +1,138 @@
+import hashlib
+import pickle
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from industrial_model.constants import (
+    DEFAULT_RESULT_CACHE_MAX_BYTES,
+    DEFAULT_RESULT_CACHE_MAX_ENTRIES,
+    DEFAULT_RESULT_CACHE_TTL,
+)
+from industrial_model.models import TViewInstance
+from industrial_model.statements import SearchStatement, Statement
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    view_external_id: str
+    payload: bytes
+    expires_at: float
+
+
+class ResultCache:
+    def __init__(
+        self,
+        ttl: float = DEFAULT_RESULT_CACHE_TTL,
+        max_entries: int = DEFAULT_RESULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+    ):
+        if ttl <= 0:
+            raise ValueError("Result cache TTL should be greater than 0")
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("Result cache limits should be greater than 0")
+
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._size_bytes = 0
+        # bumped by invalidate so fetches that raced a write are not stored
+        self._generation = 0
+        self._view_generations: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def get_key(
+        self,
+        method: str,
+        statement: Statement[TViewInstance] | SearchStatement[TViewInstance],
+    ) -> str:
+        entity = statement.entity
+        content = "|".join(
+            (
+                method,
+                f"{entity.__module__}.{entity.__qualname__}",
+                repr(statement.get_values()),
+            )
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        # every hit is unpickled, so callers never share objects with the cache
+        return pickle.loads(entry.payload)
+
+    def get_generation(self, view_external_id: str) -> int:
+        return self._generation + self._view_generations.get(view_external_id, 0)
+
+    def put(
+        self,
+        key: str,
+        view_external_id: str,
+        value: Any,
+        generation: int | None = None,
+    ) -> None:
+        if generation is not None and generation != self.get_generation(
+            view_external_id
+        ):
+            return
+
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remove(key)
+        if len(payload) > self._max_bytes:
+            return
+
+        self._entries[key] = _CacheEntry(
+            view_external_id=view_external_id,
+            payload=payload,
+            expires_at=time.monotonic() + self._ttl,
+        )
+        self._size_bytes += len(payload)
+        while (
+            len(self._entries) > self._max_entries or self._size_bytes > self._max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, view_external_ids: Iterable[str] | None = None) -> None:
+        if view_external_ids is None:
+            self._generation += 1
+            self._entries.clear()
+            self._size_bytes = 0
+            return
+
+        targets = set(view_external_ids)
+        for view_external_id in targets:
+            self._view_generations[view_external_id] = (
+                self._view_generations.get(view_external_id, 0) + 1
+            )
+        for key in [
+            key
+            for key, entry in self._entries.items()
+            if entry.view_external_id in targets
+        ]:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= len(entry.payload)
@@ -0,0 +1,83 @@
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from industrial_model.models import SyncState
+
+
+class SyncStateStore(ABC):
+    @abstractmethod
+    def read(self, key: str) -> SyncState | None:
+        """Return the stored lastUpdatedTime watermark state for a sync key."""
+
+    @abstractmethod
+    def write(self, key: str, state: SyncState) -> None:
+        """Store the lastUpdatedTime watermark state for a sync key."""
+
+
+class JsonSyncStateStore(SyncStateStore):
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._lock = threading.Lock()
+
+    def read(self, key: str) -> SyncState | None:
+        with self._lock:
+            content = self._read_all().get(key)
+        return SyncState.model_validate(content) if content is not None else None
+
+    def write(self, key: str, state: SyncState) -> None:
+        with self._lock:
+            content = self._read_all()
+            content[key] = state.model_dump(mode="json", by_alias=True)
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps(content), encoding="utf-8")
+            os.replace(temp_path, self._path)
+
+    def _read_all(self) -> dict[str, Any]:
+        try:
+            content: dict[str, Any] = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        return content
+
+
+class SqliteSyncStateStore(SyncStateStore):
+    def __init__(self, path: str | Path):
+        self._path = str(path)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state "
+                "(key TEXT PRIMARY KEY, watermark INTEGER NOT NULL, "
+                "instance_ids TEXT NOT NULL)"
+            )
+            connection.commit()
+
+    def read(self, key: str) -> SyncState | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT watermark, instance_ids FROM sync_state WHERE key = ?", (key,)
+            ).fetchone()
+        if not row:
+            return None
+        return SyncState(watermark=int(row[0]), instance_ids=json.loads(row[1]))
+
+    def write(self, key: str, state: SyncState) -> None:
+        instance_ids = state.model_dump(mode="json", by_alias=True)["instanceIds"]
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO sync_state (key, watermark, instance_ids) "
+                "VALUES (?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "watermark = excluded.watermark, instance_ids = excluded.instance_ids",
+                (key, state.watermark, json.dumps(instance_ids)),
+            )
+            connection.commit()
+
+    def _connect(self) -> "closing[sqlite3.Connection]":
+        # connections are bound to their thread; the engine uses stores from its loop
+        return closing(sqlite3.connect(self._path))
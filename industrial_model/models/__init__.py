@@ -4,6 +4,8 @@ from .entities import (
     EdgeContainer,
     InstanceId,
     PaginatedResult,
+    SyncResult,
+    SyncState,
     TAggregatedViewInstance,
     TViewInstance,
     TWritableViewInstance,
@@ -14,6 +16,7 @@ from .entities import (
 )
 from .schemas import get_parent_and_children_nodes, get_schema_properties
 from .utils import include_edges
+from .validation import validate_instances
 
 __all__ = [
     "AggregatedViewInstance",
@@ -27,8 +30,11 @@ __all__ = [
     "ViewInstance",
     "ValidationMode",
     "PaginatedResult",
+    "SyncResult",
+    "SyncState",
     "ViewInstanceConfig",
     "get_schema_properties",
     "get_parent_and_children_nodes",
+    "validate_instances",
     "WritableViewInstance",
 ]
@@ -1,15 +1,20 @@
+import copy
+import weakref
 from abc import abstractmethod
+from collections.abc import Callable, Mapping
 from datetime import UTC, date, datetime
 from typing import (
+    TYPE_CHECKING,
     Any,
     ClassVar,
     Generic,
     Literal,
+    Self,
     TypedDict,
     TypeVar,
 )
 
-from pydantic import PrivateAttr, computed_field
+from pydantic import BaseModel, PrivateAttr, computed_field
 
 from industrial_model.statements import Column
 
@@ -64,10 +69,46 @@ class ViewInstanceConfig(TypedDict, total=False):
     group_by_behavior: Literal["ALL", "NONE"]
 
 
-class ViewInstance(InstanceId):
+class _LazyDumpMixin(BaseModel):
+    # pending lazy relations are resolved before dumping, including nested ones
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        if _PENDING_LAZY_INSTANCES:
+            _resolve_pending_lazy_relations(self, set())
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        if _PENDING_LAZY_INSTANCES:
+            _resolve_pending_lazy_relations(self, set())
+        return super().model_dump_json(**kwargs)
+
+
+class ViewInstance(_LazyDumpMixin, InstanceId):
     view_config: ClassVar[ViewInstanceConfig] = ViewInstanceConfig()
 
     _edges: dict[str, list[EdgeContainer]] = PrivateAttr(default_factory=dict)
+    _lazy_relations: dict[str, Callable[[], Any]] = PrivateAttr(default_factory=dict)
+    _snapshot: dict[str, Any] | None = PrivateAttr(default=None)
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, key: str) -> Any:
+            private = self.__pydantic_private__
+            lazy_relations = private.get("_lazy_relations") if private else None
+            if lazy_relations and key in lazy_relations:
+                return self._resolve_lazy_relation(key)
+            return super().__getattr__(key)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # an assigned relation replaces its pending loader
+        private = self.__pydantic_private__
+        if private and private.get("_lazy_relations"):
+            self._drop_lazy_relation(name)
+        super().__setattr__(name, value)
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # loaders are local closures, so pickles carry resolved relations
+        self._resolve_lazy_relations()
+        return super().__getstate__()
 
     @classmethod
     def get_view_external_id(cls) -> str:
@@ -89,6 +130,75 @@ class ViewInstance(InstanceId):
     def as_instance_id(self) -> InstanceId:
         return InstanceId(external_id=self.external_id, space=self.space)
 
+    def take_snapshot(self) -> None:
+        # pending lazy relations are captured when they are resolved
+        self._snapshot = {
+            key: _freeze_value(value)
+            for key, value in self.__dict__.items()
+            if key not in self._lazy_relations
+        }
+
+    def get_changed_fields(self) -> set[str] | None:
+        if self._snapshot is None:
+            return None
+
+        return {
+            key
+            for key, value in self.__dict__.items()
+            if key not in self._snapshot or _freeze_value(value) != self._snapshot[key]
+        }
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        for key in update or {}:
+            copied._drop_lazy_relation(key)
+        return copied
+
+    def __copy__(self) -> "ViewInstance":
+        copied = super().__copy__()
+        copied._copy_lazy_state()
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "ViewInstance":
+        copied = super().__deepcopy__(memo)
+        copied._copy_lazy_state()
+        return copied
+
+    def _copy_lazy_state(self) -> None:
+        self._lazy_relations = dict(self._lazy_relations)
+        if self._snapshot is not None:
+            self._snapshot = dict(self._snapshot)
+        if self._lazy_relations:
+            _PENDING_LAZY_INSTANCES.add(self)
+
+    def _add_lazy_relation(self, field_name: str, loader: Callable[[], Any]) -> None:
+        self.__dict__.pop(field_name, None)
+        self.__pydantic_fields_set__.add(field_name)
+        self._lazy_relations[field_name] = loader
+        _PENDING_LAZY_INSTANCES.add(self)
+
+    def _drop_lazy_relation(self, key: str) -> None:
+        if self._lazy_relations.pop(key, None) and not self._lazy_relations:
+            _PENDING_LAZY_INSTANCES.discard(self)
+
+    def _resolve_lazy_relation(self, key: str) -> Any:
+        if key in self.__dict__:
+            self._drop_lazy_relation(key)
+            return self.__dict__[key]
+
+        value = self._lazy_relations[key]()
+        self._drop_lazy_relation(key)
+        self.__dict__[key] = value
+        if self._snapshot is not None:
+            self._snapshot[key] = _freeze_value(value)
+        return value
+
+    def _resolve_lazy_relations(self) -> None:
+        for key in list(self._lazy_relations):
+            self._resolve_lazy_relation(key)
+
     def generate_model_id(
         self,
         fields: list[str] | list[Column] | list[Any],
@@ -138,6 +248,39 @@ class ViewInstance(InstanceId):
         return field_values
 
 
+_PENDING_LAZY_INSTANCES: "weakref.WeakSet[ViewInstance]" = weakref.WeakSet()
+
+
+def _resolve_pending_lazy_relations(value: Any, visited: set[int]) -> None:
+    if id(value) in visited:
+        return
+    if isinstance(value, BaseModel):
+        visited.add(id(value))
+        if isinstance(value, ViewInstance):
+            value._resolve_lazy_relations()
+        for item in value.__dict__.values():
+            _resolve_pending_lazy_relations(item, visited)
+    elif isinstance(value, list | tuple | set):
+        visited.add(id(value))
+        for item in value:
+            _resolve_pending_lazy_relations(item, visited)
+    elif isinstance(value, dict):
+        visited.add(id(value))
+        for item in value.values():
+            _resolve_pending_lazy_relations(item, visited)
+
+
+def _freeze_value(value: Any) -> Any:
+    # snapshots compare what upserts write: relations are written as their ids
+    if isinstance(value, InstanceId):
+        return value.as_tuple()
+    if isinstance(value, list | tuple):
+        return tuple(_freeze_value(item) for item in value)
+    if value is None or isinstance(value, str | int | float | date):
+        return value
+    return copy.deepcopy(value)
+
+
 class WritableViewInstance(ViewInstance):
     @abstractmethod
     def edge_id_factory(
@@ -175,13 +318,26 @@ TAggregatedViewInstance = TypeVar(
 )
 
 
-class PaginatedResult(RootModel, Generic[TViewInstance]):
-    data: list[TViewInstance]
+class PaginatedResult(_LazyDumpMixin, RootModel, Generic[TInstanceId]):
+    data: list[TInstanceId]
     has_next_page: bool
     next_cursor: str | None
 
-    def first_or_default(self) -> TViewInstance | None:
+    def first_or_default(self) -> TInstanceId | None:
         return self.data[0] if self.data else None
 
 
-ValidationMode = Literal["raiseOnError", "ignoreOnError"]
+class SyncState(RootModel):
+    watermark: int
+    # instances updated at the watermark millisecond, skipped by the next sync
+    instance_ids: list[InstanceId] = []
+
+
+class SyncResult(_LazyDumpMixin, RootModel, Generic[TViewInstance]):
+    data: list[TViewInstance]
+    key: str
+    watermark: int | None
+    state: SyncState | None
+
+
+ValidationMode = Literal["raiseOnError", "ignoreOnError", "trusted", "lazy"]
@@ -0,0 +1,161 @@
+import copy
+import datetime
+import types
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated, Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+from .entities import EdgeContainer, InstanceId, TViewInstance, ViewInstance
+
+_NODE_MARKER = "instanceType"
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+
+DefaultGetter = Callable[[dict[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class _FieldPlan:
+    name: str
+    node_model: type[BaseModel] | None
+    reference_model: type[BaseModel] | None
+    coerce: Callable[[Any], Any] | None
+    passthrough: bool
+
+
+@dataclass(frozen=True)
+class _ModelPlan:
+    fields: dict[str, _FieldPlan]
+    defaults: tuple[tuple[str, DefaultGetter], ...]
+    has_post_init: bool
+
+
+def construct_instances(
+    entity: type[TViewInstance], data: list[dict[str, Any]]
+) -> list[TViewInstance]:
+    return [construct_instance(entity, item) for item in data]
+
+
+def construct_instance(
+    entity: type[TViewInstance], data: dict[str, Any]
+) -> TViewInstance:
+    return _construct(entity, data)  # type: ignore[return-value]
+
+
+def _construct(model: type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    plan = _get_model_plan(model)
+
+    values: dict[str, Any] = {}
+    for key, value in data.items():
+        field = plan.fields.get(key)
+        if field is None:
+            continue
+        values[field.name] = value if field.passthrough else _convert(field, value)
+
+    fields_set = set(values)
+    for name, get_default in plan.defaults:
+        if name not in fields_set:
+            values[name] = get_default(values)
+
+    # mirrors BaseModel.model_construct without re-inspecting defaults per call
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    if plan.has_post_init:
+        instance.model_post_init(None)
+
+    edges = data.get("_edges")
+    if edges and isinstance(instance, ViewInstance):
+        instance._edges = {
+            property_: property_edges
+            for property_, property_edges in edges.items()
+            if property_edges and isinstance(property_edges[0], EdgeContainer)
+        }
+    return instance
+
+
+def _convert(field: _FieldPlan, value: Any) -> Any:
+    if isinstance(value, list):
+        return [_convert(field, item) for item in value]
+
+    if isinstance(value, dict):
+        model = field.reference_model
+        if field.node_model is not None and (_NODE_MARKER in value or model is None):
+            model = field.node_model
+        return _construct(model, value) if model is not None else value
+
+    if field.coerce is not None and isinstance(value, str):
+        return field.coerce(value)
+    return value
+
+
+@lru_cache(maxsize=256)
+def _get_model_plan(model: type[BaseModel]) -> _ModelPlan:
+    fields: dict[str, _FieldPlan] = {}
+    defaults: list[tuple[str, DefaultGetter]] = []
+    for field_name, field_info in model.model_fields.items():
+        annotations = flatten_annotation(field_info.annotation)
+        models = [
+            item
+            for item in annotations
+            if isinstance(item, type) and issubclass(item, BaseModel)
+        ]
+        node_models = [item for item in models if item is not InstanceId]
+
+        coerce = _get_coerce(annotations)
+        field_plan = _FieldPlan(
+            name=field_name,
+            node_model=node_models[0] if node_models else None,
+            reference_model=InstanceId if InstanceId in models else None,
+            coerce=coerce,
+            passthrough=not models and coerce is None,
+        )
+        fields[field_name] = field_plan
+        if field_info.alias:
+            fields[field_info.alias] = field_plan
+
+        if not field_info.is_required():
+            defaults.append((field_name, _get_default_getter(field_info)))
+
+    return _ModelPlan(
+        fields=fields,
+        defaults=tuple(defaults),
+        has_post_init=bool(model.__pydantic_post_init__),
+    )
+
+
+def _get_default_getter(field_info: FieldInfo) -> DefaultGetter:
+    default_factory = field_info.default_factory
+    if default_factory is not None:
+        if field_info.default_factory_takes_validated_data:
+            return default_factory  # type: ignore[return-value]
+        return lambda _: default_factory()  # type: ignore[call-arg]
+
+    default = field_info.default
+    if isinstance(default, _IMMUTABLE_DEFAULTS):
+        return lambda _: default
+    return lambda _: copy.deepcopy(default)
+
+
+def flatten_annotation(annotation: Any) -> list[Any]:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return flatten_annotation(get_args(annotation)[0])
+    if origin in (Union, types.UnionType, list, set, tuple):
+        return [
+            item for arg in get_args(annotation) for item in flatten_annotation(arg)
+        ]
+    return [annotation]
+
+
+def _get_coerce(annotations: list[Any]) -> Callable[[Any], Any] | None:
+    if datetime.datetime in annotations:
+        return datetime.datetime.fromisoformat
+    if datetime.date in annotations:
+        return datetime.date.fromisoformat
+    return None
@@ -17,9 +17,13 @@ def get_schema_properties(
     nested_separator: str,
     prefix: str | None = None,
     relation_modes: dict[str, RelationMode] | None = None,
+    projection: list[str] | None = None,
 ) -> list[str]:
     keys = list(_get_schema_property_paths(cls, nested_separator))
 
+    if projection is not None:
+        keys = _filter_projection_keys(cls, keys, nested_separator, projection)
+
     if relation_modes:
         keys = _filter_relation_mode_keys(keys, nested_separator, relation_modes)
 
@@ -29,6 +33,25 @@ def get_schema_properties(
     return [f"{prefix + nested_separator}{key}" for key in keys]
 
 
+def _filter_projection_keys(
+    cls: type[BaseModel],
+    keys: list[str],
+    nested_separator: str,
+    projection: list[str],
+) -> list[str]:
+    selected = {"externalId", "space"}
+    for property in projection:
+        field_info = cls.model_fields.get(property)
+        if field_info is not None:
+            selected.add(field_info.alias or property)
+        elif any(item.alias == property for item in cls.model_fields.values()):
+            selected.add(property)
+        else:
+            raise ValueError(f"Property {property} not found in {cls.__name__}")
+
+    return [key for key in keys if key.split(nested_separator, 1)[0] in selected]
+
+
 def _filter_relation_mode_keys(
     keys: list[str],
     nested_separator: str,
@@ -0,0 +1,186 @@
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, cast
+
+from pydantic import TypeAdapter, create_model
+
+from .entities import TViewInstance, ValidationMode, ViewInstance
+from .hydration import construct_instances, flatten_annotation
+from .utils import include_edges
+
+
+def validate_instances(
+    entity: type[TViewInstance],
+    data: list[dict[str, Any]],
+    validation_mode: ValidationMode,
+    partial: bool = False,
+) -> list[TViewInstance]:
+    if validation_mode == "trusted":
+        return construct_instances(entity, data)
+    if partial:
+        if validation_mode == "lazy":
+            raise ValueError("Lazy validation cannot be combined with only()")
+        return _validate_partial(entity, data, validation_mode)
+    if validation_mode == "lazy":
+        return _validate_lazy(entity, data)
+
+    try:
+        result = _get_list_adapter(entity).validate_python(data)
+    except Exception:
+        if validation_mode != "ignoreOnError":
+            raise
+        return _validate_each(entity, data)
+
+    for item, validated_item in zip(data, result, strict=True):
+        include_edges(item, validated_item)
+    return cast(list[TViewInstance], result)
+
+
+def _validate_each(
+    entity: type[TViewInstance], data: list[dict[str, Any]]
+) -> list[TViewInstance]:
+    result: list[TViewInstance] = []
+    for item in data:
+        try:
+            validated_item = entity.model_validate(item)
+            include_edges(item, validated_item)
+            result.append(validated_item)
+        except Exception:
+            continue
+    return result
+
+
+def _validate_partial(
+    entity: type[TViewInstance],
+    data: list[dict[str, Any]],
+    validation_mode: ValidationMode,
+) -> list[TViewInstance]:
+    # fields that were not selected stay unset instead of failing validation
+    field_names = _get_field_names(entity)
+    result: list[TViewInstance] = []
+    for item in data:
+        selected = frozenset(
+            field_name
+            for key in item
+            if (field_name := field_names.get(key)) is not None
+        )
+        projection, unselected = _get_projection_model(entity, selected)
+        try:
+            validated = projection.model_validate(item)
+        except Exception:
+            if validation_mode != "ignoreOnError":
+                raise
+            continue
+
+        validated_item = entity.model_construct(
+            validated.model_fields_set,
+            **{
+                key: value
+                for key, value in validated.__dict__.items()
+                if key not in unselected
+            },
+        )
+        include_edges(item, validated_item)
+        result.append(validated_item)
+    return result
+
+
+def _validate_lazy(
+    entity: type[TViewInstance], data: list[dict[str, Any]]
+) -> list[TViewInstance]:
+    lazy_fields = _get_lazy_fields(entity)
+    if not lazy_fields:
+        return validate_instances(entity, data, "raiseOnError")
+
+    eager_data = [
+        {key: value for key, value in item.items() if key not in lazy_fields}
+        for item in data
+    ]
+    result = validate_instances(entity, eager_data, "raiseOnError")
+
+    for item, validated_item in zip(data, result, strict=True):
+        for key, value in item.items():
+            field_name = lazy_fields.get(key)
+            if field_name is None:
+                continue
+            validated_item._add_lazy_relation(
+                field_name, _relation_loader(entity, field_name, value)
+            )
+    return result
+
+
+def _relation_loader(
+    entity: type[ViewInstance], field_name: str, value: Any
+) -> Callable[[], Any]:
+    def load() -> Any:
+        relation = _get_field_adapter(entity, field_name).validate_python(value)
+        if isinstance(value, list) and isinstance(relation, list):
+            for value_item, relation_item in zip(value, relation, strict=False):
+                include_edges(value_item, relation_item)
+        else:
+            include_edges(value, relation)
+        return relation
+
+    return load
+
+
+@lru_cache(maxsize=256)
+def _get_lazy_fields(entity: type[ViewInstance]) -> dict[str, str]:
+    lazy_fields: dict[str, str] = {}
+    for field_name, field_info in entity.model_fields.items():
+        if field_info.is_required() or not any(
+            isinstance(item, type) and issubclass(item, ViewInstance)
+            for item in flatten_annotation(field_info.annotation)
+        ):
+            continue
+        lazy_fields[field_name] = field_name
+        if field_info.alias:
+            lazy_fields[field_info.alias] = field_name
+    return lazy_fields
+
+
+@lru_cache(maxsize=256)
+def _get_projection_model(
+    entity: type[ViewInstance], selected: frozenset[str]
+) -> tuple[type[ViewInstance], frozenset[str]]:
+    # the model's own constraints and validators apply to the selected fields;
+    # required fields that were not selected become optional and unvalidated
+    unselected = frozenset(
+        field_name
+        for field_name, field_info in entity.model_fields.items()
+        if field_info.is_required() and field_name not in selected
+    )
+    if not unselected:
+        return entity, unselected
+
+    projection = create_model(  # type: ignore[call-overload]
+        f"{entity.__name__}Projection",
+        __base__=entity,
+        __module__=entity.__module__,
+        **dict.fromkeys(unselected, (Any, None)),
+    )
+    return projection, unselected
+
+
+@lru_cache(maxsize=256)
+def _get_field_names(entity: type[ViewInstance]) -> dict[str, str]:
+    field_names: dict[str, str] = {}
+    for field_name, field_info in entity.model_fields.items():
+        field_names[field_name] = field_name
+        if field_info.alias:
+            field_names[field_info.alias] = field_name
+    return field_names
+
+
+@lru_cache(maxsize=1024)
+def _get_field_adapter(entity: type[ViewInstance], field_name: str) -> TypeAdapter[Any]:
+    annotation = entity.model_fields[field_name].annotation
+    assert annotation is not None
+    return TypeAdapter(annotation)
+
+
+@lru_cache(maxsize=256)
+def _get_list_adapter(
+    entity: type[ViewInstance],
+) -> TypeAdapter[list[ViewInstance]]:
+    return TypeAdapter(list[entity])  # type: ignore[valid-type]
@@ -1,3 +1,4 @@
+import copy
 from dataclasses import dataclass, field
 from typing import Any, Generic, Literal, Self, TypeVar
 
@@ -35,6 +36,8 @@ class BaseStatementValues:
     relation_modes: dict[str, RelationMode] = field(init=False, default_factory=dict)
     limit: int = field(init=False, default=DEFAULT_LIMIT)
     cursor: str | None = field(init=False, default=None)
+    ids_only: bool = field(init=False, default=False)
+    projection: list[str] | None = field(init=False, default=None)
 
     query: str | None = field(init=False, default=None)
     query_properties: list[str] | None = field(init=False, default=None)
@@ -76,6 +79,11 @@ class BaseStatement(Generic[T]):
     def get_values(self) -> BaseStatementValues:
         return self._values
 
+    def clone(self) -> Self:
+        statement = copy.copy(self)
+        statement._values = copy.deepcopy(self._values)
+        return statement
+
 
 @dataclass
 class Statement(BaseStatement[T]):
@@ -102,6 +110,14 @@ class Statement(BaseStatement[T]):
         )
         return self
 
+    def only(self, *properties: str | Column | Any) -> Self:
+        if not properties:
+            raise ValueError("At least one property should be selected")
+        self._values.projection = [
+            _create_column(property).property for property in properties
+        ]
+        return self
+
     def relation_mode(self, property: str | Column | Any, mode: RelationMode) -> Self:
         relation_ = (
             _create_column(property).property
@@ -180,6 +196,12 @@ def select(entity: type[T]) -> Statement[T]:
     return Statement(entity)
 
 
+def select_ids(entity: type[T]) -> Statement[T]:
+    statement = Statement(entity)
+    statement._values.ids_only = True
+    return statement
+
+
 def aggregate(
     entity: type[T],
     aggregate: AggregateTypes | None = "count",
@@ -196,6 +218,7 @@ __all__ = [
     "AggregationStatement",
     "Statement",
     "select",
+    "select_ids",
     "search",
     "SearchStatement",
     "Column",
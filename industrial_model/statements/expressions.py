@@ -53,6 +53,10 @@ class Column:
     def __hash__(self) -> int:
         return hash(self.property)
 
+    def __repr__(self) -> str:
+        # statement reprs are used as cache and sync keys
+        return f"Column({self.property!r})"
+
     def __eq__(self, other: Any) -> bool:
         if other is None:
             return self.not_exists_()
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any, Generic, TypeVar, cast
 
+from industrial_model.cognite_adapters import BulkWriteReport
 from industrial_model.engines import Engine
 from industrial_model.models import (
     AggregatedViewInstance,
@@ -169,10 +170,12 @@ class ViewClient(
             build_query_statement(self._entity_cls, filters, limit=limit)
         )
 
-    def upsert(self, entries: list[_T], replace: bool = False) -> None:
+    def upsert(self, entries: list[_T], replace: bool = False) -> BulkWriteReport:
         return self._engine.upsert(entries, replace)
 
-    async def upsert_async(self, entries: list[_T], replace: bool = False) -> None:
+    async def upsert_async(
+        self, entries: list[_T], replace: bool = False
+    ) -> BulkWriteReport:
         return await self._engine.upsert_async(entries, replace)
 
     def delete(self, nodes: list[_T]) -> None:
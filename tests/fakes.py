@@ -0,0 +1,224 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any, cast
+
+from cognite.client import CogniteClient
+from cognite.client.data_classes.data_modeling import (
+    ContainerId,
+    EdgeApply,
+    MappedProperty,
+    NodeApply,
+    Space,
+    SpaceList,
+    View,
+    ViewId,
+)
+from cognite.client.data_classes.data_modeling.data_types import (
+    DirectRelation,
+    PropertyType,
+    Text,
+)
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+from cognite.client.data_classes.data_modeling.query import (
+    QueryResult as CogniteQueryResult,
+)
+
+from industrial_model import (
+    DataModelId,
+    Engine,
+    InstanceId,
+    ViewInstance,
+    WritableViewInstance,
+)
+
+QueryItems = dict[str, list[dict[str, Any]]]
+QueryCursors = dict[str, str | None]
+QueryHandler = Callable[[CogniteQuery], tuple[QueryItems, QueryCursors]]
+
+DATA_MODEL_ID = DataModelId(external_id="Model", space="space", version="v1")
+
+
+class Kind(ViewInstance):
+    code: str
+
+
+class Asset(ViewInstance):
+    name: str
+    kind: Kind | None = None
+
+
+class Pump(WritableViewInstance):
+    name: str
+
+    def edge_id_factory(
+        self, target_node: InstanceId, edge_type: InstanceId
+    ) -> InstanceId:
+        return target_node
+
+
+class FakeInstancesAPI:
+    def __init__(
+        self, query_handler: QueryHandler | None = None, delay: float = 0
+    ) -> None:
+        self.query_handler = query_handler
+        self.delay = delay
+        self.queries: list[CogniteQuery] = []
+        self.applied: list[list[NodeApply] | list[EdgeApply]] = []
+        self.deleted: list[list[tuple[str, str]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def query(self, query: CogniteQuery) -> CogniteQueryResult:
+        assert self.query_handler is not None
+        self.queries.append(query)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            items, cursors = self.query_handler(query)
+        finally:
+            self.in_flight -= 1
+        result_schema = query.instance_type_by_result_expression()
+        resource = {key: items.get(key, []) for key in result_schema}
+        return CogniteQueryResult.load(resource, result_schema, cursors)
+
+    async def apply(
+        self,
+        nodes: list[NodeApply] | None = None,
+        edges: list[EdgeApply] | None = None,
+        replace: bool = False,
+    ) -> None:
+        self.applied.append(nodes or edges or [])
+        await asyncio.sleep(self.delay)
+
+    async def delete(
+        self,
+        nodes: list[tuple[str, str]] | None = None,
+        edges: list[tuple[str, str]] | None = None,
+    ) -> None:
+        self.deleted.append(nodes or edges or [])
+        await asyncio.sleep(self.delay)
+
+
+class FakeSpacesAPI:
+    def __init__(self, spaces: list[str] | None = None) -> None:
+        self.spaces = spaces or []
+        self.calls = 0
+
+    async def list(self, limit: int) -> SpaceList:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return SpaceList([Space(space, False, 0, 0) for space in self.spaces])
+
+
+class FakeDataModelingAPI:
+    def __init__(self, instances: FakeInstancesAPI, spaces: FakeSpacesAPI) -> None:
+        self.instances = instances
+        self.spaces = spaces
+
+
+class FakeCogniteClient:
+    def __init__(
+        self, instances: FakeInstancesAPI, spaces: FakeSpacesAPI | None = None
+    ) -> None:
+        self.data_modeling = FakeDataModelingAPI(instances, spaces or FakeSpacesAPI())
+
+    def get_async_client(self) -> "FakeCogniteClient":
+        return self
+
+
+def generate_fake_engine(
+    views: list[View],
+    instances: FakeInstancesAPI,
+    spaces: FakeSpacesAPI | None = None,
+    **options: Any,
+) -> Engine:
+    engine = Engine(
+        cast(CogniteClient, FakeCogniteClient(instances, spaces)),
+        DATA_MODEL_ID,
+        **options,
+    )
+    engine._cognite_adapter._view_mapper._views_as_dict = {
+        view.external_id: view for view in views
+    }
+    return engine
+
+
+def view_id(model: type[ViewInstance]) -> ViewId:
+    return ViewId("space", model.get_view_external_id(), "v1")
+
+
+def view(model: type[ViewInstance], properties: dict[str, Any]) -> View:
+    return View(
+        space="space",
+        external_id=model.get_view_external_id(),
+        version="v1",
+        properties=properties,
+        last_updated_time=0,
+        created_time=0,
+        description=None,
+        name=None,
+        filter=None,
+        implements=None,
+        writable=True,
+        used_for="node",
+        is_global=False,
+    )
+
+
+def asset_views(
+    asset: type[ViewInstance] = Asset, **properties: MappedProperty
+) -> list[View]:
+    return [
+        view(
+            asset,
+            {
+                "name": mapped_property("name"),
+                "kind": mapped_property("kind", source=view_id(Kind)),
+                **properties,
+            },
+        ),
+        view(Kind, {"code": mapped_property("code")}),
+    ]
+
+
+def named_views(*models: type[ViewInstance]) -> list[View]:
+    return [view(model, {"name": mapped_property("name")}) for model in models]
+
+
+def mapped_property(
+    identifier: str,
+    type_: PropertyType | None = None,
+    source: ViewId | None = None,
+) -> MappedProperty:
+    return MappedProperty(
+        container=ContainerId("space", "container"),
+        container_property_identifier=identifier,
+        type=type_ or (DirectRelation() if source else Text()),
+        nullable=True,
+        immutable=False,
+        auto_increment=False,
+        source=source,
+    )
+
+
+def node(
+    external_id: str,
+    model: type[ViewInstance],
+    properties: dict[str, Any],
+    space: str = "space",
+    last_updated_time: int = 0,
+) -> dict[str, Any]:
+    return {
+        "instanceType": "node",
+        "space": space,
+        "externalId": external_id,
+        "version": 1,
+        "lastUpdatedTime": last_updated_time,
+        "createdTime": 0,
+        "properties": {
+            "space": {f"{model.get_view_external_id()}/v1": properties},
+        },
+    }
@@ -0,0 +1,134 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from cognite.client.exceptions import CogniteAPIError
+
+from industrial_model import BulkWriter, InstanceId, WritableViewInstance
+
+from .fakes import FakeInstancesAPI, generate_fake_engine, mapped_property, view
+
+
+class Pump(WritableViewInstance):
+    name: str
+
+    def edge_id_factory(
+        self, target_node: InstanceId, edge_type: InstanceId
+    ) -> InstanceId:
+        return target_node
+
+
+class _Sender:
+    def __init__(self, delay: float = 0.01, throttle: int = 0) -> None:
+        self.delay = delay
+        self.throttle = throttle
+        self.chunks: list[list[int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, chunk: list[int]) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.throttle:
+                self.throttle -= 1
+                raise CogniteAPIError("Too many requests", 429)
+            self.chunks.append(chunk)
+        finally:
+            self.in_flight -= 1
+
+
+def test_bulk_writer_sends_chunks_concurrently_and_reports_them() -> None:
+    sender = _Sender()
+    writer = BulkWriter(max_concurrency=3, max_chunk_size=10)
+
+    report = asyncio.run(writer.write("nodes", list(range(95)), sender))
+
+    assert sorted(item for chunk in sender.chunks for item in chunk) == list(range(95))
+    assert sender.max_in_flight == 3
+    assert report.items == 95
+    assert all(
+        chunk.phase == "nodes" and chunk.attempts == 1 for chunk in report.chunks
+    )
+    assert all(chunk.items <= 10 for chunk in report.chunks)
+    assert report.seconds >= max(chunk.seconds for chunk in report.chunks)
+
+
+def test_bulk_writer_limits_chunk_payload_bytes() -> None:
+    sender = _Sender(delay=0)
+    writer = BulkWriter(max_concurrency=1, max_chunk_bytes=25)
+
+    report = asyncio.run(writer.write("nodes", list(range(10)), sender, lambda _: 10))
+
+    assert [len(chunk) for chunk in sender.chunks] == [2, 2, 2, 2, 2]
+    assert [chunk.payload_bytes for chunk in report.chunks] == [20] * 5
+
+
+def test_bulk_writer_shrinks_chunks_and_retries_when_throttled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+    sender = _Sender(delay=0, throttle=2)
+    writer = BulkWriter(max_concurrency=1, max_chunk_size=8)
+
+    report = asyncio.run(writer.write("edges", list(range(8)), sender))
+
+    assert sender.chunks[0] == [0, 1]
+    assert report.chunks[0].attempts == 3
+    assert sorted(item for chunk in sender.chunks for item in chunk) == list(range(8))
+
+
+def test_bulk_writer_shrinks_chunks_on_slow_responses() -> None:
+    writer = BulkWriter(max_concurrency=1, max_chunk_size=100, target_latency=0.001)
+
+    asyncio.run(writer.write("nodes", list(range(100)), _Sender(delay=0.01)))
+
+    assert writer.chunk_size == 75
+
+
+def test_bulk_writer_write_stream_pulls_batches_at_write_speed() -> None:
+    sender = _Sender(delay=0.001)
+    writer = BulkWriter(max_concurrency=1, max_chunk_size=10)
+    backlog: list[int] = []
+
+    async def batches() -> AsyncIterator[list[int]]:
+        for start in range(0, 100, 10):
+            backlog.append(start - sum(len(chunk) for chunk in sender.chunks))
+            yield list(range(start, start + 10))
+
+    report = asyncio.run(writer.write_stream("nodes_to_delete", batches(), sender))
+
+    assert report.items == 100
+    assert sorted(item for chunk in sender.chunks for item in chunk) == list(range(100))
+    assert max(backlog) <= 20
+
+
+def test_bulk_writer_raises_other_errors() -> None:
+    async def send(chunk: list[int]) -> None:
+        raise CogniteAPIError("Bad request", 400)
+
+    with pytest.raises(CogniteAPIError, match="Bad request"):
+        asyncio.run(BulkWriter().write("nodes", [1, 2, 3], send))
+
+
+def test_engine_upsert_returns_report_per_phase() -> None:
+    instances = FakeInstancesAPI()
+    engine = generate_fake_engine(
+        [view(Pump, {"name": mapped_property("name")})], instances
+    )
+    pumps = [
+        Pump(external_id=f"pump-{index}", space="instances", name=f"pump-{index}")
+        for index in range(2_500)
+    ]
+
+    report = engine.upsert(pumps)
+
+    assert report.items == 2_500
+    assert {chunk.phase for chunk in report.chunks} == {"nodes"}
+    assert sorted(len(chunk) for chunk in instances.applied) == [500, 1_000, 1_000]
+    assert all(chunk.payload_bytes > 0 for chunk in report.chunks)
+
+
+async def _no_sleep(delay: float) -> None:
+    return None
@@ -0,0 +1,138 @@
+import pytest
+from cognite.client.data_classes.data_modeling import NodeApply
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+
+from industrial_model import InstanceId, ViewInstanceConfig, select
+
+from .fakes import (
+    FakeInstancesAPI,
+    Pump,
+    QueryCursors,
+    QueryItems,
+    generate_fake_engine,
+    mapped_property,
+    node,
+    view,
+    view_id,
+)
+
+
+class TrackedPump(Pump):
+    view_config = ViewInstanceConfig(view_external_id="Pump")
+
+    tags: list[str] = []
+    location: InstanceId | None = None
+
+
+_VIEWS = [
+    view(
+        TrackedPump,
+        {
+            "name": mapped_property("name"),
+            "tags": mapped_property("tags"),
+            "location": mapped_property("location", source=view_id(TrackedPump)),
+        },
+    )
+]
+
+
+def _pumps_handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    pumps = [
+        node(
+            f"pump-{index}",
+            TrackedPump,
+            {
+                "name": f"pump-{index}",
+                "tags": ["a"],
+                "location": {"space": "instances", "externalId": "site"},
+            },
+            space="instances",
+        )
+        for index in range(3)
+    ]
+    return {"Pump": pumps}, {"Pump": None}
+
+
+def _applied_properties(instances: FakeInstancesAPI) -> dict[str, dict[str, object]]:
+    return {
+        item.external_id: dict(item.sources[0].properties)
+        for chunk in instances.applied
+        for item in chunk
+        if isinstance(item, NodeApply)
+    }
+
+
+def test_only_changed_upsert_sends_changed_properties_only() -> None:
+    instances = FakeInstancesAPI(_pumps_handler)
+    engine = generate_fake_engine(_VIEWS, instances, track_changes=True)
+    pumps = engine.query(select(TrackedPump)).data
+
+    pumps[0].name = "renamed"
+    pumps[2].tags.append("b")
+    pumps[1].location = InstanceId(external_id="site", space="instances")
+
+    report = engine.upsert(pumps, only_changed=True)
+
+    assert report.items == 2
+    assert _applied_properties(instances) == {
+        "pump-0": {"name": "renamed"},
+        "pump-2": {"tags": ["a", "b"]},
+    }
+
+
+def test_only_changed_upsert_snapshots_written_values() -> None:
+    instances = FakeInstancesAPI(_pumps_handler)
+    engine = generate_fake_engine(_VIEWS, instances, track_changes=True)
+    pumps = engine.query(select(TrackedPump)).data
+
+    pumps[0].name = "renamed"
+    engine.upsert(pumps, only_changed=True)
+    instances.applied.clear()
+
+    assert engine.upsert(pumps, only_changed=True).items == 0
+    assert instances.applied == []
+
+
+def test_only_changed_upsert_writes_untracked_instances() -> None:
+    instances = FakeInstancesAPI(_pumps_handler)
+    pumps = generate_fake_engine(_VIEWS, instances).query(select(TrackedPump)).data
+
+    generate_fake_engine(_VIEWS, instances, track_changes=True).upsert(
+        pumps, only_changed=True
+    )
+
+    applied = _applied_properties(instances)
+    assert len(applied) == 3
+    assert set(applied["pump-1"]) == {"name", "tags", "location"}
+
+
+def test_only_changed_upsert_rejects_replace() -> None:
+    engine = generate_fake_engine(
+        _VIEWS, FakeInstancesAPI(_pumps_handler), track_changes=True
+    )
+
+    with pytest.raises(ValueError, match="only_changed cannot be combined"):
+        engine.upsert([], replace=True, only_changed=True)
+
+
+def test_changed_fields_without_snapshot_is_none() -> None:
+    pump = TrackedPump(external_id="pump", space="instances", name="pump")
+
+    assert pump.get_changed_fields() is None
+    pump.take_snapshot()
+    assert pump.get_changed_fields() == set()
+    pump.tags.append("x")
+    assert pump.get_changed_fields() == {"tags"}
+
+
+def test_trusted_instances_are_tracked() -> None:
+    instances = FakeInstancesAPI(_pumps_handler)
+    engine = generate_fake_engine(_VIEWS, instances, track_changes=True)
+    pumps = engine.query(select(TrackedPump), validation_mode="trusted").data
+
+    pumps[1].name = "renamed"
+    engine.upsert(pumps, only_changed=True)
+
+    assert _applied_properties(instances) == {"pump-1": {"name": "renamed"}}
@@ -0,0 +1,99 @@
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+
+from industrial_model import ViewInstance, ViewInstanceConfig, select
+from industrial_model.cognite_adapters import utils
+from industrial_model.constants import NESTED_SEP
+
+from .fakes import (
+    Asset,
+    FakeInstancesAPI,
+    Kind,
+    QueryCursors,
+    QueryItems,
+    asset_views,
+    generate_fake_engine,
+    mapped_property,
+    named_views,
+    node,
+    view_id,
+)
+
+KIND_KEY = f"Asset{NESTED_SEP}kind"
+OWNER_KEY = f"Asset{NESTED_SEP}owner"
+
+
+class Owner(ViewInstance):
+    name: str
+
+
+class OwnedAsset(Asset):
+    view_config = ViewInstanceConfig(view_external_id="Asset")
+
+    owner: Owner | None = None
+
+
+def _relation(external_id: str) -> dict[str, str]:
+    return {"space": "space", "externalId": external_id}
+
+
+_ASSETS = [
+    node(
+        f"asset-{index}",
+        OwnedAsset,
+        {
+            "name": f"asset-{index}",
+            "kind": _relation(f"kind-{index}"),
+            "owner": _relation(f"owner-{index}"),
+        },
+    )
+    for index in range(3)
+]
+_KINDS = [node(f"kind-{index}", Kind, {"code": str(index)}) for index in range(3)]
+_OWNERS = [node(f"owner-{index}", Owner, {"name": str(index)}) for index in range(3)]
+
+
+def _handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    if query.cursors.get(KIND_KEY):
+        return {"Asset": _ASSETS, KIND_KEY: _KINDS[2:]}, {}
+    if query.cursors.get(OWNER_KEY):
+        return {"Asset": _ASSETS, OWNER_KEY: _OWNERS[2:]}, {}
+    return (
+        {"Asset": _ASSETS, KIND_KEY: _KINDS[:2], OWNER_KEY: _OWNERS[:2]},
+        {KIND_KEY: "kind-cursor", OWNER_KEY: "owner-cursor"},
+    )
+
+
+def test_sibling_relation_pages_are_queried_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(utils, "MAX_LIMIT", 2)
+    instances = FakeInstancesAPI(_handler, delay=0.01)
+    engine = generate_fake_engine(
+        [
+            *asset_views(
+                OwnedAsset, owner=mapped_property("owner", source=view_id(Owner))
+            ),
+            *named_views(Owner),
+        ],
+        instances,
+    )
+
+    result = engine.query(select(OwnedAsset).limit(10)).data
+
+    assert [(item.kind, item.owner) for item in result] == [
+        (
+            Kind(external_id=f"kind-{index}", space="space", code=str(index)),
+            Owner(external_id=f"owner-{index}", space="space", name=str(index)),
+        )
+        for index in range(3)
+    ]
+    dependency_queries = instances.queries[1:]
+    assert len(dependency_queries) == 2
+    assert {frozenset(query.with_) for query in dependency_queries} == {
+        frozenset({"Asset", KIND_KEY}),
+        frozenset({"Asset", OWNER_KEY}),
+    }
+    assert instances.max_in_flight == 2
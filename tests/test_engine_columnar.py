@@ -0,0 +1,145 @@
+import sys
+
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+
+from industrial_model import InstanceId, ViewInstance, ViewInstanceConfig, select
+from industrial_model.engines.columnar import ColumnBuilder
+
+from .fakes import (
+    Asset,
+    FakeInstancesAPI,
+    Kind,
+    QueryCursors,
+    QueryItems,
+    asset_views,
+    generate_fake_engine,
+    mapped_property,
+    node,
+    view_id,
+)
+
+
+class SiteAsset(Asset):
+    view_config = ViewInstanceConfig(view_external_id="Asset")
+
+    tags: list[str] = []
+    site: InstanceId | None = None
+
+
+_VIEWS = asset_views(
+    SiteAsset,
+    tags=mapped_property("tags"),
+    site=mapped_property("site", source=view_id(Kind)),
+)
+
+
+def _handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    page = int(query.cursors["Asset"] or 0)
+    assets = [
+        node(
+            f"asset-{page}",
+            SiteAsset,
+            {
+                "name": f"asset-{page}",
+                "tags": ["a"],
+                "kind": {"space": "space", "externalId": "kind"},
+                "site": {"space": "space", "externalId": "site"},
+            },
+        )
+    ]
+    return (
+        {"Asset": assets, "Asset|kind": [node("kind", Kind, {"code": "K"})]},
+        {"Asset": "1" if page == 0 else None},
+    )
+
+
+def test_column_builder_flattens_relations_into_leaf_paths() -> None:
+    builder = ColumnBuilder(
+        select(SiteAsset).relation_mode(SiteAsset.kind, "instanceId")
+    )
+
+    builder.append(
+        [
+            {
+                "externalId": "a",
+                "space": "s",
+                "name": "a",
+                "tags": ["x"],
+                "kind": {"externalId": "k", "space": "s"},
+            },
+            {"externalId": "b", "space": "s", "name": "b", "tags": []},
+        ]
+    )
+
+    assert builder.columns == {
+        "externalId": ["a", "b"],
+        "kind|externalId": ["k", None],
+        "kind|space": ["s", None],
+        "name": ["a", "b"],
+        "site|externalId": [None, None],
+        "site|space": [None, None],
+        "space": ["s", "s"],
+        "tags": [["x"], []],
+    }
+
+
+def test_column_builder_collects_list_relations_per_path() -> None:
+    class Parent(ViewInstance):
+        children: list[Kind] = []
+
+    builder = ColumnBuilder(select(Parent))
+    builder.append(
+        [
+            {
+                "externalId": "p",
+                "space": "s",
+                "children": [{"code": "1"}, {"code": "2"}],
+            }
+        ]
+    )
+
+    assert builder.columns["children|code"] == [["1", "2"]]
+
+
+def test_column_builder_honours_projection() -> None:
+    builder = ColumnBuilder(select(SiteAsset).only(SiteAsset.name))
+
+    assert set(builder.columns) == {"externalId", "space", "name"}
+
+
+def test_query_to_arrow_reads_every_page() -> None:
+    pytest.importorskip("pyarrow")
+    instances = FakeInstancesAPI(_handler)
+
+    table = generate_fake_engine(_VIEWS, instances).query_to_arrow(
+        select(SiteAsset).limit(1)
+    )
+
+    assert table.num_rows == 2
+    assert table.column("name").to_pylist() == ["asset-0", "asset-1"]
+    assert table.column("kind|code").to_pylist() == ["K", "K"]
+    assert table.column("tags").to_pylist() == [["a"], ["a"]]
+
+
+def test_query_to_pandas_reads_every_page() -> None:
+    pytest.importorskip("pandas")
+    instances = FakeInstancesAPI(_handler)
+
+    frame = generate_fake_engine(_VIEWS, instances).query_to_pandas(
+        select(SiteAsset).limit(1)
+    )
+
+    assert list(frame["name"]) == ["asset-0", "asset-1"]
+    assert list(frame["site|externalId"]) == ["site", "site"]
+
+
+def test_query_to_arrow_requires_pyarrow(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    instances = FakeInstancesAPI(_handler)
+
+    with pytest.raises(ImportError, match=r"industrial-model\[arrow\]"):
+        generate_fake_engine(_VIEWS, instances).query_to_arrow(select(SiteAsset))
+    assert instances.queries == []
@@ -0,0 +1,102 @@
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+from cognite.client.data_classes.data_modeling.query import Select
+
+from industrial_model import BulkWriter, col, select
+
+from .fakes import (
+    Asset,
+    FakeInstancesAPI,
+    QueryCursors,
+    QueryItems,
+    asset_views,
+    generate_fake_engine,
+    node,
+)
+
+
+def _pages_handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    page = int(query.cursors["Asset"] or 0)
+    assets = [node(f"asset-{page}-{index}", Asset, {"name": "a"}) for index in range(3)]
+    return {"Asset": assets}, {"Asset": str(page + 1) if page < 3 else None}
+
+
+def test_delete_where_selects_ids_only_and_deletes_every_page() -> None:
+    instances = FakeInstancesAPI(_pages_handler)
+
+    report = generate_fake_engine(asset_views(), instances).delete_where(
+        select(Asset).where(col(Asset.name) == "a").limit(3)
+    )
+
+    assert report.items == 12
+    assert {chunk.phase for chunk in report.chunks} == {"nodes_to_delete"}
+    assert sorted(item for chunk in instances.deleted for item in chunk) == sorted(
+        ("space", f"asset-{page}-{index}") for page in range(4) for index in range(3)
+    )
+    assert len(instances.queries) == 4
+    assert all(set(query.with_) == {"Asset"} for query in instances.queries)
+    assert all(query.select == {"Asset": Select()} for query in instances.queries)
+
+
+def test_delete_where_deletes_while_reading_next_pages() -> None:
+    deleting = 0
+    queried_while_deleting: list[bool] = []
+
+    def handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+        queried_while_deleting.append(deleting > 0)
+        return _pages_handler(query)
+
+    instances = FakeInstancesAPI(handler, delay=0.01)
+    fake_delete = instances.delete
+
+    async def delete(
+        nodes: list[tuple[str, str]] | None = None,
+        edges: list[tuple[str, str]] | None = None,
+    ) -> None:
+        nonlocal deleting
+        deleting += 1
+        try:
+            await fake_delete(nodes, edges)
+        finally:
+            deleting -= 1
+
+    instances.delete = delete  # type: ignore[method-assign]
+    engine = generate_fake_engine(
+        asset_views(),
+        instances,
+        bulk_writer=BulkWriter(max_concurrency=4, max_chunk_size=1),
+    )
+
+    engine.delete_where(select(Asset).limit(3))
+
+    assert queried_while_deleting[1:] == [True, True, True]
+    assert len(instances.deleted) == 12
+
+
+def test_delete_where_without_matches_skips_deletes() -> None:
+    instances = FakeInstancesAPI(lambda query: ({"Asset": []}, {"Asset": None}))
+
+    report = generate_fake_engine(asset_views(), instances).delete_where(select(Asset))
+
+    assert report.items == 0
+    assert report.seconds == 0
+    assert instances.deleted == []
+
+
+def test_delete_where_raises_errors_from_deletes() -> None:
+    instances = FakeInstancesAPI(_pages_handler)
+
+    async def delete(
+        nodes: list[tuple[str, str]] | None = None,
+        edges: list[tuple[str, str]] | None = None,
+    ) -> None:
+        raise RuntimeError("delete failed")
+
+    instances.delete = delete  # type: ignore[method-assign]
+
+    with pytest.raises(RuntimeError, match="delete failed"):
+        generate_fake_engine(asset_views(), instances).delete_where(
+            select(Asset).limit(3)
+        )
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+
+from industrial_model import ViewInstance, ViewInstanceConfig, col, select
+
+from .fakes import (
+    FakeInstancesAPI,
+    QueryCursors,
+    QueryItems,
+    generate_fake_engine,
+    named_views,
+    node,
+)
+
+SPACES = ["site-a", "site-b", "site-c", "site-d"]
+
+
+class Pump(ViewInstance):
+    view_config = ViewInstanceConfig(instance_spaces=SPACES)
+
+    name: str
+
+
+def _query_space(query: CogniteQuery) -> str:
+    root_filter = query.with_["Pump"].dump()["nodes"]["filter"]
+    for entry in root_filter["and"]:
+        equals = entry.get("equals", {})
+        if list(equals.get("property", [])) == ["node", "space"]:
+            return str(equals["value"])
+    raise AssertionError(f"No space partition in {json.dumps(root_filter)}")
+
+
+def _partition_handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    space = _query_space(query)
+    cursor = query.cursors.get("Pump")
+    external_id = f"{space}-{'second' if cursor else 'first'}"
+    return (
+        {"Pump": [node(external_id, Pump, {"name": external_id}, space=space)]},
+        {"Pump": None if cursor else f"{space}-cursor"},
+    )
+
+
+def test_query_all_pages_partitioned_drains_one_cursor_chain_per_space() -> None:
+    instances = FakeInstancesAPI(_partition_handler, delay=0.01)
+    engine = generate_fake_engine(named_views(Pump), instances)
+
+    result = engine.query_all_pages_partitioned(
+        select(Pump).limit(1), max_concurrency=2
+    )
+
+    assert [item.external_id for item in result] == [
+        f"{space}-{page}" for space in SPACES for page in ("first", "second")
+    ]
+    assert len(instances.queries) == 8
+    assert instances.max_in_flight == 2
+
+
+def test_query_all_pages_partitioned_uses_explicit_space_filter() -> None:
+    instances = FakeInstancesAPI(_partition_handler)
+    engine = generate_fake_engine(named_views(Pump), instances)
+
+    result = engine.query_all_pages_partitioned(
+        select(Pump).where(col(Pump.space).in_(["site-b", "site-a"])).limit(1)
+    )
+
+    assert [item.space for item in result] == ["site-b", "site-b", "site-a", "site-a"]
+
+
+def test_query_all_pages_partitioned_rejects_invalid_concurrency() -> None:
+    engine = generate_fake_engine(
+        named_views(Pump), FakeInstancesAPI(_partition_handler)
+    )
+
+    with pytest.raises(ValueError, match="Max concurrency"):
+        engine.query_all_pages_partitioned(select(Pump), max_concurrency=0)
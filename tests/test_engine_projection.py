@@ -0,0 +1,99 @@
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+from pydantic import ValidationError
+
+from industrial_model import ViewInstanceConfig, select
+
+from .fakes import (
+    Asset,
+    FakeInstancesAPI,
+    Kind,
+    QueryCursors,
+    QueryHandler,
+    QueryItems,
+    asset_views,
+    generate_fake_engine,
+    mapped_property,
+    node,
+)
+
+
+class RatedAsset(Asset):
+    view_config = ViewInstanceConfig(view_external_id="Asset")
+
+    description: str
+    rating: int
+
+
+def _handler(name: object) -> QueryHandler:
+    def handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+        assets = [
+            node(
+                "asset",
+                RatedAsset,
+                {"name": name, "kind": {"space": "space", "externalId": "kind"}},
+            ),
+            node("other", RatedAsset, {"name": "other"}),
+        ]
+        return (
+            {"Asset": assets, "Asset|kind": [node("kind", Kind, {"code": "K"})]},
+            {},
+        )
+
+    return handler
+
+
+_VIEWS = asset_views(
+    RatedAsset,
+    description=mapped_property("description"),
+    rating=mapped_property("rating"),
+)
+
+
+def test_only_selects_requested_properties_and_relations() -> None:
+    instances = FakeInstancesAPI(_handler("pump"))
+
+    result = generate_fake_engine(_VIEWS, instances).query(
+        select(RatedAsset).only(RatedAsset.name, RatedAsset.kind)
+    )
+
+    (query,) = instances.queries
+    (source,) = query.select["Asset"].sources
+    assert sorted(source.properties or []) == ["kind", "name"]
+    assert set(query.with_) == {"Asset", "Asset|kind"}
+
+    asset, other = result.data
+    assert asset.name == "pump"
+    assert asset.kind == Kind(external_id="kind", space="space", code="K")
+    assert asset.model_fields_set == {"external_id", "space", "name", "kind"}
+    assert other.kind is None
+    with pytest.raises(AttributeError):
+        _ = asset.description
+
+
+def test_only_validates_each_selected_field() -> None:
+    engine = generate_fake_engine(
+        _VIEWS, FakeInstancesAPI(_handler(["not", "a", "name"]))
+    )
+    statement = select(RatedAsset).only(RatedAsset.name)
+
+    with pytest.raises(ValidationError):
+        engine.query(statement)
+
+    result = engine.query(statement, validation_mode="ignoreOnError")
+    assert [item.external_id for item in result.data] == ["other"]
+
+
+def test_only_projections_are_planned_separately() -> None:
+    instances = FakeInstancesAPI(lambda query: ({"Asset": []}, {}))
+    engine = generate_fake_engine(_VIEWS, instances)
+
+    engine.query(select(RatedAsset).only(RatedAsset.name))
+    engine.query(select(RatedAsset).only(RatedAsset.rating))
+
+    selected = [
+        query.select["Asset"].sources[0].properties for query in instances.queries
+    ]
+    assert selected == [["name"], ["rating"]]
@@ -0,0 +1,196 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    NodeResultSetExpression,
+)
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+
+from industrial_model import (
+    InstanceId,
+    JsonSyncStateStore,
+    SqliteSyncStateStore,
+    SyncState,
+    SyncStateStore,
+    col,
+    select,
+)
+
+from .fakes import (
+    FakeInstancesAPI,
+    Pump,
+    QueryCursors,
+    QueryItems,
+    generate_fake_engine,
+    named_views,
+    node,
+)
+
+
+class _MemoryStore(SyncStateStore):
+    def __init__(self) -> None:
+        self.states: dict[str, SyncState] = {}
+
+    def read(self, key: str) -> SyncState | None:
+        return self.states.get(key)
+
+    def write(self, key: str, state: SyncState) -> None:
+        self.states[key] = state
+
+
+def _handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    pumps = [
+        node(f"pump-{index}", Pump, {"name": "pump"}, last_updated_time=time)
+        for index, time in enumerate([100, 300, 200])
+    ]
+    return {"Pump": pumps}, {"Pump": None}
+
+
+def _range_handler(
+    updated_times: dict[str, int],
+) -> Callable[[CogniteQuery], tuple[QueryItems, QueryCursors]]:
+    # applies the lastUpdatedTime range filter like CDF does
+    def handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+        since = _updated_since(query)
+        pumps = [
+            node(external_id, Pump, {"name": "pump"}, last_updated_time=time)
+            for external_id, time in sorted(
+                updated_times.items(), key=lambda item: item[1]
+            )
+            if since is None or time >= since
+        ]
+        return {"Pump": pumps}, {"Pump": None}
+
+    return handler
+
+
+def _root(query: CogniteQuery) -> NodeResultSetExpression:
+    root = query.with_["Pump"]
+    assert isinstance(root, NodeResultSetExpression)
+    return root
+
+
+def _updated_since(query: CogniteQuery) -> int | None:
+    root_filter = _root(query).filter
+    assert root_filter is not None
+    for item in root_filter.dump().get("and", []):
+        range_ = item.get("range", {})
+        if range_.get("property") == ("node", "lastUpdatedTime"):
+            return int(range_["gte"])
+    return None
+
+
+def test_query_changes_stores_watermark_and_filters_next_sync() -> None:
+    updated_times = {"pump-0": 100, "pump-1": 300, "pump-2": 200}
+    instances = FakeInstancesAPI(_range_handler(updated_times))
+    store = _MemoryStore()
+    engine = generate_fake_engine(named_views(Pump), instances, sync_state_store=store)
+    statement = select(Pump).where(col(Pump.name) == "pump")
+
+    first = engine.query_changes(statement)
+    second = engine.query_changes(statement)
+
+    assert len(first.data) == 3
+    assert first.watermark == 300
+    assert store.states == {
+        first.key: SyncState(
+            watermark=300,
+            instance_ids=[InstanceId(external_id="pump-1", space="space")],
+        )
+    }
+    assert second.key == first.key
+    assert second.data == []
+
+    first_query, second_query = instances.queries
+    assert "lastUpdatedTime" not in str(_root(first_query).filter)
+    assert {"range": {"property": ("node", "lastUpdatedTime"), "gte": 300}} in (
+        _root(second_query).filter.dump()["and"]  # type: ignore[union-attr]
+    )
+    assert [(item.property, item.direction) for item in _root(second_query).sort] == [
+        (("node", "lastUpdatedTime"), "ascending")
+    ]
+    assert statement.get_values().sort_clauses == []
+
+
+def test_query_changes_without_commit_leaves_watermark() -> None:
+    store = _MemoryStore()
+    engine = generate_fake_engine(
+        named_views(Pump), FakeInstancesAPI(_handler), sync_state_store=store
+    )
+
+    result = engine.query_changes(select(Pump), key="pumps", commit=False)
+
+    assert result.key == "pumps"
+    assert result.watermark == 300
+    assert store.states == {}
+
+
+def test_query_changes_keeps_watermark_without_changes() -> None:
+    store = _MemoryStore()
+    updated_times = {"pump-1": 100, "pump-2": 500, "pump-3": 500}
+    engine = generate_fake_engine(
+        named_views(Pump),
+        FakeInstancesAPI(_range_handler(updated_times)),
+        sync_state_store=store,
+    )
+
+    first = engine.query_changes(select(Pump), key="pumps")
+    second = engine.query_changes(select(Pump), key="pumps")
+
+    assert [item.external_id for item in first.data] == ["pump-1", "pump-2", "pump-3"]
+    assert second.data == []
+    assert second.watermark == 500
+    assert second.state == first.state
+
+
+def test_query_changes_returns_new_instances_at_the_watermark() -> None:
+    store = _MemoryStore()
+    updated_times = {"pump-1": 100, "pump-2": 500}
+    engine = generate_fake_engine(
+        named_views(Pump),
+        FakeInstancesAPI(_range_handler(updated_times)),
+        sync_state_store=store,
+    )
+    engine.query_changes(select(Pump), key="pumps")
+
+    updated_times |= {"pump-1": 500, "pump-3": 700}
+    second = engine.query_changes(select(Pump), key="pumps")
+    third = engine.query_changes(select(Pump), key="pumps")
+
+    assert [item.external_id for item in second.data] == ["pump-1", "pump-3"]
+    assert second.state == SyncState(
+        watermark=700, instance_ids=[InstanceId(external_id="pump-3", space="space")]
+    )
+    assert third.data == []
+
+
+def test_query_changes_requires_state_store() -> None:
+    engine = generate_fake_engine(named_views(Pump), FakeInstancesAPI(_handler))
+
+    with pytest.raises(ValueError, match="requires an engine sync_state_store"):
+        engine.query_changes(select(Pump))
+
+
+@pytest.mark.parametrize("store_type", [JsonSyncStateStore, SqliteSyncStateStore])
+def test_sync_state_stores_persist_watermarks(
+    tmp_path: Path, store_type: type[JsonSyncStateStore | SqliteSyncStateStore]
+) -> None:
+    path = tmp_path / "state" / "sync.db"
+    path.parent.mkdir()
+    store = store_type(path)
+
+    pumps = SyncState(
+        watermark=200, instance_ids=[InstanceId(external_id="pump", space="space")]
+    )
+
+    assert store.read("pumps") is None
+    store.write("pumps", SyncState(watermark=100))
+    store.write("pumps", pumps)
+    store.write("valves", SyncState(watermark=50))
+
+    reopened = store_type(path)
+    assert reopened.read("pumps") == pumps
+    assert reopened.read("valves") == SyncState(watermark=50)
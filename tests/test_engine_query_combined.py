@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+
+from industrial_model import col, select
+from industrial_model.cognite_adapters import utils
+from industrial_model.constants import NESTED_SEP
+
+from .fakes import (
+    Asset,
+    FakeInstancesAPI,
+    Kind,
+    QueryCursors,
+    QueryItems,
+    asset_views,
+    generate_fake_engine,
+    node,
+)
+
+ASSET_KEY = "s0_Asset"
+KIND_KEY = f"{ASSET_KEY}{NESTED_SEP}kind"
+OTHER_KIND_KEY = "s1_Kind"
+
+
+_ASSETS = [
+    node(
+        f"asset-{index}",
+        Asset,
+        {
+            "name": f"asset-{index}",
+            "kind": {"space": "space", "externalId": f"kind-{index}"},
+        },
+    )
+    for index in range(3)
+]
+_KINDS = [node(f"kind-{index}", Kind, {"code": str(index)}) for index in range(3)]
+_KINDS_AS_MODELS = [
+    Kind(external_id=f"kind-{index}", space="space", code=str(index))
+    for index in range(3)
+]
+
+
+def _handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    if query.cursors.get(KIND_KEY):
+        return {ASSET_KEY: _ASSETS, KIND_KEY: _KINDS[2:]}, {}
+    return (
+        {ASSET_KEY: _ASSETS, KIND_KEY: _KINDS[:2], OTHER_KIND_KEY: _KINDS[:2]},
+        {
+            ASSET_KEY: "asset-cursor",
+            KIND_KEY: "kind-cursor",
+            OTHER_KIND_KEY: "other-kind-cursor",
+        },
+    )
+
+
+def test_query_combined_sends_one_query_and_splits_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(utils, "MAX_LIMIT", 2)
+    instances = FakeInstancesAPI(_handler)
+    engine = generate_fake_engine(asset_views(), instances)
+
+    assets, kinds = engine.query_combined(
+        [
+            select(Asset).limit(3),
+            select(Kind).where(col(Kind.code) == "0").limit(2),
+        ]
+    )
+
+    assert [item.kind for item in assets.data] == _KINDS_AS_MODELS
+    assert assets.has_next_page
+    assert assets.next_cursor is None
+    assert [item.external_id for item in kinds.data] == ["kind-0", "kind-1"]
+    assert kinds.has_next_page
+    assert kinds.next_cursor is None
+
+    root_query, dependency_query = instances.queries
+    assert set(root_query.with_) == {ASSET_KEY, KIND_KEY, OTHER_KIND_KEY}
+    assert set(dependency_query.with_) == {ASSET_KEY, KIND_KEY}
+    assert dependency_query.cursors == {ASSET_KEY: None, KIND_KEY: "kind-cursor"}
+
+
+def test_query_combined_async_without_statements_skips_query() -> None:
+    instances = FakeInstancesAPI(_handler)
+    engine = generate_fake_engine([], instances)
+
+    assert asyncio.run(engine.query_combined_async([])) == []
+    assert instances.queries == []
@@ -0,0 +1,89 @@
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+from cognite.client.data_classes.data_modeling.query import Select
+
+from industrial_model import (
+    InstanceId,
+    ResultCache,
+    col,
+    select,
+    select_ids,
+)
+
+from .fakes import (
+    Asset,
+    FakeInstancesAPI,
+    QueryCursors,
+    QueryItems,
+    asset_views,
+    generate_fake_engine,
+    node,
+)
+
+
+def _pages_handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    page = int(query.cursors["Asset"] or 0)
+    assets = [node(f"asset-{page}-{index}", Asset, {}) for index in range(2)]
+    return {"Asset": assets}, {"Asset": str(page + 1) if page < 2 else None}
+
+
+def test_query_ids_returns_one_page_of_instance_ids() -> None:
+    instances = FakeInstancesAPI(_pages_handler)
+
+    result = generate_fake_engine(asset_views(), instances).query_ids(
+        select_ids(Asset).where(col(Asset.name) == "a").limit(2)
+    )
+
+    assert result.data == [
+        InstanceId(external_id="asset-0-0", space="space"),
+        InstanceId(external_id="asset-0-1", space="space"),
+    ]
+    assert result.next_cursor == "1"
+    assert result.has_next_page
+    (query,) = instances.queries
+    assert set(query.with_) == {"Asset"}
+    assert query.select == {"Asset": Select()}
+
+
+def test_query_all_ids_reads_every_page() -> None:
+    instances = FakeInstancesAPI(_pages_handler)
+
+    ids = generate_fake_engine(asset_views(), instances).query_all_ids(
+        select_ids(Asset).limit(2)
+    )
+
+    assert [item.external_id for item in ids] == [
+        f"asset-{page}-{index}" for page in range(3) for index in range(2)
+    ]
+    assert len(instances.queries) == 3
+
+
+def test_query_all_ids_results_are_cached() -> None:
+    instances = FakeInstancesAPI(_pages_handler)
+    engine = generate_fake_engine(asset_views(), instances, result_cache=ResultCache())
+
+    first = engine.query_all_ids(select_ids(Asset).limit(2))
+    second = engine.query_all_ids(select_ids(Asset).limit(2))
+
+    assert first == second
+    assert len(instances.queries) == 3
+
+
+def test_id_only_statements_are_rejected_by_model_queries() -> None:
+    engine = generate_fake_engine(asset_views(), FakeInstancesAPI(_pages_handler))
+
+    with pytest.raises(ValueError, match="should be run with query_ids"):
+        engine.query(select_ids(Asset))
+
+
+def test_query_ids_accepts_model_statements() -> None:
+    instances = FakeInstancesAPI(_pages_handler)
+
+    result = generate_fake_engine(asset_views(), instances).query_ids(
+        select(Asset).limit(2)
+    )
+
+    assert len(result.data) == 2
+    assert instances.queries[0].select == {"Asset": Select()}
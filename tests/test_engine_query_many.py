@@ -0,0 +1,84 @@
+import asyncio
+from typing import Any
+
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+
+from industrial_model import (
+    ViewInstance,
+    ViewInstanceConfig,
+    col,
+    select,
+)
+from industrial_model.statements import Statement
+
+from .fakes import (
+    FakeInstancesAPI,
+    FakeSpacesAPI,
+    QueryCursors,
+    QueryItems,
+    generate_fake_engine,
+    named_views,
+    node,
+)
+
+
+class Pump(ViewInstance):
+    view_config = ViewInstanceConfig(instance_spaces_prefix="site-")
+
+    name: str
+
+
+class Valve(ViewInstance):
+    name: str
+
+
+def _handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    (root,) = query.with_
+    model = Pump if root == "Pump" else Valve
+    return (
+        {root: [node(f"{root}-{len(query.with_)}", model, {"name": root})]},
+        {root: None},
+    )
+
+
+def test_query_many_returns_results_in_statement_order() -> None:
+    instances = FakeInstancesAPI(_handler, delay=0.01)
+    spaces = FakeSpacesAPI(["site-a", "other"])
+    engine = generate_fake_engine(named_views(Pump, Valve), instances, spaces)
+
+    statements: list[Statement[Any]] = [
+        select(Valve),
+        select(Pump),
+        select(Valve).where(col(Valve.name) == "valve"),
+        select(Pump).limit(5),
+    ]
+    results = engine.query_many(statements, max_concurrency=2)
+
+    assert [type(result.data[0]) for result in results] == [Valve, Pump, Valve, Pump]
+    assert len(instances.queries) == 4
+    assert instances.max_in_flight == 2
+    assert spaces.calls == 1
+
+
+def test_query_many_async_runs_statements_concurrently() -> None:
+    instances = FakeInstancesAPI(_handler, delay=0.01)
+    engine = generate_fake_engine(named_views(Pump, Valve), instances, FakeSpacesAPI())
+
+    results = asyncio.run(
+        engine.query_many_async([select(Valve) for _ in range(5)], max_concurrency=5)
+    )
+
+    assert len(results) == 5
+    assert instances.max_in_flight == 5
+
+
+def test_query_many_rejects_invalid_concurrency() -> None:
+    engine = generate_fake_engine(
+        named_views(Pump, Valve), FakeInstancesAPI(_handler), FakeSpacesAPI()
+    )
+
+    with pytest.raises(ValueError, match="greater than 0"):
+        engine.query_many([select(Valve)], max_concurrency=0)
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+
+from industrial_model import select
+
+from .fakes import (
+    FakeInstancesAPI,
+    Pump,
+    QueryCursors,
+    QueryItems,
+    generate_fake_engine,
+    named_views,
+    node,
+)
+
+_PAGES: dict[str | None, tuple[list[str], str | None]] = {
+    None: (["pump-1", "pump-2"], "cursor-1"),
+    "cursor-1": (["pump-3", "pump-4"], "cursor-2"),
+    "cursor-2": (["pump-5"], None),
+}
+
+
+def _pages_handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    external_ids, next_cursor = _PAGES[query.cursors.get("Pump")]
+    return (
+        {"Pump": [node(item, Pump, {"name": item}) for item in external_ids]},
+        {"Pump": next_cursor},
+    )
+
+
+def test_stream_async_yields_validated_pages_per_query() -> None:
+    instances = FakeInstancesAPI(_pages_handler)
+    engine = generate_fake_engine(named_views(Pump), instances)
+
+    async def run() -> list[list[str]]:
+        pages: list[list[str]] = []
+        async for page in engine.stream_async(select(Pump).limit(2)):
+            assert all(isinstance(item, Pump) for item in page)
+            pages.append([item.name for item in page])
+            assert len(instances.queries) == len(pages)
+        return pages
+
+    assert asyncio.run(run()) == [
+        ["pump-1", "pump-2"],
+        ["pump-3", "pump-4"],
+        ["pump-5"],
+    ]
+
+
+def test_iter_pages_stops_requesting_when_consumer_breaks() -> None:
+    instances = FakeInstancesAPI(_pages_handler)
+    engine = generate_fake_engine(named_views(Pump), instances)
+
+    for page in engine.iter_pages(select(Pump).limit(2)):
+        assert [item.external_id for item in page] == ["pump-1", "pump-2"]
+        break
+
+    assert len(instances.queries) == 1
+
+
+def test_iter_pages_runs_inside_running_event_loop() -> None:
+    engine = generate_fake_engine(named_views(Pump), FakeInstancesAPI(_pages_handler))
+
+    async def run() -> list[int]:
+        return [len(page) for page in engine.iter_pages(select(Pump).limit(2))]
+
+    assert asyncio.run(run()) == [2, 2, 1]
+    engine.close()
+
+
+def test_stream_async_prefetches_next_page_while_current_is_consumed() -> None:
+    instances = FakeInstancesAPI(_pages_handler)
+    engine = generate_fake_engine(named_views(Pump), instances)
+
+    async def run() -> list[int]:
+        requested: list[int] = []
+        async for _ in engine.stream_async(select(Pump).limit(2), prefetch_depth=1):
+            await asyncio.sleep(0)
+            requested.append(len(instances.queries))
+        return requested
+
+    assert asyncio.run(run()) == [2, 3, 3]
+    assert [query.cursors["Pump"] for query in instances.queries] == [
+        None,
+        "cursor-1",
+        "cursor-2",
+    ]
+
+
+def test_query_all_pages_with_prefetch_keeps_page_order() -> None:
+    engine = generate_fake_engine(named_views(Pump), FakeInstancesAPI(_pages_handler))
+
+    result = engine.query_all_pages(select(Pump).limit(2), prefetch_depth=2)
+
+    assert [item.external_id for item in result] == [
+        "pump-1",
+        "pump-2",
+        "pump-3",
+        "pump-4",
+        "pump-5",
+    ]
+
+
+def test_query_all_pages_rejects_negative_prefetch_depth() -> None:
+    engine = generate_fake_engine(named_views(Pump), FakeInstancesAPI(_pages_handler))
+
+    with pytest.raises(ValueError, match="Prefetch depth"):
+        engine.query_all_pages(select(Pump), prefetch_depth=-1)
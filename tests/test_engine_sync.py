@@ -0,0 +1,125 @@
+import asyncio
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+
+from industrial_model import select
+from industrial_model.engines.event_loop import EventLoopThread
+
+from .fakes import (
+    FakeInstancesAPI,
+    Pump,
+    QueryCursors,
+    QueryItems,
+    generate_fake_engine,
+    named_views,
+    node,
+)
+
+
+class _LoopRecorder:
+    def __init__(self) -> None:
+        self.loops: list[asyncio.AbstractEventLoop] = []
+        self.threads: list[threading.Thread] = []
+
+    def __call__(self, query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+        self.loops.append(asyncio.get_running_loop())
+        self.threads.append(threading.current_thread())
+        return {"Pump": [node("pump-1", Pump, {"name": "pump"})]}, {"Pump": None}
+
+
+def test_sync_calls_reuse_one_background_loop() -> None:
+    recorder = _LoopRecorder()
+    engine = generate_fake_engine(named_views(Pump), FakeInstancesAPI(recorder))
+
+    for _ in range(3):
+        assert engine.query(select(Pump)).data[0].name == "pump"
+    list(engine.iter_pages(select(Pump)))
+
+    assert len(set(map(id, recorder.loops))) == 1
+    assert recorder.threads[0] is not threading.current_thread()
+    assert recorder.threads[0].daemon
+    engine.close()
+
+
+def test_close_stops_loop_thread_and_next_call_restarts_it() -> None:
+    recorder = _LoopRecorder()
+    with generate_fake_engine(named_views(Pump), FakeInstancesAPI(recorder)) as engine:
+        engine.query(select(Pump))
+    first_loop, first_thread = recorder.loops[0], recorder.threads[0]
+
+    assert first_loop.is_closed()
+    assert not first_thread.is_alive()
+
+    engine.query(select(Pump))
+    assert recorder.loops[1] is not first_loop
+    engine.close()
+    engine.close()
+
+
+def test_sync_calls_from_several_threads_share_the_loop() -> None:
+    recorder = _LoopRecorder()
+    engine = generate_fake_engine(named_views(Pump), FakeInstancesAPI(recorder))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: engine.query(select(Pump)), range(8)))
+
+    assert all(result.data[0].name == "pump" for result in results)
+    assert len(set(map(id, recorder.loops))) == 1
+    engine.close()
+
+
+def test_sync_calls_inside_running_event_loop_use_engine_loop() -> None:
+    recorder = _LoopRecorder()
+    engine = generate_fake_engine(named_views(Pump), FakeInstancesAPI(recorder))
+
+    async def run() -> asyncio.AbstractEventLoop:
+        assert engine.query(select(Pump)).data[0].name == "pump"
+        return asyncio.get_running_loop()
+
+    caller_loop = asyncio.run(run())
+    engine.query(select(Pump))
+
+    assert recorder.loops[0] is not caller_loop
+    assert recorder.loops[0] is recorder.loops[1]
+    engine.close()
+
+
+def test_sync_calls_reject_engine_event_loop() -> None:
+    engine = generate_fake_engine(named_views(Pump), FakeInstancesAPI(_LoopRecorder()))
+
+    async def run() -> None:
+        engine.query(select(Pump))
+
+    with pytest.raises(RuntimeError, match="engine event loop"):
+        engine._event_loop.run(run())
+    engine.close()
+
+
+def test_event_loop_thread_propagates_errors() -> None:
+    event_loop = EventLoopThread()
+
+    async def fail() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        event_loop.run(fail())
+    event_loop.close()
+
+
+def test_dropped_engine_stops_event_loop_thread() -> None:
+    recorder = _LoopRecorder()
+    engine = generate_fake_engine(named_views(Pump), FakeInstancesAPI(recorder))
+    engine.query(select(Pump))
+    (thread,) = set(recorder.threads)
+
+    del engine
+    gc.collect()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
@@ -0,0 +1,60 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from .fakes import FakeInstancesAPI, Pump, generate_fake_engine, named_views
+
+
+def _pumps(count: int, instances: FakeInstancesAPI, seen: list[int]) -> Iterator[Pump]:
+    for index in range(count):
+        # records how many chunks were written before this row was produced
+        seen.append(len(instances.applied))
+        yield Pump(external_id=f"pump-{index}", space="instances", name=f"pump-{index}")
+
+
+def test_upsert_stream_writes_batches_as_they_fill() -> None:
+    instances = FakeInstancesAPI()
+    seen: list[int] = []
+
+    report = generate_fake_engine(named_views(Pump), instances).upsert_stream(
+        _pumps(2_500, instances, seen), batch_size=1_000
+    )
+
+    assert report.items == 2_500
+    assert [len(chunk) for chunk in instances.applied] == [1_000, 1_000, 500]
+    assert seen[999] == 0
+    assert seen[1_000] == 1
+    assert seen[2_000] == 2
+
+
+def test_upsert_stream_async_accepts_async_iterables() -> None:
+    instances = FakeInstancesAPI()
+    seen: list[int] = []
+
+    async def pumps() -> AsyncIterator[Pump]:
+        for pump in _pumps(5, instances, seen):
+            yield pump
+
+    engine = generate_fake_engine(named_views(Pump), instances)
+
+    report = asyncio.run(engine.upsert_stream_async(pumps(), batch_size=2))
+
+    assert report.items == 5
+    assert [len(chunk) for chunk in instances.applied] == [2, 2, 1]
+    assert seen == [0, 0, 1, 1, 2]
+
+
+def test_upsert_stream_without_entries_skips_writes() -> None:
+    instances = FakeInstancesAPI()
+    engine = generate_fake_engine(named_views(Pump), instances)
+
+    assert engine.upsert_stream([]).items == 0
+    assert instances.applied == []
+
+
+def test_upsert_stream_rejects_invalid_batch_size() -> None:
+    engine = generate_fake_engine(named_views(Pump), FakeInstancesAPI())
+
+    with pytest.raises(ValueError, match="Batch size should be greater than 0"):
+        engine.upsert_stream([], batch_size=0)
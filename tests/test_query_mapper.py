@@ -1,5 +1,6 @@
-from typing import Any
+from typing import Any, cast
 
+from cognite.client import AsyncCogniteClient
 from cognite.client.data_classes.data_modeling import (
     ContainerId,
     MappedProperty,
@@ -13,7 +14,9 @@ from industrial_model.cognite_adapters.query_mapper import QueryMapper
 from industrial_model.cognite_adapters.view_mapper import ViewMapper
 from industrial_model.constants import NESTED_SEP
 from industrial_model.models import InstanceId, ViewInstance
-from industrial_model.statements import select
+from industrial_model.statements import col, select
+
+from .fakes import DATA_MODEL_ID
 
 
 class ParentType(ViewInstance):
@@ -32,6 +35,7 @@ class AssetWithRelations(ViewInstance):
 
 class FakeViewMapper(ViewMapper):
     def __init__(self, views: dict[str, View]) -> None:
+        super().__init__(cast(AsyncCogniteClient, None), DATA_MODEL_ID)
         self._views = views
 
     def get_view(self, view_external_id: str) -> View:
@@ -72,6 +76,84 @@ def test_query_mapper_keeps_nested_instance_id_reference_without_child_query() -
     assert _select_properties(query.select[parent_key]) == ["name", "type"]
 
 
+def test_query_mapper_reuses_plan_and_binds_root_values_per_call() -> None:
+    mapper = QueryMapper(_fake_view_mapper())
+    root = AssetWithRelations.get_view_external_id()
+    parent_key = f"{root}{NESTED_SEP}parent"
+
+    first = mapper.map(
+        select(AssetWithRelations).where(col(AssetWithRelations.external_id) == "a")
+    )
+    second = mapper.map(
+        select(AssetWithRelations)
+        .where(col(AssetWithRelations.external_id) == "b")
+        .limit(10)
+        .cursor("cursor")
+    )
+
+    assert second.with_[parent_key] is first.with_[parent_key]
+    assert second.select[root] is first.select[root]
+    assert second.with_ is not first.with_
+    assert second.with_[root].dump() != first.with_[root].dump()
+    assert second.cursors == {root: "cursor"}
+    assert list(second.with_) == list(first.with_)
+
+
+def test_query_mapper_plans_by_relation_modes() -> None:
+    mapper = QueryMapper(_fake_view_mapper())
+    root = AssetWithRelations.get_view_external_id()
+
+    mapper.map(select(AssetWithRelations))
+    query = mapper.map(
+        select(AssetWithRelations).relation_mode(
+            AssetWithRelations.parent, "instanceId"
+        )
+    )
+
+    assert f"{root}{NESTED_SEP}parent" not in query.with_
+    assert len(mapper._plans) == 2
+
+
+def test_query_mapper_plan_cache_is_bounded() -> None:
+    mapper = QueryMapper(_fake_view_mapper(), plan_cache_size=1)
+
+    mapper.map(select(AssetWithRelations))
+    mapper.map(select(ParentModel))
+    mapper.map(select(ParentModel))
+
+    assert [key[0] for key in mapper._plans] == [ParentModel]
+
+
+def test_query_mapper_combines_statements_under_namespaced_roots() -> None:
+    mapper = QueryMapper(_fake_view_mapper())
+    root = AssetWithRelations.get_view_external_id()
+
+    single = mapper.map(select(AssetWithRelations))
+    query, root_keys = mapper.map_combined(
+        [
+            select(AssetWithRelations).cursor("cursor"),
+            select(AssetWithRelations).relation_mode(
+                AssetWithRelations.parent, "instanceId"
+            ),
+            select(ParentType),
+        ]
+    )
+
+    assert root_keys == [f"s0_{root}", f"s1_{root}", "s2_ParentType"]
+    assert set(query.with_) == {
+        *(key.replace(root, root_keys[0], 1) for key in single.with_),
+        root_keys[1],
+        f"{root_keys[1]}{NESTED_SEP}assetType",
+        root_keys[2],
+    }
+    assert (
+        query.with_[f"{root_keys[0]}{NESTED_SEP}parent"].dump()["nodes"]["from"]
+        == root_keys[0]
+    )
+    assert query.cursors == dict(zip(root_keys, ["cursor", None, None], strict=True))
+    assert len(mapper._plans) == 4
+
+
 def _fake_view_mapper() -> FakeViewMapper:
     parent_id = _view_id(ParentModel)
     parent_type_id = _view_id(ParentType)
@@ -0,0 +1,74 @@
+from typing import Any, cast
+
+import pytest
+from cognite.client import AsyncCogniteClient
+from cognite.client.data_classes.data_modeling import Edge, Node
+
+from industrial_model import ViewInstance
+from industrial_model.cognite_adapters.query_result_mapper import QueryResultMapper
+from industrial_model.cognite_adapters.view_mapper import ViewMapper
+from industrial_model.constants import NESTED_SEP, ResultMappingMode
+
+from .fakes import DATA_MODEL_ID, mapped_property, node, view, view_id
+
+
+class Parent(ViewInstance):
+    name: str
+
+
+class Asset(ViewInstance):
+    name: str
+    parent: Parent | None = None
+
+
+class StaticViewMapper(ViewMapper):
+    def __init__(self) -> None:
+        super().__init__(cast(AsyncCogniteClient, None), DATA_MODEL_ID)
+        self._views_as_dict = {
+            "Asset": view(
+                Asset,
+                {
+                    "name": mapped_property("name"),
+                    "parent": mapped_property("parent", source=view_id(Parent)),
+                },
+            ),
+            "Parent": view(Parent, {"name": mapped_property("name")}),
+        }
+
+
+def _page() -> dict[str, list[Node | Edge]]:
+    asset = node(
+        "asset",
+        Asset,
+        {"name": "asset", "parent": {"space": "space", "externalId": "parent"}},
+    )
+    asset["type"] = {"space": "types", "externalId": "asset-type"}
+    asset["deletedTime"] = 10
+    return {
+        "Asset": [Node._load(asset)],
+        f"Asset{NESTED_SEP}parent": [
+            Node._load(node("parent", Parent, {"name": "parent"}))
+        ],
+    }
+
+
+def _map(mode: ResultMappingMode) -> list[dict[str, Any]]:
+    return QueryResultMapper(StaticViewMapper(), mode).map_nodes("Asset", _page())
+
+
+@pytest.mark.parametrize("mode", ["sdk", "direct"])
+def test_map_nodes_flattens_node_and_relation_properties(
+    mode: ResultMappingMode,
+) -> None:
+    (item,) = _map(mode)
+
+    assert item["externalId"] == "asset"
+    assert item["name"] == "asset"
+    assert item["type"] == {"space": "types", "externalId": "asset-type"}
+    assert item["deletedTime"] == 10
+    assert item["parent"]["name"] == "parent"
+    assert item["parent"]["_edges"] == {}
+
+
+def test_direct_result_mapping_matches_sdk_dump() -> None:
+    assert _map("direct") == _map("sdk")
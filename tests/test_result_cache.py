@@ -0,0 +1,217 @@
+import asyncio
+import time
+
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+from cognite.client.data_classes.data_modeling.query import (
+    QueryResult as CogniteQueryResult,
+)
+
+from industrial_model import (
+    ResultCache,
+    ViewInstance,
+    ViewInstanceConfig,
+    col,
+    search,
+    select,
+)
+
+from .fakes import (
+    FakeInstancesAPI,
+    Pump,
+    QueryCursors,
+    QueryItems,
+    generate_fake_engine,
+    named_views,
+    node,
+)
+
+
+class Valve(ViewInstance):
+    name: str
+
+
+class SitePump(ViewInstance):
+    view_config = ViewInstanceConfig(instance_spaces=["instances"])
+
+    name: str
+
+
+def _pumps_handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    pump = node("pump-1", Pump, {"name": "pump"}, space="instances")
+    return {"Pump": [pump]}, {"Pump": None}
+
+
+_VIEWS = named_views(Pump, Valve, SitePump)
+
+
+def _statement_key(cache: ResultCache, name: str) -> str:
+    return cache.get_key("query", select(Pump).where(col(Pump.name) == name))
+
+
+def test_result_cache_key_is_canonical_per_statement() -> None:
+    cache = ResultCache()
+
+    assert _statement_key(cache, "a") == _statement_key(cache, "a")
+    assert _statement_key(cache, "a") != _statement_key(cache, "b")
+    assert cache.get_key("query", select(Pump)) != cache.get_key(
+        "query_all_pages", select(Pump)
+    )
+    assert cache.get_key("query", select(Pump)) != cache.get_key(
+        "query", select(Pump).limit(10)
+    )
+    assert cache.get_key("search", search(Pump)) != cache.get_key(
+        "search", search(Pump).query_by("pump")
+    )
+
+
+def test_result_cache_returns_copies_and_counts_hits() -> None:
+    cache = ResultCache()
+    value = ([{"name": "pump", "tags": ["a"]}], None)
+    cache.put("key", "Pump", value)
+
+    first = cache.get("key")
+    assert first is not None
+    first[0][0]["tags"].append("b")
+
+    assert cache.get("key") == value
+    assert cache.get("missing") is None
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_result_cache_expires_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache = ResultCache(ttl=10)
+    cache.put("key", "Pump", [1])
+
+    now = 110.0
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_result_cache_evicts_least_recently_used_entries() -> None:
+    cache = ResultCache(max_entries=2)
+    cache.put("a", "Pump", [1])
+    cache.put("b", "Pump", [2])
+    cache.get("a")
+    cache.put("c", "Pump", [3])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [1]
+    assert cache.get("c") == [3]
+
+
+def test_result_cache_enforces_byte_limit() -> None:
+    cache = ResultCache(max_bytes=200)
+    cache.put("a", "Pump", "x" * 100)
+    cache.put("b", "Pump", "y" * 100)
+    cache.put("big", "Pump", "z" * 1_000)
+
+    assert cache.size_bytes <= 200
+    assert cache.get("a") is None
+    assert cache.get("b") == "y" * 100
+    assert cache.get("big") is None
+
+
+def test_result_cache_invalidates_by_view() -> None:
+    cache = ResultCache()
+    cache.put("pump", "Pump", [1])
+    cache.put("valve", "Valve", [2])
+
+    cache.invalidate(["Pump"])
+
+    assert cache.get("pump") is None
+    assert cache.get("valve") == [2]
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_engine_serves_repeated_queries_from_result_cache() -> None:
+    instances = FakeInstancesAPI(_pumps_handler)
+    cache = ResultCache()
+    engine = generate_fake_engine(_VIEWS, instances, result_cache=cache)
+
+    first = engine.query(select(Pump))
+    second = engine.query(select(Pump))
+    engine.query_all_pages(select(Pump))
+
+    assert len(instances.queries) == 2
+    assert second.data[0] is not first.data[0]
+    assert second.model_dump() == first.model_dump()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_engine_serves_sorted_queries_from_result_cache() -> None:
+    instances = FakeInstancesAPI(_pumps_handler)
+    cache = ResultCache()
+    engine = generate_fake_engine(_VIEWS, instances, result_cache=cache)
+
+    engine.query(select(Pump).asc(Pump.name))
+    engine.query(select(Pump).asc(Pump.name))
+
+    assert len(instances.queries) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_engine_reuses_statement_with_space_filter_from_result_cache() -> None:
+    instances = FakeInstancesAPI(lambda query: ({"SitePump": []}, {"SitePump": None}))
+    cache = ResultCache()
+    engine = generate_fake_engine(_VIEWS, instances, result_cache=cache)
+    statement = select(SitePump)
+
+    engine.query(statement)
+    engine.query(statement)
+
+    assert len(instances.queries) == 1
+    assert statement.get_values().where_clauses == []
+
+
+def test_engine_does_not_cache_results_fetched_during_a_write() -> None:
+    instances = FakeInstancesAPI(_pumps_handler)
+    cache = ResultCache()
+    engine = generate_fake_engine(_VIEWS, instances, result_cache=cache)
+    pump = Pump(external_id="pump-1", space="instances", name="pump")
+    release = asyncio.Event()
+    fake_query = instances.query
+
+    async def slow_query(query: CogniteQuery) -> CogniteQueryResult:
+        await release.wait()
+        return await fake_query(query)
+
+    instances.query = slow_query  # type: ignore[method-assign]
+
+    async def run() -> None:
+        stale_query = asyncio.create_task(engine.query_async(select(Pump)))
+        await asyncio.sleep(0)
+        await engine.upsert_async([pump])
+        release.set()
+        await stale_query
+        await engine.query_async(select(Pump))
+
+    asyncio.run(run())
+
+    assert len(instances.queries) == 2
+    assert cache.hits == 0
+
+
+def test_engine_write_invalidates_cached_results_of_same_view() -> None:
+    instances = FakeInstancesAPI(_pumps_handler)
+    cache = ResultCache()
+    engine = generate_fake_engine(_VIEWS, instances, result_cache=cache)
+    cache.put(cache.get_key("query", select(Valve)), "Valve", ([], None))
+
+    pumps = engine.query(select(Pump)).data
+    engine.upsert(pumps)
+    engine.query(select(Pump))
+
+    engine.delete(pumps)
+    engine.query(select(Pump))
+
+    assert len(instances.queries) == 3
+    assert cache.get(cache.get_key("query", select(Valve))) == ([], None)
@@ -1,3 +1,4 @@
+import pytest
 from pydantic import BaseModel
 
 from industrial_model.models import (
@@ -142,6 +143,42 @@ def test_build_relation_projection_omits_unspecified_relations() -> None:
     assert "AssetWithUnionParent|assetType|code" in schema
 
 
+def test_build_projection_keeps_selected_properties_and_their_relations() -> None:
+    schema = get_schema_properties(
+        AssetWithUnionParent,
+        SEP,
+        "AssetWithUnionParent",
+        {"parent": "instanceId"},
+        ["parent"],
+    )
+
+    assert sorted(schema) == [
+        "AssetWithUnionParent|externalId",
+        "AssetWithUnionParent|parent",
+        "AssetWithUnionParent|parent|externalId",
+        "AssetWithUnionParent|parent|space",
+        "AssetWithUnionParent|space",
+    ]
+
+
+def test_build_projection_accepts_field_names_and_aliases() -> None:
+    by_name = get_schema_properties(
+        AssetWithUnionParent, SEP, None, None, ["asset_type"]
+    )
+    by_alias = get_schema_properties(
+        AssetWithUnionParent, SEP, None, None, ["assetType"]
+    )
+
+    assert by_name == by_alias
+    assert "assetType|code" in by_name
+    assert "parent" not in by_name
+
+
+def test_build_projection_rejects_unknown_properties() -> None:
+    with pytest.raises(ValueError, match="Property missing not found"):
+        get_schema_properties(AssetWithUnionParent, SEP, None, None, ["missing"])
+
+
 def test_schema_properties_preserve_nested_paths_in_overlapping_unions() -> None:
     schema = get_schema_properties(AssetWithOverlappingUnion, SEP)
 
@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+from cognite.client.data_classes.data_modeling.query import (
+    Query as CogniteQuery,
+)
+
+from industrial_model import Engine, ViewInstanceConfig, col, select
+from industrial_model.cognite_adapters.single_flight import SingleFlight
+
+from .fakes import (
+    FakeInstancesAPI,
+    Pump,
+    QueryCursors,
+    QueryItems,
+    generate_fake_engine,
+    mapped_property,
+    node,
+    view,
+)
+
+
+class TaggedPump(Pump):
+    view_config = ViewInstanceConfig(view_external_id="Pump")
+
+    tags: list[str] = []
+
+
+_VIEWS = [
+    view(
+        TaggedPump,
+        {"name": mapped_property("name"), "tags": mapped_property("tags")},
+    )
+]
+
+
+def _pumps_handler(query: CogniteQuery) -> tuple[QueryItems, QueryCursors]:
+    pump = node("pump-1", TaggedPump, {"name": "pump", "tags": ["a"]})
+    return {"Pump": [pump]}, {"Pump": None}
+
+
+async def _query_concurrently(
+    engine: Engine, names: list[str]
+) -> list[list[TaggedPump]]:
+    results = await asyncio.gather(
+        *(
+            engine.query_async(select(TaggedPump).where(col(TaggedPump.name) == name))
+            for name in names
+        )
+    )
+    return [result.data for result in results]
+
+
+def test_identical_concurrent_queries_share_one_call() -> None:
+    instances = FakeInstancesAPI(_pumps_handler, delay=0.01)
+    engine = generate_fake_engine(_VIEWS, instances, coalesce_requests=True)
+
+    results = asyncio.run(_query_concurrently(engine, ["pump"] * 5))
+
+    assert len(instances.queries) == 1
+    assert all(result[0].name == "pump" for result in results)
+    results[0][0].tags.append("b")
+    assert results[1][0].tags == ["a"]
+
+
+def test_different_queries_are_not_coalesced() -> None:
+    instances = FakeInstancesAPI(_pumps_handler, delay=0.01)
+    engine = generate_fake_engine(_VIEWS, instances, coalesce_requests=True)
+
+    asyncio.run(_query_concurrently(engine, ["a", "b", "a"]))
+
+    assert len(instances.queries) == 2
+
+
+def test_queries_are_not_coalesced_by_default() -> None:
+    instances = FakeInstancesAPI(_pumps_handler, delay=0.01)
+    engine = generate_fake_engine(_VIEWS, instances)
+
+    asyncio.run(_query_concurrently(engine, ["pump"] * 3))
+
+    assert len(instances.queries) == 3
+
+
+def test_sequential_queries_are_not_coalesced() -> None:
+    instances = FakeInstancesAPI(_pumps_handler)
+    engine = generate_fake_engine(_VIEWS, instances, coalesce_requests=True)
+
+    engine.query(select(TaggedPump))
+    engine.query(select(TaggedPump))
+
+    assert len(instances.queries) == 2
+
+
+def test_single_flight_propagates_errors_to_all_waiters() -> None:
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run() -> list[int | BaseException]:
+        return await asyncio.gather(
+            *(single_flight.run("key", fetch) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_single_flight_survives_cancelled_waiter() -> None:
+    single_flight = SingleFlight()
+
+    async def fetch() -> int:
+        await asyncio.sleep(0.02)
+        return 42
+
+    async def run() -> int:
+        owner = asyncio.create_task(single_flight.run("key", fetch))
+        waiter = asyncio.create_task(single_flight.run("key", fetch))
+        await asyncio.sleep(0)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        return await waiter
+
+    assert asyncio.run(run()) == 42
+
+
+def test_single_flight_cancels_call_without_waiters() -> None:
+    single_flight = SingleFlight()
+    finished = False
+
+    async def fetch() -> int:
+        nonlocal finished
+        await asyncio.sleep(0.05)
+        finished = True
+        return 42
+
+    async def run() -> None:
+        owner = asyncio.create_task(single_flight.run("key", fetch))
+        await asyncio.sleep(0)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+
+    assert not finished
+    assert single_flight._calls == {}
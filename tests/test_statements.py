@@ -1,5 +1,7 @@
 """Unit tests for statement building logic."""
 
+import pytest
+
 from industrial_model.models import ViewInstance
 from industrial_model.statements import (
     AggregationStatement,
@@ -117,6 +119,18 @@ def test_statement_without_relation_mode() -> None:
     assert values.relation_modes == {}
 
 
+def test_statement_only() -> None:
+    statement = select(SampleModel).only(SampleModel.name, "aliases")
+
+    assert statement.get_values().projection == ["name", "aliases"]
+    assert select(SampleModel).get_values().projection is None
+
+
+def test_statement_only_requires_properties() -> None:
+    with pytest.raises(ValueError, match="At least one property"):
+        select(SampleModel).only()
+
+
 def test_search_statement_creation() -> None:
     """Test creating a search statement."""
     statement = search(SampleModel)
@@ -361,3 +375,25 @@ def test_statement_fluent_chaining() -> None:
     assert len(values.sort_clauses) == 2
     assert values.limit == 50
     assert values.cursor == "cursor123"
+
+
+def test_statement_clone_does_not_share_values() -> None:
+    """Test cloning a statement copies its clauses."""
+    statement = select(SampleModel).where(col("name") == "test").limit(10)
+
+    cloned = statement.clone()
+    cloned.where(col("description") == "desc").limit(5)
+
+    assert cloned.entity is SampleModel
+    assert len(statement.get_values().where_clauses) == 1
+    assert statement.get_values().limit == 10
+    assert len(cloned.get_values().where_clauses) == 2
+    assert cloned.get_values().limit == 5
+
+
+def test_statement_repr_is_stable_for_sorted_statements() -> None:
+    first = select(SampleModel).asc(SampleModel.name).get_values()
+    second = select(SampleModel).asc(SampleModel.name).get_values()
+
+    assert repr(first) == repr(second)
+    assert "Column('name')" in repr(first)
@@ -0,0 +1,310 @@
+import datetime
+import pickle
+from typing import Any
+
+import pytest
+from pydantic import Field, ValidationError, field_validator, model_validator
+
+from industrial_model import InstanceId, PaginatedResult, ViewInstance
+from industrial_model.models import EdgeContainer, validate_instances
+from industrial_model.models.validation import _get_list_adapter
+
+
+class Equipment(ViewInstance):
+    name: str
+
+
+class Asset(ViewInstance):
+    name: str
+    equipments: list[Equipment] = []
+
+
+def _edge(external_id: str) -> EdgeContainer:
+    node_id = {"space": "space", "externalId": external_id}
+    return EdgeContainer.model_validate(
+        {
+            **node_id,
+            "type": node_id,
+            "startNode": node_id,
+            "endNode": node_id,
+            "lastUpdatedTime": 0,
+            "createdTime": 0,
+        }
+    )
+
+
+def _asset(external_id: str, name: Any) -> dict[str, Any]:
+    return {
+        "space": "space",
+        "externalId": external_id,
+        "name": name,
+        "equipments": [
+            {"space": "space", "externalId": "eq-1", "name": "eq", "_edges": {}}
+        ],
+        "_edges": {"equipments": [_edge(f"{external_id}-eq-1")]},
+    }
+
+
+def test_validate_instances_validates_page_and_includes_edges() -> None:
+    result = validate_instances(
+        Asset, [_asset("a-1", "first"), _asset("a-2", "second")], "raiseOnError"
+    )
+
+    assert [item.name for item in result] == ["first", "second"]
+    assert [item.get_edge_metadata("equipments")[0].external_id for item in result] == [
+        "a-1-eq-1",
+        "a-2-eq-1",
+    ]
+    assert result[0].equipments[0].name == "eq"
+
+
+def test_validate_instances_raises_on_invalid_item() -> None:
+    with pytest.raises(ValidationError):
+        validate_instances(
+            Asset, [_asset("a-1", "first"), _asset("a-2", None)], "raiseOnError"
+        )
+
+
+def test_validate_instances_skips_invalid_items_when_ignoring_errors() -> None:
+    result = validate_instances(
+        Asset,
+        [_asset("a-1", None), _asset("a-2", "second"), _asset("a-3", None)],
+        "ignoreOnError",
+    )
+
+    assert [item.external_id for item in result] == ["a-2"]
+    assert result[0].get_edge_metadata("equipments")[0].external_id == "a-2-eq-1"
+
+
+class Tag(ViewInstance):
+    name: str
+
+    @field_validator("name")
+    @classmethod
+    def _reject_reserved(cls, value: str) -> str:
+        if value == "reserved":
+            raise TypeError("reserved tag name")
+        return value
+
+
+def test_validate_instances_skips_items_failing_with_any_error() -> None:
+    data = [
+        {"space": "space", "externalId": "t-1", "name": "reserved"},
+        {"space": "space", "externalId": "t-2", "name": "tag"},
+    ]
+
+    with pytest.raises(TypeError, match="reserved"):
+        validate_instances(Tag, data, "raiseOnError")
+    result = validate_instances(Tag, data, "ignoreOnError")
+
+    assert [item.external_id for item in result] == ["t-2"]
+
+
+def test_list_adapter_is_built_once_per_model() -> None:
+    assert _get_list_adapter(Asset) is _get_list_adapter(Asset)
+
+
+class AssetType(ViewInstance):
+    code: str
+
+
+class Pump(ViewInstance):
+    name: str
+    installed_at: datetime.datetime | None = None
+    asset: InstanceId | Asset | None = None
+    asset_type: InstanceId | AssetType | None = None
+
+
+def _pump() -> dict[str, Any]:
+    return {
+        "space": "space",
+        "externalId": "pump",
+        "instanceType": "node",
+        "version": 3,
+        "name": "pump",
+        "installedAt": "2024-05-01T10:00:00.000+00:00",
+        "asset": _asset("a-1", "asset") | {"instanceType": "node"},
+        "assetType": {"space": "space", "externalId": "type-1"},
+        "_edges": {},
+    }
+
+
+def test_trusted_validation_constructs_nested_models() -> None:
+    (pump,) = validate_instances(Pump, [_pump()], "trusted")
+
+    assert isinstance(pump, Pump)
+    assert pump.installed_at == datetime.datetime(2024, 5, 1, 10, tzinfo=datetime.UTC)
+    assert isinstance(pump.asset, Asset)
+    assert isinstance(pump.asset.equipments[0], Equipment)
+    assert pump.asset.get_edge_metadata("equipments")[0].external_id == "a-1-eq-1"
+    assert type(pump.asset_type) is InstanceId
+    assert pump.model_fields_set == {
+        "external_id",
+        "space",
+        "name",
+        "installed_at",
+        "asset",
+        "asset_type",
+    }
+
+
+def test_trusted_validation_matches_validated_models() -> None:
+    data = [_pump()]
+
+    trusted = validate_instances(Pump, data, "trusted")
+    validated = validate_instances(Pump, data, "raiseOnError")
+
+    assert [item.model_dump() for item in trusted] == [
+        item.model_dump() for item in validated
+    ]
+
+
+def test_lazy_validation_defers_relations_until_accessed() -> None:
+    data = _asset("a-1", "first")
+    data["equipments"][0]["name"] = None
+
+    (asset,) = validate_instances(Asset, [data], "lazy")
+
+    assert asset.name == "first"
+    assert "equipments" in asset.model_fields_set
+    assert "equipments" not in asset.__dict__
+    with pytest.raises(ValidationError):
+        _ = asset.equipments
+    assert data["equipments"][0]["name"] is None
+
+
+def test_lazy_validation_resolves_relations_once_with_edges() -> None:
+    (pump,) = validate_instances(Pump, [_pump()], "lazy")
+
+    asset = pump.asset
+    assert isinstance(asset, Asset)
+    assert pump.asset is asset
+    assert asset.get_edge_metadata("equipments")[0].external_id == "a-1-eq-1"
+
+
+def test_lazy_validation_dumps_like_validated_models() -> None:
+    data = [_pump()]
+
+    lazy = validate_instances(Pump, data, "lazy")
+    validated = validate_instances(Pump, data, "raiseOnError")
+
+    assert lazy[0].model_dump_json() == validated[0].model_dump_json()
+    assert PaginatedResult[Pump](
+        data=validate_instances(Pump, data, "lazy"),
+        has_next_page=False,
+        next_cursor=None,
+    ).model_dump()["data"] == [item.model_dump() for item in validated]
+    assert [item.model_dump() for item in lazy] == [
+        item.model_dump() for item in validated
+    ]
+
+
+def test_lazy_validation_keeps_serialization_schema() -> None:
+    schema = Pump.model_json_schema(mode="serialization")
+
+    assert schema == Pump.model_json_schema(mode="validation")
+    assert set(schema["properties"]) == {
+        "externalId",
+        "space",
+        "name",
+        "installedAt",
+        "asset",
+        "assetType",
+    }
+
+
+def test_lazy_validation_copies_do_not_share_pending_relations() -> None:
+    (pump,) = validate_instances(Pump, [_pump()], "lazy")
+
+    shallow = pump.model_copy()
+    deep = pump.model_copy(deep=True)
+    assert isinstance(shallow.asset, Asset)
+    assert isinstance(deep.asset, Asset)
+
+    assert isinstance(pump.asset, Asset)
+    assert pump.asset is not deep.asset
+
+
+class Sensor(ViewInstance):
+    code: str = Field(max_length=3)
+    unit: str
+    description: str | None = None
+
+    @field_validator("code", mode="before")
+    @classmethod
+    def _upper_code(cls, value: Any) -> Any:
+        return value.upper() if isinstance(value, str) else value
+
+    @model_validator(mode="after")
+    def _check_unit(self) -> "Sensor":
+        if self.code == "BAD" and not self.unit:
+            raise TypeError("BAD sensors need a unit")
+        return self
+
+
+def _sensor(external_id: str, code: str) -> dict[str, Any]:
+    return {"space": "space", "externalId": external_id, "code": code, "_edges": {}}
+
+
+def test_partial_validation_applies_field_constraints_and_validators() -> None:
+    (sensor,) = validate_instances(
+        Sensor, [_sensor("s-1", "ab")], "raiseOnError", partial=True
+    )
+
+    assert sensor.code == "AB"
+    assert sensor.description is None
+    assert sensor.model_fields_set == {"external_id", "space", "code"}
+    with pytest.raises(AttributeError):
+        _ = sensor.unit
+
+    with pytest.raises(ValidationError, match="at most 3 characters"):
+        validate_instances(
+            Sensor, [_sensor("s-2", "toolong")], "raiseOnError", partial=True
+        )
+    result = validate_instances(
+        Sensor,
+        [_sensor("s-2", "toolong"), _sensor("s-3", "xyz")],
+        "ignoreOnError",
+        partial=True,
+    )
+    assert [item.code for item in result] == ["XYZ"]
+
+
+def test_partial_validation_runs_model_validators_once_per_row() -> None:
+    rows = [_sensor("s-1", "bad"), _sensor("s-2", "ok")]
+
+    with pytest.raises(TypeError, match="need a unit"):
+        validate_instances(Sensor, rows, "raiseOnError", partial=True)
+    result = validate_instances(Sensor, rows, "ignoreOnError", partial=True)
+
+    assert [type(item) for item in result] == [Sensor]
+    assert result[0].code == "OK"
+
+
+def test_partial_validation_rejects_lazy_mode() -> None:
+    with pytest.raises(ValueError, match="cannot be combined with only"):
+        validate_instances(Sensor, [_sensor("s-1", "ab")], "lazy", partial=True)
+
+
+def test_lazy_validation_keeps_assigned_relations() -> None:
+    (pump,) = validate_instances(Pump, [_pump()], "lazy")
+    pump.take_snapshot()
+
+    pump.asset = None
+    updated = pump.model_copy(update={"asset_type": None})
+
+    assert pump.model_dump()["asset"] is None
+    assert pump.asset is None
+    assert pump.get_changed_fields() == {"asset"}
+    assert updated.model_dump()["asset_type"] is None
+    assert updated.asset_type is None
+
+
+def test_lazy_validation_instances_can_be_pickled() -> None:
+    (pump,) = validate_instances(Pump, [_pump()], "lazy")
+    (validated,) = validate_instances(Pump, [_pump()], "raiseOnError")
+
+    restored = pickle.loads(pickle.dumps(pump))
+
+    assert restored.model_dump() == validated.model_dump()
+    assert isinstance(restored.asset, Asset)
@@ -0,0 +1,188 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import cast
+
+import pytest
+from cognite.client import AsyncCogniteClient
+from cognite.client.data_classes.data_modeling import (
+    DataModel,
+    DataModelList,
+    View,
+)
+
+from industrial_model import ViewCache, ViewInstance
+from industrial_model.cognite_adapters.view_mapper import ViewMapper
+
+from .fakes import DATA_MODEL_ID, mapped_property, view
+
+
+class Pump(ViewInstance):
+    name: str
+
+
+class FakeDataModelsAPI:
+    def __init__(self, views: list[View]) -> None:
+        self.views = views
+        self.calls = 0
+
+    async def retrieve(
+        self, ids: tuple[str, str, str], inline_views: bool
+    ) -> DataModelList[View]:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return DataModelList(
+            [
+                DataModel(
+                    space=ids[0],
+                    external_id=ids[1],
+                    version=ids[2],
+                    is_global=False,
+                    last_updated_time=0,
+                    created_time=0,
+                    description=None,
+                    name=None,
+                    views=list(self.views),
+                )
+            ]
+        )
+
+
+class FakeDataModeling:
+    def __init__(self, data_models: FakeDataModelsAPI) -> None:
+        self.data_models = data_models
+
+
+class FakeClient:
+    def __init__(self, data_models: FakeDataModelsAPI) -> None:
+        self.data_modeling = FakeDataModeling(data_models)
+
+
+def _pump_view(*properties: str) -> View:
+    return view(Pump, {item: mapped_property(item) for item in properties})
+
+
+def _view_mapper(data_models: FakeDataModelsAPI, cache: ViewCache) -> ViewMapper:
+    return ViewMapper(
+        cast(AsyncCogniteClient, FakeClient(data_models)), DATA_MODEL_ID, cache
+    )
+
+
+def test_view_cache_round_trips_views(tmp_path: Path) -> None:
+    cache = ViewCache(tmp_path)
+    pump_view = _pump_view("name")
+
+    assert cache.read(DATA_MODEL_ID) is None
+    cache.write(DATA_MODEL_ID, [pump_view])
+
+    assert cache.read(DATA_MODEL_ID) == ([pump_view], True)
+    assert ViewCache(tmp_path, ttl=0).read(DATA_MODEL_ID) == ([pump_view], False)
+
+
+def test_view_cache_ignores_invalid_content(tmp_path: Path) -> None:
+    cache = ViewCache(tmp_path)
+    cache.write(DATA_MODEL_ID, [_pump_view("name")])
+    (path,) = tmp_path.iterdir()
+    path.write_text(json.dumps({"key": ["other"]}))
+
+    assert cache.read(DATA_MODEL_ID) is None
+
+
+def test_view_mapper_loads_fresh_cache_without_retrieving(tmp_path: Path) -> None:
+    data_models = FakeDataModelsAPI([_pump_view("name")])
+    asyncio.run(_view_mapper(data_models, ViewCache(tmp_path)).load_views())
+
+    view_mapper = _view_mapper(data_models, ViewCache(tmp_path))
+    asyncio.run(view_mapper.load_views())
+
+    assert data_models.calls == 1
+    assert "name" in view_mapper.get_view("Pump").properties
+
+
+def test_view_mapper_revalidates_stale_cache_in_background(tmp_path: Path) -> None:
+    ViewCache(tmp_path).write(DATA_MODEL_ID, [_pump_view("name")])
+    data_models = FakeDataModelsAPI([_pump_view("name", "status")])
+    view_mapper = _view_mapper(data_models, ViewCache(tmp_path, ttl=0))
+
+    async def run() -> list[str]:
+        await view_mapper.load_views()
+        cached_properties = list(view_mapper.get_view("Pump").properties)
+        assert view_mapper._revalidation is not None
+        await view_mapper._revalidation
+        return cached_properties
+
+    assert asyncio.run(run()) == ["name"]
+    assert list(view_mapper.get_view("Pump").properties) == ["name", "status"]
+    assert data_models.calls == 1
+    cached = ViewCache(tmp_path).read(DATA_MODEL_ID)
+    assert cached is not None
+    assert list(cached[0][0].properties) == ["name", "status"]
+
+
+def test_view_mapper_loads_views_when_cache_is_not_writable(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache"
+    cache_path.write_text("not a directory")
+    data_models = FakeDataModelsAPI([_pump_view("name")])
+    view_mapper = _view_mapper(data_models, ViewCache(cache_path))
+
+    asyncio.run(view_mapper.load_views())
+
+    assert data_models.calls == 1
+    assert "name" in view_mapper.get_view("Pump").properties
+    assert ViewCache(cache_path).read(DATA_MODEL_ID) is None
+
+
+def test_view_mapper_revalidates_when_cache_write_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ViewCache(tmp_path).write(DATA_MODEL_ID, [_pump_view("name")])
+    data_models = FakeDataModelsAPI([_pump_view("name", "status")])
+    view_mapper = _view_mapper(data_models, ViewCache(tmp_path, ttl=0))
+
+    def replace(*_: object) -> None:
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(os, "replace", replace)
+
+    async def run() -> None:
+        await view_mapper.load_views()
+        assert view_mapper._revalidation is not None
+        await view_mapper._revalidation
+
+    asyncio.run(run())
+
+    assert list(view_mapper.get_view("Pump").properties) == ["name", "status"]
+    assert [path.suffix for path in tmp_path.iterdir()] == [".json"]
+
+
+class FailingDataModelsAPI(FakeDataModelsAPI):
+    async def retrieve(
+        self, ids: tuple[str, str, str], inline_views: bool
+    ) -> DataModelList[View]:
+        self.calls += 1
+        raise ConnectionError("CDF unavailable")
+
+
+def test_view_mapper_backs_off_after_failed_revalidation(tmp_path: Path) -> None:
+    ViewCache(tmp_path).write(DATA_MODEL_ID, [_pump_view("name")])
+    data_models = FailingDataModelsAPI([])
+    view_mapper = _view_mapper(data_models, ViewCache(tmp_path, ttl=0))
+
+    async def load() -> None:
+        await view_mapper.load_views()
+        if view_mapper._revalidation is not None:
+            await view_mapper._revalidation
+
+    async def run() -> None:
+        for _ in range(3):
+            await load()
+        assert data_models.calls == 1
+
+        view_mapper._revalidation_retry_at = 0
+        await load()
+
+    asyncio.run(run())
+
+    assert data_models.calls == 2
+    assert list(view_mapper.get_view("Pump").properties) == ["name"]
@@ -0,0 +1,85 @@
+from typing import cast
+
+from cognite.client import AsyncCogniteClient
+from cognite.client.data_classes.data_modeling import (
+    DirectRelationReference,
+    ViewId,
+)
+from cognite.client.data_classes.data_modeling.data_types import Text
+from cognite.client.data_classes.data_modeling.views import ViewProperty
+
+from industrial_model import ViewInstance
+from industrial_model.cognite_adapters.models import ViewPropertyKind
+from industrial_model.cognite_adapters.view_mapper import ViewMapper
+
+from .fakes import DATA_MODEL_ID, mapped_property, view, view_id
+
+
+class Asset(ViewInstance):
+    name: str
+
+
+_SOURCE = {"space": "space", "externalId": "Asset", "version": "v1", "type": "view"}
+
+
+def _view_mapper() -> ViewMapper:
+    return ViewMapper(cast(AsyncCogniteClient, None), DATA_MODEL_ID)
+
+
+def _asset_view() -> dict[str, ViewProperty]:
+    return {
+        "name": mapped_property("name"),
+        "tags": mapped_property("tags", Text(is_list=True)),
+        "parent": mapped_property("parent", source=view_id(Asset)),
+        "children": ViewProperty.load(
+            {
+                "connectionType": "multi_reverse_direct_relation",
+                "source": _SOURCE,
+                "through": {"source": _SOURCE, "identifier": "parent"},
+            }
+        ),
+        "links": ViewProperty.load(
+            {
+                "connectionType": "multi_edge_connection",
+                "type": {"space": "space", "externalId": "links"},
+                "source": _SOURCE,
+                "direction": "inwards",
+            }
+        ),
+    }
+
+
+def test_view_properties_index_property_kinds() -> None:
+    properties = _view_mapper().get_view_properties(view(Asset, _asset_view()))
+
+    assert {name: item.kind for name, item in properties.items()} == {
+        "name": ViewPropertyKind.PROPERTY,
+        "tags": ViewPropertyKind.PROPERTY,
+        "parent": ViewPropertyKind.DIRECT_RELATION,
+        "children": ViewPropertyKind.REVERSE_DIRECT_RELATION,
+        "links": ViewPropertyKind.EDGE,
+    }
+    assert properties["tags"].is_list
+    assert not properties["parent"].is_list
+    assert properties["parent"].source == ViewId("space", "Asset", "v1")
+    assert properties["children"].through_property == "parent"
+    assert properties["children"].is_list
+    assert properties["links"].edge_type == DirectRelationReference("space", "links")
+    assert properties["links"].edge_direction == "inwards"
+    assert [name for name, item in properties.items() if item.is_mapped] == [
+        "name",
+        "tags",
+        "parent",
+    ]
+
+
+def test_view_properties_are_indexed_once_per_loaded_views() -> None:
+    view_mapper = _view_mapper()
+    asset_view = view(Asset, _asset_view())
+    view_mapper._set_views([asset_view])
+
+    properties = view_mapper.get_view_properties(asset_view)
+    assert view_mapper.get_view_properties(asset_view) is properties
+
+    view_mapper._set_views([asset_view])
+    assert view_mapper.get_view_properties(asset_view) is not properties